@@ -1,17 +1,22 @@
+import base64
 import datetime
 import logging
+import struct
+import zlib
 from collections import namedtuple
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, MutableMapping, Optional, Union
+from typing import Final, List, MutableMapping, Optional, Sequence, Union, overload
 
 import discord
 import lavalink
 
+from lavalink.rest_api import LoadResult, parse_timestamps
 from redbot.core.bot import Red
 from redbot.core.i18n import Translator
 from redbot.core.utils.chat_formatting import humanize_list
 
+from ..audio_dataclasses import _TRACK_INFO_KEYS
 from ..errors import InvalidPlaylistScope, MissingAuthor, MissingGuild
 from ..utils import PlaylistScope
 
@@ -23,6 +28,94 @@ except ImportError:
 log = logging.getLogger("red.cogs.Audio.api.utils")
 _ = Translator("Audio", Path(__file__))
 
+_TRACK_ENCODING_VERSION: Final[int] = 1
+_TRACK_HEADER: Final[struct.Struct] = struct.Struct("!BI")
+_TRACK_LENGTH: Final[struct.Struct] = struct.Struct("!I")
+
+
+def encode_track(track: MutableMapping) -> bytes:
+    """Encode a track dict into its compact binary form.
+
+    The base64 Lavalink track is stored as raw bytes, followed by the info values
+    in a fixed order so the keys don't have to be stored for every track.
+    """
+    raw = base64.b64decode(track["track"]) if track.get("track") else b""
+    info = track.get("info") or {}
+    other = {k: v for k, v in info.items() if k not in _TRACK_INFO_KEYS}
+    side = [info.get(k) for k in _TRACK_INFO_KEYS]
+    side.append(other or None)
+    side.append(track.get("extras"))
+    return (
+        _TRACK_HEADER.pack(_TRACK_ENCODING_VERSION, len(raw))
+        + raw
+        + json.dumps(side).encode("utf-8")
+    )
+
+
+def decode_track(data: Union[str, bytes]) -> MutableMapping:
+    """Decode a track encoded with :func:`encode_track` or stored as JSON."""
+    if isinstance(data, str):
+        return json.loads(data)
+    data = bytes(data)
+    __, length = _TRACK_HEADER.unpack_from(data)
+    offset = _TRACK_HEADER.size
+    raw = data[offset : offset + length]
+    side = json.loads(data[offset + length :])
+    info = dict(zip(_TRACK_INFO_KEYS, side))
+    other, extras = side[len(_TRACK_INFO_KEYS) :]
+    if other:
+        info.update(other)
+    track = {"track": base64.b64encode(raw).decode("ascii") if raw else None}
+    track["info"] = info
+    if extras is not None:
+        track["extras"] = extras
+    return track
+
+
+def decode_track_identifier(data: Union[str, bytes]) -> Optional[str]:
+    """Get the Lavalink track of an encoded track without decoding the rest of it."""
+    if isinstance(data, str):
+        return json.loads(data).get("track")
+    data = bytes(data)
+    __, length = _TRACK_HEADER.unpack_from(data)
+    raw = data[_TRACK_HEADER.size : _TRACK_HEADER.size + length]
+    return base64.b64encode(raw).decode("ascii") if raw else None
+
+
+def track_duration(track: MutableMapping) -> int:
+    """Get the length of a track in milliseconds, streams count as 0."""
+    info = track.get("info") or {}
+    if info.get("isStream"):
+        return 0
+    return int(info.get("length") or 0)
+
+
+def encode_tracks(tracks: List[MutableMapping]) -> bytes:
+    """Encode a list of tracks into a single compressed blob."""
+    chunks = []
+    for track in tracks:
+        encoded = encode_track(track)
+        chunks.append(_TRACK_LENGTH.pack(len(encoded)))
+        chunks.append(encoded)
+    return zlib.compress(b"".join(chunks))
+
+
+def decode_tracks(data: Union[str, bytes, None]) -> List[MutableMapping]:
+    """Decode a list of tracks encoded with :func:`encode_tracks` or stored as JSON."""
+    if not data:
+        return []
+    if isinstance(data, str):
+        return json.loads(data)
+    data = zlib.decompress(data)
+    tracks = []
+    offset = 0
+    while offset < len(data):
+        (length,) = _TRACK_LENGTH.unpack_from(data, offset)
+        offset += _TRACK_LENGTH.size
+        tracks.append(decode_track(data[offset : offset + length]))
+        offset += length
+    return tracks
+
 
 @dataclass
 class YouTubeCacheFetchResult:
@@ -81,25 +174,80 @@ class PlaylistFetchResult:
     scope_id: int
     author_id: int
     playlist_url: Optional[str] = None
-    tracks: List[MutableMapping] = field(default_factory=lambda: [])
-
-    def __post_init__(self):
-        if isinstance(self.tracks, str):
-            self.tracks = json.loads(self.tracks)
+    track_count: int = 0
+    duration: int = 0
 
 
 @dataclass
 class QueueFetchResult:
     guild_id: int
     room_id: int
-    track: dict = field(default_factory=lambda: {})
-    track_object: lavalink.Track = None
-
-    def __post_init__(self):
-        if isinstance(self.track, str):
-            self.track = json.loads(self.track)
-        if self.track:
-            self.track_object = lavalink.Track(self.track)
+    track_data: Union[str, bytes, None] = field(default=None, repr=False)
+    _track_object: Optional[lavalink.Track] = field(
+        default=None, init=False, repr=False
+    )
+
+    @property
+    def track(self) -> MutableMapping:
+        return decode_track(self.track_data) if self.track_data else {}
+
+    @property
+    def track_object(self) -> Optional[lavalink.Track]:
+        """The queued track, decoded on first access."""
+        if self._track_object is None and self.track_data:
+            self._track_object = lavalink.Track(self.track)
+        return self._track_object
+
+
+class LazyTracks(Sequence[lavalink.Track]):
+    """The tracks of a load result, each Track is only built when first accessed."""
+
+    __slots__ = ("_data", "_tracks")
+
+    def __init__(self, data: List[MutableMapping]):
+        self._data = data
+        self._tracks: List[Optional[lavalink.Track]] = [None] * len(data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self):
+        return f"<LazyTracks tracks={len(self)}>"
+
+    @overload
+    def __getitem__(self, index: int) -> lavalink.Track:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[lavalink.Track]:
+        ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        track = self._tracks[index]
+        if track is None:
+            track = self._tracks[index] = lavalink.Track(self._data[index])
+        return track
+
+
+class LazyLoadResult(LoadResult):
+    """A :class:`LoadResult` for cached payloads, only building the Tracks used.
+
+    Cached playlists can hold hundreds of tracks while most callers only look
+    at the first one or pick a random one.
+    """
+
+    def __init__(self, data: MutableMapping):
+        super().__init__({**data, "tracks": []})
+        # The parent added the missing keys to the copy, only the tracks are put back.
+        self._raw["tracks"] = data.get("tracks", [])
+        tracks = (
+            parse_timestamps(self._raw)
+            if self._raw.get("query")
+            else self._raw["tracks"]
+        )
+        self.tracks = LazyTracks(tracks)
 
 
 def standardize_scope(scope: str) -> str:
@@ -0,0 +1,129 @@
+import asyncio
+import datetime
+import logging
+import time
+from pathlib import Path
+
+from typing import Final, List, Mapping, MutableMapping, Optional, Tuple
+
+from redbot.core.bot import Red
+from redbot.core.i18n import Translator
+
+from ..audio_logging import debug_exc_log
+from ..utils import PlaylistScope, task_callback
+from .playlist_wrapper import PlaylistWrapper
+
+log = logging.getLogger("red.cogs.Audio.api.DailyPlaylists")
+_ = Translator("Audio", Path(__file__))
+_FLUSH_INTERVAL: Final[int] = 30
+_DAYS_KEPT: Final[int] = 8
+_NAME_PREFIXES: Final[Mapping[str, str]] = {
+    PlaylistScope.GLOBAL.value: "Global Daily playlist - ",
+    PlaylistScope.GUILD.value: "Daily playlist - ",
+}
+
+_PlaylistKey = Tuple[str, int, datetime.date]
+
+
+def daily_playlist_id(day: datetime.date) -> int:
+    """The ID of the daily playlists of the provided day."""
+    return int(time.mktime(day.timetuple()))
+
+
+class DailyPlaylistRecorder:
+    """Records the tracks played into the daily playlists.
+
+    Played tracks are buffered in memory and appended to their playlist in batches,
+    and old daily playlists are pruned once a day.
+    """
+
+    def __init__(self, bot: Red, playlist_api: PlaylistWrapper):
+        self.bot = bot
+        self.playlist_api = playlist_api
+        self._pending: MutableMapping[_PlaylistKey, List[MutableMapping]] = {}
+        self._flush_lock: asyncio.Lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._prune_task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+            self._flush_task.add_done_callback(task_callback)
+        if self._prune_task is None:
+            self._prune_task = asyncio.create_task(self._prune_loop())
+            self._prune_task.add_done_callback(task_callback)
+
+    async def close(self) -> None:
+        """Stop the background tasks and save the tracks still buffered."""
+        if self._prune_task is not None:
+            self._prune_task.cancel()
+        if self._flush_task is not None:
+            # A flush in progress holds the lock, it finishes before the task stops
+            async with self._flush_lock:
+                self._flush_task.cancel()
+        self._flush_task = self._prune_task = None
+        await self.flush()
+
+    def record(
+        self, scope: str, scope_id: int, day: datetime.date, track: MutableMapping
+    ) -> None:
+        """Add a track to a daily playlist, it is saved on the next flush."""
+        self._pending.setdefault((scope, int(scope_id), day), []).append(track)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(_FLUSH_INTERVAL)
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Append all buffered tracks to their daily playlist."""
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+            for (scope, scope_id, day), tracks in pending.items():
+                playlist_id = daily_playlist_id(day)
+                name = f"{_NAME_PREFIXES[scope]}{day}"
+                try:
+                    await self.playlist_api.upsert(
+                        scope,
+                        playlist_id=playlist_id,
+                        playlist_name=name,
+                        scope_id=scope_id,
+                        author_id=self.bot.user.id,
+                        playlist_url=None,
+                    )
+                    await self.playlist_api.append_tracks(
+                        scope, playlist_id=playlist_id, scope_id=scope_id, tracks=tracks
+                    )
+                except Exception as exc:
+                    debug_exc_log(
+                        log, exc, f"Failed to save daily playlist ID: {playlist_id}"
+                    )
+
+    async def _prune_loop(self) -> None:
+        while True:
+            await self.prune()
+            now = datetime.datetime.now()
+            tomorrow = datetime.datetime.combine(
+                now.date() + datetime.timedelta(days=1), datetime.time.min
+            )
+            await asyncio.sleep((tomorrow - now).total_seconds() + 60)
+
+    async def prune(self) -> None:
+        """Delete the daily playlists older than the days kept."""
+        too_old_id = daily_playlist_id(
+            datetime.date.today() - datetime.timedelta(days=_DAYS_KEPT)
+        )
+        for scope, name_prefix in _NAME_PREFIXES.items():
+            try:
+                await self.playlist_api.delete_daily(
+                    scope,
+                    author_id=self.bot.user.id,
+                    playlist_id=too_old_id,
+                    name_prefix=name_prefix,
+                )
+            except Exception as exc:
+                debug_exc_log(
+                    log, exc, f"Failed to delete daily playlists up to ID: {too_old_id}"
+                )
@@ -13,6 +13,7 @@ from typing import (
     List,
     MutableMapping,
     Optional,
+    Sequence,
     Tuple,
     Union,
     cast,
@@ -31,7 +32,7 @@ from redbot.core.i18n import Translator
 from redbot.core.utils import AsyncIter
 from redbot.core.utils.dbtools import APSWConnectionWrapper
 
-from ..audio_dataclasses import Query
+from ..audio_dataclasses import Query, QueueEntry
 from ..audio_logging import IS_DEBUG, debug_exc_log
 from ..errors import (
     DatabaseError,
@@ -40,10 +41,11 @@ from ..errors import (
     TrackEnqueueError,
     YouTubeApiError,
 )
-from ..utils import CacheLevel, Notifier
-from .api_utils import LavalinkCacheFetchForGlobalResult
+from ..utils import CacheLevel, Notifier, task_callback
+from .api_utils import LavalinkCacheFetchForGlobalResult, LazyLoadResult
 from .global_db import GlobalCacheWrapper
 from .local_db import LocalCacheWrapper
+from .local_tracks import LocalTrackCache
 from .persist_queue_wrapper import QueueInterface
 from .playlist_interface import get_playlist
 from .playlist_wrapper import PlaylistWrapper
@@ -61,6 +63,8 @@ except ImportError:
 _ = Translator("Audio", Path(__file__))
 log = logging.getLogger("red.cogs.Audio.api.AudioAPIInterface")
 _TOP_100_US = "https://www.youtube.com/playlist?list=PL4fGSI1pDJn5rWitrRWFKdm-ulaFiIyoK"
+_LOCAL_TRACK_CONCURRENCY = 10
+_AUTOPLAY_POOL_SIZE = 5
 # TODO: Get random from global Cache
 
 
@@ -97,9 +101,14 @@ class AudioAPIInterface:
         self.persistent_queue_api = QueueInterface(
             self.bot, self.config, self.conn, self.cog
         )
+        self.local_track_cache = LocalTrackCache()
         self._session: aiohttp.ClientSession = session
         self._tasks: MutableMapping = {}
         self._lock: asyncio.Lock = asyncio.Lock()
+        self._autoplay_pools: MutableMapping[
+            int, Tuple[Optional[Tuple], List[lavalink.Track]]
+        ] = {}
+        self._autoplay_tasks: MutableMapping[int, asyncio.Task] = {}
 
     async def initialize(self) -> None:
         """Initialises the Local Cache connection."""
@@ -108,8 +117,19 @@ class AudioAPIInterface:
 
     def close(self) -> None:
         """Closes the Local Cache connection."""
+        for task in self._autoplay_tasks.values():
+            task.cancel()
+        self._autoplay_tasks.clear()
+        self.persistent_queue_api.close()
         self.local_cache_api.lavalink.close()
 
+    def clear_autoplay(self, guild_id: int) -> None:
+        """Forget the guild's autoplay pool, once its player's queue was torn down."""
+        task = self._autoplay_tasks.pop(guild_id, None)
+        if task is not None:
+            task.cancel()
+        self._autoplay_pools.pop(guild_id, None)
+
     async def get_random_track_from_db(self, tries=0) -> Optional[MutableMapping]:
         """Get a random track from the local database and return it."""
         track: Optional[MutableMapping] = {}
@@ -130,8 +150,8 @@ class AudioAPIInterface:
             if track is not None:
                 if track.get("loadType") == "V2_COMPACT":
                     track["loadType"] = "V2_COMPAT"
-                results = LoadResult(track)
-                track = random.choice(list(results.tracks))
+                results = LazyLoadResult(track)
+                track = random.choice(results.tracks)
                 assert isinstance(track, Track)
                 query = Query.process_input(
                     track.uri, self.cog.local_folder_current_path
@@ -232,6 +252,7 @@ class AudioAPIInterface:
             else:
                 if IS_DEBUG:
                     log.debug("Completed pending writes to database have finished")
+        await self.persistent_queue_api.flush()
 
     def append_task(
         self, ctx: commands.Context, event: str, task: Tuple, _id: int = None
@@ -523,7 +544,7 @@ class AudioAPIInterface:
         youtube_api_error = None
         try:
             current_cache_level = CacheLevel(await self.config.cache_level())
-            guild_data = await self.config.guild(ctx.guild).all()
+            settings = self.cog.guild_settings.get(ctx.guild)
             enqueued_tracks = 0
             consecutive_fails = 0
             queue_dur = await self.cog.queue_duration(ctx)
@@ -594,7 +615,7 @@ class AudioAPIInterface:
                     if llresponse:
                         if llresponse.get("loadType") == "V2_COMPACT":
                             llresponse["loadType"] = "V2_COMPAT"
-                        llresponse = LoadResult(llresponse)
+                        llresponse = LazyLoadResult(llresponse)
                     val = llresponse or None
                 if val is None:
                     try:
@@ -618,7 +639,7 @@ class AudioAPIInterface:
                             if llresponse:
                                 if llresponse.get("loadType") == "V2_COMPACT":
                                     llresponse["loadType"] = "V2_COMPAT"
-                                llresponse = LoadResult(llresponse)
+                                llresponse = LazyLoadResult(llresponse)
                             result = llresponse or None
                         if not result:
                             try:
@@ -708,9 +729,9 @@ class AudioAPIInterface:
                 if enqueue:
                     if len(player.queue) >= 10000:
                         continue
-                    if guild_data["maxlength"] > 0:
+                    if settings.maxlength > 0:
                         if self.cog.is_track_length_allowed(
-                            single_track, guild_data["maxlength"]
+                            single_track, settings.maxlength
                         ):
                             enqueued_tracks += 1
                             single_track.extras.update(
@@ -720,7 +741,8 @@ class AudioAPIInterface:
                                     "requester": ctx.author.id,
                                 }
                             )
-                            player.add(ctx.author, single_track)
+                            queue_entry = QueueEntry.from_track(single_track)
+                            player.add(ctx.author, queue_entry)
                             self.bot.dispatch(
                                 "red_audio_track_enqueue",
                                 player.channel.guild,
@@ -736,7 +758,8 @@ class AudioAPIInterface:
                                 "requester": ctx.author.id,
                             }
                         )
-                        player.add(ctx.author, single_track)
+                        queue_entry = QueueEntry.from_track(single_track)
+                        player.add(ctx.author, queue_entry)
                         self.bot.dispatch(
                             "red_audio_track_enqueue",
                             player.channel.guild,
@@ -761,7 +784,7 @@ class AudioAPIInterface:
                         "Added {num} tracks to the queue.{maxlength_msg}"
                     ).format(num=enqueued_tracks, maxlength_msg=maxlength_msg),
                 )
-                if not guild_data["shuffle"] and queue_dur > 0:
+                if not settings.shuffle and queue_dur > 0:
                     embed.set_footer(
                         text=_(
                             "{time} until start of playlist"
@@ -934,7 +957,7 @@ class AudioAPIInterface:
                 global_entry = await self.global_cache_api.get_call(query=query)
                 if global_entry.get("loadType") == "V2_COMPACT":
                     global_entry["loadType"] = "V2_COMPAT"
-                results = LoadResult(global_entry)
+                results = LazyLoadResult(global_entry)
                 if results.load_type in [
                     LoadType.PLAYLIST_LOADED,
                     LoadType.TRACK_LOADED,
@@ -955,7 +978,7 @@ class AudioAPIInterface:
             data["query"] = query_string
             if data.get("loadType") == "V2_COMPACT":
                 data["loadType"] = "V2_COMPAT"
-            results = LoadResult(data)
+            results = LazyLoadResult(data)
             called_api = False
             if results.has_error:
                 # If cached value has an invalid entry make a new call so that it gets updated
@@ -1029,9 +1052,75 @@ class AudioAPIInterface:
                 )
         return results, called_api
 
-    async def autoplay(self, player: lavalink.Player, playlist_api: PlaylistWrapper):
-        """Enqueue a random track."""
-        autoplaylist = await self.config.guild(player.channel.guild).autoplaylist()
+    async def fetch_local_tracks(
+        self,
+        ctx: commands.Context,
+        player: lavalink.Player,
+        queries: List[Query],
+        notifier: Optional[Notifier] = None,
+        concurrency: int = _LOCAL_TRACK_CONCURRENCY,
+    ) -> List[lavalink.Track]:
+        """Load many local files at once, keeping the order of the provided queries.
+
+        Files which have not changed since they were last loaded are served from the
+        local track cache, everything else is loaded from Lavalink with at most
+        `concurrency` requests in flight at any given time.
+
+        Parameters
+        ----------
+        ctx: commands.Context
+            The context this method is being called under.
+        player : lavalink.Player
+            The player who's requesting the queries.
+        queries: List[audio_dataclasses.Query]
+            The local track queries to load.
+        notifier: Notifier
+            A Notifier object to handle the user UI notifications while tracks are loaded.
+        concurrency: int
+            How many Lavalink requests can be made at the same time.
+
+        Returns
+        -------
+        List[lavalink.Track]
+            The loaded tracks, files which failed to load are skipped.
+        """
+        total_tracks = len(queries)
+        loaded = 0
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def _load(query: Query) -> Optional[lavalink.Track]:
+            nonlocal loaded
+            key = None
+            if query.local_track_path is not None:
+                key = self.local_track_cache.get_key(query.local_track_path)
+            track = self.local_track_cache.get(key)
+            if track is None:
+                async with semaphore:
+                    with contextlib.suppress(IndexError, TrackEnqueueError):
+                        (result, called_api) = await self.fetch_track(
+                            ctx, player, query
+                        )
+                        track = result.tracks[0]
+                        self.local_track_cache.put(key, track)
+            loaded += 1
+            if notifier is not None and (
+                (loaded % 10 == 0) or (loaded == total_tracks)
+            ):
+                await notifier.notify_user(
+                    current=loaded, total=total_tracks, key="lavalink"
+                )
+            return track
+
+        results = await asyncio.gather(*[_load(query) for query in queries])
+        return [track for track in results if track is not None]
+
+    async def _autoplay_candidates(
+        self,
+        player: lavalink.Player,
+        playlist_api: PlaylistWrapper,
+        autoplaylist: MutableMapping,
+    ) -> Sequence[lavalink.Track]:
+        """Get the tracks autoplay picks from."""
         current_cache_level = CacheLevel(await self.config.cache_level())
         cache_enabled = CacheLevel.set_lavalink().is_subset(current_cache_level)
         playlist = None
@@ -1046,6 +1135,7 @@ class AudioAPIInterface:
                     player.channel.guild,
                     player.channel.guild.me,
                 )
+                await playlist.load_tracks()
                 tracks = playlist.tracks_obj
             except Exception as exc:
                 debug_exc_log(log, exc, "Failed to fetch playlist for autoplay")
@@ -1066,60 +1156,120 @@ class AudioAPIInterface:
                         _TOP_100_US, self.cog.local_folder_current_path
                     ),
                 )
-                tracks = list(results.tracks)
-        if tracks:
-            multiple = len(tracks) > 1
-            valid = not multiple
-            tries = len(tracks)
-            track = tracks[0]
-            while valid is False and multiple:
-                tries -= 1
-                if tries <= 0:
-                    raise DatabaseError("No valid entry found")
-                track = random.choice(tracks)
-                query = Query.process_input(track, self.cog.local_folder_current_path)
-                await asyncio.sleep(0.001)
-                if (
-                    (not query.valid)
-                    or query.is_nsfw
-                    or (
-                        query.is_local
-                        and query.local_track_path is not None
-                        and not query.local_track_path.exists()
-                    )
-                ):
-                    continue
-                notify_channel = self.bot.get_channel(player.fetch("channel"))
-                if not await self.cog.is_query_allowed(
-                    self.config,
-                    notify_channel,
-                    f"{track.title} {track.author} {track.uri} {query}",
-                    query_obj=query,
-                ):
-                    if IS_DEBUG:
-                        log.debug(
-                            "Query is not allowed in "
-                            f"{player.channel.guild} ({player.channel.guild.id})"
-                        )
-                    continue
-                valid = True
-            track.extras.update(
-                {
-                    "autoplay": True,
-                    "enqueue_time": int(time.time()),
-                    "vc": player.channel.id,
-                    "requester": player.channel.guild.me.id,
-                }
+                tracks = results.tracks
+        return tracks or []
+
+    async def _is_autoplay_allowed(
+        self, player: lavalink.Player, track: lavalink.Track
+    ) -> bool:
+        query = Query.process_input(track, self.cog.local_folder_current_path)
+        if (
+            (not query.valid)
+            or query.is_nsfw
+            or (
+                query.is_local
+                and query.local_track_path is not None
+                and not query.local_track_path.exists()
             )
-            player.add(player.channel.guild.me, track)
-            self.bot.dispatch(
-                "red_audio_track_auto_play",
-                player.channel.guild,
-                track,
-                player.channel.guild.me,
+        ):
+            return False
+        notify_channel = self.bot.get_channel(player.fetch("channel"))
+        if not await self.cog.is_query_allowed(
+            self.config,
+            notify_channel,
+            f"{track.title} {track.author} {track.uri} {query}",
+            query_obj=query,
+        ):
+            if IS_DEBUG:
+                log.debug(
+                    "Query is not allowed in "
+                    f"{player.channel.guild} ({player.channel.guild.id})"
+                )
+            return False
+        return True
+
+    async def _fill_autoplay_pool(
+        self, player: lavalink.Player, playlist_api: PlaylistWrapper, size: int
+    ) -> List[lavalink.Track]:
+        """Make sure the guild's autoplay pool holds at least ``size`` tracks.
+
+        The pool is emptied whenever the guild's autoplaylist changes.
+        """
+        guild = player.channel.guild
+        autoplaylist = self.cog.guild_settings.get(guild).autoplaylist
+        source = (autoplaylist["enabled"], autoplaylist["id"], autoplaylist["scope"])
+        pool_source, pool = self._autoplay_pools.get(guild.id, (None, []))
+        if pool_source != source:
+            pool = []
+        self._autoplay_pools[guild.id] = (source, pool)
+        if len(pool) >= size:
+            return pool
+        tracks = await self._autoplay_candidates(player, playlist_api, autoplaylist)
+        pooled = {track.track_identifier for track in pool}
+        if len(tracks) == 1:
+            if tracks[0].track_identifier not in pooled:
+                pool.extend(tracks)
+            return pool
+        # Shuffle the indexes, lazily loaded tracks are only built when picked.
+        for index in random.sample(range(len(tracks)), len(tracks)):
+            if len(pool) >= size:
+                break
+            track = tracks[index]
+            if track.track_identifier in pooled:
+                continue
+            if await self._is_autoplay_allowed(player, track):
+                pool.append(track)
+                pooled.add(track.track_identifier)
+        return pool
+
+    async def _prefetch_autoplay(
+        self, player: lavalink.Player, playlist_api: PlaylistWrapper
+    ) -> None:
+        try:
+            await self._fill_autoplay_pool(
+                player, playlist_api, size=_AUTOPLAY_POOL_SIZE
             )
-            if not player.current:
-                await player.play()
+        except Exception as exc:
+            debug_exc_log(log, exc, "Failed to prefetch autoplay tracks")
+
+    def prefetch_autoplay(
+        self, player: lavalink.Player, playlist_api: PlaylistWrapper
+    ) -> None:
+        """Fill the guild's autoplay pool in the background."""
+        guild_id = player.channel.guild.id
+        task = self._autoplay_tasks.get(guild_id)
+        if task is not None and not task.done():
+            return
+        task = asyncio.create_task(self._prefetch_autoplay(player, playlist_api))
+        task.add_done_callback(task_callback)
+        self._autoplay_tasks[guild_id] = task
+
+    async def autoplay(self, player: lavalink.Player, playlist_api: PlaylistWrapper):
+        """Enqueue a random track."""
+        task = self._autoplay_tasks.pop(player.channel.guild.id, None)
+        if task is not None and not task.done():
+            await task
+        pool = await self._fill_autoplay_pool(player, playlist_api, size=1)
+        if not pool:
+            raise DatabaseError("No valid entry found")
+        track = pool.pop()
+        track.extras.update(
+            {
+                "autoplay": True,
+                "enqueue_time": int(time.time()),
+                "vc": player.channel.id,
+                "requester": player.channel.guild.me.id,
+            }
+        )
+        player.add(player.channel.guild.me, track)
+        self.bot.dispatch(
+            "red_audio_track_auto_play",
+            player.channel.guild,
+            track,
+            player.channel.guild.me,
+        )
+        if not player.current:
+            await player.play()
 
     async def fetch_all_contribute(self) -> List[LavalinkCacheFetchForGlobalResult]:
         return await self.local_cache_api.lavalink.fetch_all_for_global()
@@ -1,3 +1,62 @@
 import logging
 
+from collections import OrderedDict
+from pathlib import Path
+from typing import Final, MutableMapping, Optional, Tuple, Union
+
+import lavalink
+
+from ..audio_dataclasses import LocalPath
+
 log = logging.getLogger("red.cogs.Audio.api.LocalTracks")
+
+_MAX_CACHED_TRACKS: Final[int] = 25000
+
+_CacheKey = Tuple[str, int, int]
+
+
+class LocalTrackCache:
+    """In memory cache of Lavalink metadata for local files.
+
+    Entries are keyed by the absolute path of the file plus its size and modification time,
+    so a file that changes on disk will never be served from a stale entry.
+    """
+
+    def __init__(self, max_size: int = _MAX_CACHED_TRACKS):
+        self._max_size = max_size
+        self._cache: "OrderedDict[_CacheKey, MutableMapping]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @staticmethod
+    def get_key(path: Union[LocalPath, Path]) -> Optional[_CacheKey]:
+        """Return the cache key for the provided file or ``None`` if it can't be read."""
+        path = getattr(path, "path", path)
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return str(path.absolute()), stat.st_size, stat.st_mtime_ns
+
+    def get(self, key: Optional[_CacheKey]) -> Optional[lavalink.Track]:
+        """Build a new Track object from the cached entry if there is one."""
+        if key is None:
+            return None
+        data = self._cache.get(key)
+        if data is None:
+            return None
+        self._cache.move_to_end(key)
+        return lavalink.Track(data={"track": data["track"], "info": dict(data["info"])})
+
+    def put(self, key: Optional[_CacheKey], track: lavalink.Track) -> None:
+        """Store the metadata needed to rebuild the provided Track."""
+        if key is None or not track.track_identifier:
+            return
+        self._cache[key] = {"track": track.track_identifier, "info": dict(track._info)}
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        self._cache.clear()
@@ -1,10 +1,11 @@
+import asyncio
 import concurrent
 import logging
 import time
 from pathlib import Path
 
 from types import SimpleNamespace
-from typing import TYPE_CHECKING, List, Union
+from typing import TYPE_CHECKING, Final, List, MutableMapping, Optional, Tuple, Union
 
 import lavalink
 
@@ -31,17 +32,15 @@ from ..sql_statements import (
     PRAGMA_SET_temp_store,
     PRAGMA_SET_user_version,
 )
-from .api_utils import QueueFetchResult
+from ..utils import task_callback
+from .api_utils import QueueFetchResult, encode_track
 
 log = logging.getLogger("red.cogs.Audio.api.PersistQueueWrapper")
 _ = Translator("Audio", Path(__file__))
+_FLUSH_INTERVAL: Final[int] = 2
 
 if TYPE_CHECKING:
     from .. import Audio
-try:
-    from redbot import json
-except ImportError:
-    import json
 
 
 class QueueInterface:
@@ -73,6 +72,10 @@ class QueueInterface:
         self.statement.get_all = PERSIST_QUEUE_FETCH_ALL
         self.statement.get_player = PERSIST_QUEUE_PLAYED
 
+        self._pending: MutableMapping[int, List[Tuple[str, MutableMapping]]] = {}
+        self._flush_lock: asyncio.Lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+
     async def init(self) -> None:
         """Initialize the PersistQueue table"""
         with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
@@ -87,9 +90,53 @@ class QueueInterface:
             )
             executor.submit(self.database.cursor().execute, self.statement.create_table)
             executor.submit(self.database.cursor().execute, self.statement.create_index)
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+            self._flush_task.add_done_callback(task_callback)
+
+    def close(self) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(_FLUSH_INTERVAL)
+            await self.flush()
+
+    def _append(self, guild_id: int, statement: str, values: MutableMapping) -> None:
+        self._pending.setdefault(int(guild_id), []).append((statement, values))
+
+    def _write(self, batches: List[Tuple[str, List[MutableMapping]]]) -> None:
+        with self.database.transaction() as transaction:
+            for statement, values in batches:
+                transaction.executemany(statement, values)
+
+    async def flush(self) -> None:
+        """Write all buffered queue changes to the database in a single transaction."""
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+            batches: List[Tuple[str, List[MutableMapping]]] = []
+            for guild_ops in pending.values():
+                # Consecutive writes using the same statement are batched together,
+                # the order of the writes of a guild is preserved.
+                for statement, values in guild_ops:
+                    if batches and batches[-1][0] == statement:
+                        batches[-1][1].append(values)
+                    else:
+                        batches.append((statement, [values]))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                future = executor.submit(self._write, batches)
+            try:
+                future.result()
+            except Exception as exc:
+                debug_exc_log(log, exc, "Failed to write queue changes to the database")
 
     async def fetch_all(self) -> List[QueueFetchResult]:
         """Fetch all playlists"""
+        await self.flush()
         output = []
         with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
             for future in concurrent.futures.as_completed(
@@ -113,26 +160,19 @@ class QueueInterface:
         return output
 
     async def played(self, guild_id: int, track_id: str) -> None:
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(
-                self.database.cursor().execute,
-                PERSIST_QUEUE_PLAYED,
-                {"guild_id": guild_id, "track_id": track_id},
-            )
+        self._append(
+            guild_id, PERSIST_QUEUE_PLAYED, {"guild_id": guild_id, "track_id": track_id}
+        )
 
     async def delete_scheduled(self):
+        await self.flush()
         with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
             executor.submit(
                 self.database.cursor().execute, PERSIST_QUEUE_DELETE_SCHEDULED
             )
 
     async def drop(self, guild_id: int):
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(
-                self.database.cursor().execute,
-                PERSIST_QUEUE_BULK_PLAYED,
-                ({"guild_id": guild_id}),
-            )
+        self._append(guild_id, PERSIST_QUEUE_BULK_PLAYED, {"guild_id": guild_id})
 
     async def enqueued(self, guild_id: int, room_id: int, track: lavalink.Track):
         enqueue_time = track.extras.get("enqueue_time", 0)
@@ -140,16 +180,15 @@ class QueueInterface:
             track.extras["enqueue_time"] = int(time.time())
         track_identifier = track.track_identifier
         track = self.cog.track_to_json(track)
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(
-                self.database.cursor().execute,
-                PERSIST_QUEUE_UPSERT,
-                {
-                    "guild_id": int(guild_id),
-                    "room_id": int(room_id),
-                    "played": False,
-                    "time": enqueue_time,
-                    "track": json.dumps(track),
-                    "track_id": track_identifier,
-                },
-            )
+        self._append(
+            guild_id,
+            PERSIST_QUEUE_UPSERT,
+            {
+                "guild_id": int(guild_id),
+                "room_id": int(room_id),
+                "played": False,
+                "time": enqueue_time,
+                "track": encode_track(track),
+                "track_id": track_identifier,
+            },
+        )
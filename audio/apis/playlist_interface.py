@@ -13,7 +13,12 @@ from redbot.core.utils import AsyncIter
 
 from ..errors import NotAllowed
 from ..utils import PlaylistScope
-from .api_utils import PlaylistFetchResult, prepare_config_scope, standardize_scope
+from .api_utils import (
+    PlaylistFetchResult,
+    prepare_config_scope,
+    standardize_scope,
+    track_duration,
+)
 from .playlist_wrapper import PlaylistWrapper
 
 log = logging.getLogger("red.cogs.Audio.api.PlaylistsInterface")
@@ -34,6 +39,8 @@ class Playlist:
         playlist_url: Optional[str] = None,
         tracks: Optional[List[MutableMapping]] = None,
         guild: Union[discord.Guild, int, None] = None,
+        track_count: Optional[int] = None,
+        duration: Optional[int] = None,
     ):
         self.bot = bot
         self.guild = guild
@@ -50,15 +57,59 @@ class Playlist:
         self.id = playlist_id
         self.name = name
         self.url = playlist_url
-        self.tracks = tracks or []
-        self.tracks_obj = [lavalink.Track(data=track) for track in self.tracks]
+        self._tracks = tracks
+        self._tracks_dirty = tracks is not None
+        self._track_count = track_count
+        self._duration = duration
         self.playlist_api = playlist_api
 
+    async def load_tracks(self) -> List[MutableMapping]:
+        """Load the playlist's tracks from the database if they aren't yet."""
+        if self._tracks is None:
+            if self._track_count == 0:
+                self._tracks = []
+            else:
+                scope, scope_id = self.config_scope
+                self._tracks = await self.playlist_api.fetch_tracks(
+                    scope, playlist_id=int(self.id), scope_id=scope_id
+                )
+        return self._tracks
+
+    @property
+    def tracks(self) -> List[MutableMapping]:
+        """The playlist's tracks, :meth:`load_tracks` must have been awaited first."""
+        if self._tracks is None:
+            raise RuntimeError("The playlist's tracks haven't been loaded.")
+        return self._tracks
+
+    @tracks.setter
+    def tracks(self, value: Optional[List[MutableMapping]]) -> None:
+        self._tracks = value or []
+        self._tracks_dirty = True
+
+    @property
+    def tracks_obj(self) -> List[lavalink.Track]:
+        return [lavalink.Track(data=track) for track in self.tracks]
+
+    @property
+    def track_count(self) -> int:
+        """The number of tracks in the playlist, without loading them if possible."""
+        if self._tracks is None:
+            return self._track_count or 0
+        return len(self._tracks)
+
+    @property
+    def duration(self) -> int:
+        """The total length of the playlist's tracks in milliseconds."""
+        if self._tracks is None:
+            return self._duration or 0
+        return sum(track_duration(track) for track in self._tracks)
+
     def __repr__(self):
         return (
             f"Playlist(name={self.name}, id={self.id}, scope={self.scope}, "
             f"scope_id={self.scope_id}, author={self.author_id}, "
-            f"tracks={len(self.tracks)}, url={self.url})"
+            f"tracks={self.track_count}, url={self.url})"
         )
 
     async def edit(self, data: MutableMapping):
@@ -88,8 +139,56 @@ class Playlist:
             scope_id=scope_id,
             author_id=self.author_id,
             playlist_url=self.url,
-            tracks=self.tracks,
+            tracks=self.tracks if self._tracks_dirty else None,
+        )
+        self._tracks_dirty = False
+
+    async def append_tracks(self, tracks: List[MutableMapping]) -> int:
+        """Adds tracks at the end of the Playlist without rewriting existing ones.
+
+        Returns
+        -------
+        int
+            The number of tracks which were added.
+        """
+        if self._tracks_dirty:
+            self.tracks.extend(tracks)
+            await self.save()
+            return len(tracks)
+        scope, scope_id = self.config_scope
+        added = await self.playlist_api.append_tracks(
+            scope, playlist_id=int(self.id), scope_id=scope_id, tracks=tracks
         )
+        if self._tracks is not None:
+            self._tracks.extend(tracks)
+        if self._track_count is not None:
+            self._track_count += len(tracks)
+        if self._duration is not None:
+            self._duration += sum(track_duration(track) for track in tracks)
+        return added
+
+    async def remove_track_uri(self, uri: str) -> int:
+        """Removes all tracks matching the provided uri from the Playlist.
+
+        Returns
+        -------
+        int
+            The number of tracks which were removed.
+        """
+        if self._tracks_dirty:
+            await self.save()
+        scope, scope_id = self.config_scope
+        removed, duration = await self.playlist_api.remove_tracks_by_uri(
+            scope, playlist_id=int(self.id), scope_id=scope_id, uri=uri
+        )
+        if removed:
+            if self._tracks is not None:
+                self._tracks = [t for t in self._tracks if t["info"].get("uri") != uri]
+            if self._track_count is not None:
+                self._track_count -= removed
+            if self._duration is not None:
+                self._duration -= duration
+        return removed
 
     def to_json(self) -> MutableMapping:
         """Transform the object to a dict.
@@ -156,7 +255,6 @@ class Playlist:
         playlist_id = data.playlist_id or playlist_number
         name = data.playlist_name
         playlist_url = data.playlist_url
-        tracks = data.tracks
 
         return cls(
             bot=bot,
@@ -167,7 +265,8 @@ class Playlist:
             playlist_id=playlist_id,
             name=name,
             playlist_url=playlist_url,
-            tracks=tracks,
+            track_count=data.track_count,
+            duration=data.duration,
         )
 
 
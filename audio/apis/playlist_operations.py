@@ -0,0 +1,187 @@
+import asyncio
+import functools
+import gzip
+import logging
+import zlib
+from pathlib import Path
+
+from typing import (
+    Any,
+    Callable,
+    Final,
+    Iterable,
+    List,
+    MutableMapping,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+try:
+    from redbot import json
+except ImportError:
+    import json
+
+log = logging.getLogger("red.cogs.Audio.api.PlaylistOperations")
+
+_T = TypeVar("_T")
+_EXPORT_PAGE_SIZE: Final[int] = 1000
+_MAX_LINE_LENGTH: Final[int] = 1024 * 1024
+
+PLAYLIST_FILE_SUFFIX: Final[str] = ".jsonl.gz"
+
+# All the helpers below work on the raw track dicts stored in playlists
+# ({"track": ..., "info": {...}}), tracks are identified by their Lavalink track.
+
+
+async def run(func: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+    """Run a playlist operation in a worker thread instead of the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(
+        None, functools.partial(func, *args, **kwargs)
+    )
+
+
+def dedupe(tracks: Iterable[MutableMapping]) -> List[MutableMapping]:
+    """Remove duplicated tracks, keeping the first occurrence of each."""
+    seen: Set[str] = set()
+    unique = []
+    for track in tracks:
+        track_id = track.get("track")
+        if track_id in seen:
+            continue
+        seen.add(track_id)
+        unique.append(track)
+    return unique
+
+
+def fetch_and_dedupe(
+    fetch: Callable[..., List[MutableMapping]], *args: Any
+) -> Tuple[int, List[MutableMapping]]:
+    """Fetch tracks with ``fetch(*args)`` and remove their duplicates.
+
+    The number of tracks fetched is returned along with the unique ones, so the
+    caller can check the whole playlist was read before saving them.
+    """
+    tracks = fetch(*args)
+    return len(tracks), dedupe(tracks)
+
+
+def exclude(
+    tracks: Iterable[MutableMapping], identifiers: Set[str]
+) -> List[MutableMapping]:
+    """Get the tracks missing from ``identifiers``, without duplicates.
+
+    ``identifiers`` is updated with the tracks returned.
+    """
+    missing = []
+    for track in tracks:
+        track_id = track.get("track")
+        if track_id in identifiers:
+            continue
+        identifiers.add(track_id)
+        missing.append(track)
+    return missing
+
+
+def diff(
+    old_tracks: Iterable[MutableMapping], new_tracks: Iterable[MutableMapping]
+) -> Tuple[List[MutableMapping], List[MutableMapping]]:
+    """Compare two versions of a playlist.
+
+    Returns
+    -------
+    Tuple[List[MutableMapping], List[MutableMapping]]
+        The tracks added and removed in ``new_tracks``, in playlist order.
+    """
+    old_tracks = list(old_tracks)
+    new_tracks = list(new_tracks)
+    old_ids = {track.get("track") for track in old_tracks}
+    new_ids = {track.get("track") for track in new_tracks}
+    added = dedupe(t for t in new_tracks if t.get("track") not in old_ids)
+    removed = dedupe(t for t in old_tracks if t.get("track") not in new_ids)
+    return added, removed
+
+
+def appended_tail(
+    old_tracks: Iterable[MutableMapping], new_tracks: Iterable[MutableMapping]
+) -> Optional[List[MutableMapping]]:
+    """Get the tracks added at the end of a playlist.
+
+    Returns ``None`` when ``new_tracks`` doesn't start with ``old_tracks``,
+    in which case the stored tracks have to be replaced.
+    """
+    old_ids = [track.get("track") for track in old_tracks]
+    new_tracks = list(new_tracks)
+    if len(new_tracks) < len(old_ids):
+        return None
+    if any(track.get("track") != i for track, i in zip(new_tracks, old_ids)):
+        return None
+    return new_tracks[len(old_ids) :]
+
+
+def dumps(data: MutableMapping) -> bytes:
+    """Serialize a playlist file."""
+    return json.dumps(data).encode("utf-8")
+
+
+def loads(data: bytes) -> MutableMapping:
+    """Deserialize a playlist file."""
+    return json.loads(data.decode("utf-8"))
+
+
+def export_lines(
+    path: Path,
+    header: MutableMapping,
+    fetch_page: Callable[[int, int], List[MutableMapping]],
+) -> int:
+    """Write a playlist file as gzip compressed JSON lines.
+
+    The first line is the playlist's ``header``, followed by one track per line.
+    Tracks are requested from ``fetch_page(offset, limit)`` one page at a time.
+
+    Returns
+    -------
+    int
+        The number of tracks written.
+    """
+    count = 0
+    with gzip.open(path, "wb") as playlist_file:
+        playlist_file.write(dumps(header) + b"\n")
+        while True:
+            page = fetch_page(count, _EXPORT_PAGE_SIZE)
+            playlist_file.writelines(dumps(track) + b"\n" for track in page)
+            count += len(page)
+            if len(page) < _EXPORT_PAGE_SIZE:
+                return count
+
+
+class LinesReader:
+    """Incrementally parse a playlist file written by :func:`export_lines`."""
+
+    def __init__(self):
+        self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        self._buffer = b""
+
+    def _parse(self, data: bytes) -> List[MutableMapping]:
+        *lines, self._buffer = data.split(b"\n")
+        if len(self._buffer) > _MAX_LINE_LENGTH:
+            raise ValueError("Playlist file line is too long")
+        return [loads(line) for line in lines if line.strip()]
+
+    def feed(self, chunk: bytes) -> List[MutableMapping]:
+        """Parse a chunk of the file, returns the entries completed by this chunk."""
+        entries = []
+        while chunk:
+            data = self._decompressor.decompress(chunk, _MAX_LINE_LENGTH)
+            entries.extend(self._parse(self._buffer + data))
+            chunk = self._decompressor.unconsumed_tail
+        return entries
+
+    def close(self) -> List[MutableMapping]:
+        """Parse what is left of the file once all chunks have been fed."""
+        entries = self._parse(self._buffer + self._decompressor.flush())
+        if self._buffer.strip():
+            entries.append(loads(self._buffer))
+        self._buffer = b""
+        return entries
@@ -0,0 +1,215 @@
+import asyncio
+import datetime
+import logging
+import time
+
+from typing import (
+    TYPE_CHECKING,
+    Final,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import lavalink
+from redbot.core import Config
+from redbot.core.bot import Red
+from redbot.core.commands import Cog
+
+from ..audio_dataclasses import Query
+from ..audio_logging import debug_exc_log
+from ..utils import PlaylistScope, task_callback
+from . import playlist_operations
+from .api_utils import PlaylistFetchResult
+from .playlist_wrapper import PlaylistWrapper
+
+if TYPE_CHECKING:
+    from .. import Audio
+
+log = logging.getLogger("red.cogs.Audio.api.PlaylistRefresher")
+_CHECK_INTERVAL: Final[int] = 1800
+_OFF_PEAK_HOURS: Final[range] = range(3, 7)
+_STALE_AFTER: Final[int] = 7 * 24 * 3600
+_REFRESH_CONCURRENCY: Final[int] = 3
+_REFRESH_BATCH_SIZE: Final[int] = 50
+_RETRY_AFTER: Final[int] = 24 * 3600
+
+
+class PlaylistRefresher:
+    """Refreshes the stale playlists saved from a URL in the background.
+
+    Stale playlists are refreshed during off-peak hours only, a few at a time,
+    by loading their URL through the Lavalink node of a connected player.
+    Spotify playlists need a command context to be resolved so they are only
+    refreshed by ``[p]playlist update``, local playlists aren't refreshed.
+    A playlist is only marked as refreshed once its tracks were loaded and saved,
+    one which failed to load is retried a day later.
+    """
+
+    def __init__(
+        self,
+        bot: Red,
+        config: Config,
+        playlist_api: PlaylistWrapper,
+        cog: Union["Audio", Cog],
+    ):
+        self.bot = bot
+        self.config = config
+        self.playlist_api = playlist_api
+        self.cog = cog
+        self._failed_at: MutableMapping[Tuple[str, int, int], float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._refresh_loop())
+            self._task.add_done_callback(task_callback)
+
+    def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+        self._task = None
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(_CHECK_INTERVAL)
+            if datetime.datetime.now().hour not in _OFF_PEAK_HOURS:
+                continue
+            if not await self.config.playlist_refresh():
+                continue
+            await self.refresh_stale()
+
+    async def refresh_stale(self) -> None:
+        """Refresh the playlists which haven't been refreshed for a while."""
+        players = lavalink.all_players()
+        if not players:
+            # Nothing is connected to Lavalink, try again on the next check.
+            return
+        player = players[0]
+        refreshed_before = int(time.time()) - _STALE_AFTER
+        stale = []
+        for scope in PlaylistScope.list():
+            stale.extend(
+                (scope, playlist)
+                for playlist in await self._fetch_refreshable(scope, refreshed_before)
+            )
+        semaphore = asyncio.Semaphore(_REFRESH_CONCURRENCY)
+
+        async def refresh(scope: str, playlist: PlaylistFetchResult) -> None:
+            async with semaphore:
+                await self.refresh(player, scope, playlist)
+
+        await asyncio.gather(*(refresh(scope, playlist) for scope, playlist in stale))
+
+    async def _fetch_refreshable(
+        self, scope: str, refreshed_before: int
+    ) -> List[PlaylistFetchResult]:
+        # Local playlists and the ones which failed recently are skipped here,
+        # the following pages are fetched so they can't fill the batch.
+        retry_before = time.time() - _RETRY_AFTER
+        playlists = []
+        offset = 0
+        while len(playlists) < _REFRESH_BATCH_SIZE:
+            page = await self.playlist_api.fetch_stale(
+                scope,
+                refreshed_before=refreshed_before,
+                limit=_REFRESH_BATCH_SIZE,
+                offset=offset,
+            )
+            offset += len(page)
+            playlists.extend(
+                playlist
+                for playlist in page
+                if self._failed_at.get(self._key(scope, playlist), 0) < retry_before
+                and self._query(playlist) is not None
+            )
+            if len(page) < _REFRESH_BATCH_SIZE:
+                break
+        return playlists[:_REFRESH_BATCH_SIZE]
+
+    @staticmethod
+    def _key(scope: str, playlist: PlaylistFetchResult) -> Tuple[str, int, int]:
+        return scope, playlist.playlist_id, playlist.scope_id
+
+    def _query(self, playlist: PlaylistFetchResult) -> Optional[Query]:
+        """The query to load a playlist's URL with, ``None`` if it can't be refreshed."""
+        query = Query.process_input(
+            playlist.playlist_url, self.cog.local_folder_current_path
+        )
+        if not query.valid or query.is_spotify or query.is_local:
+            return None
+        return query
+
+    async def refresh(
+        self,
+        player: lavalink.Player,
+        scope: str,
+        playlist: PlaylistFetchResult,
+    ) -> bool:
+        """Update a playlist's tracks from its URL, only writing what changed.
+
+        Returns whether the playlist was refreshed.
+        """
+        query = self._query(playlist)
+        if query is None:
+            return False
+        try:
+            result = await player.load_tracks(str(query))
+            if result.has_error or not result.tracks:
+                raise ValueError(f"Loading {query} returned no tracks")
+            await self._save_tracks(
+                scope,
+                playlist,
+                [self.cog.track_to_json(track) for track in result.tracks],
+            )
+            await self.playlist_api.set_refreshed(
+                scope,
+                playlist_id=playlist.playlist_id,
+                scope_id=playlist.scope_id,
+                timestamp=int(time.time()),
+            )
+        except Exception as exc:
+            self._failed_at[self._key(scope, playlist)] = time.time()
+            debug_exc_log(
+                log, exc, f"Failed to refresh playlist ID: {playlist.playlist_id}"
+            )
+            return False
+        self._failed_at.pop(self._key(scope, playlist), None)
+        return True
+
+    async def _save_tracks(
+        self,
+        scope: str,
+        playlist: PlaylistFetchResult,
+        updated_tracks: List[MutableMapping],
+    ) -> None:
+        """Write the tracks which changed, raising if they couldn't be saved."""
+        stored_tracks = await playlist_operations.run(
+            self.playlist_api.read_tracks,
+            scope,
+            playlist_id=playlist.playlist_id,
+            scope_id=playlist.scope_id,
+        )
+        new_tracks = await playlist_operations.run(
+            playlist_operations.appended_tail, stored_tracks, updated_tracks
+        )
+        if new_tracks:
+            await self.playlist_api.append_tracks(
+                scope,
+                playlist_id=playlist.playlist_id,
+                scope_id=playlist.scope_id,
+                tracks=new_tracks,
+            )
+        elif new_tracks is None:
+            added, removed = await playlist_operations.run(
+                playlist_operations.diff, stored_tracks, updated_tracks
+            )
+            if added or removed:
+                await self.playlist_api.replace_tracks(
+                    scope,
+                    playlist_id=playlist.playlist_id,
+                    scope_id=playlist.scope_id,
+                    tracks=updated_tracks,
+                )
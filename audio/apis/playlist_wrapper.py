@@ -3,7 +3,7 @@ import logging
 from pathlib import Path
 
 from types import SimpleNamespace
-from typing import List, MutableMapping, Optional
+from typing import List, MutableMapping, Optional, Set, Tuple
 
 from redbot.core import Config
 from redbot.core.bot import Red
@@ -14,15 +14,49 @@ from redbot.core.utils.dbtools import APSWConnectionWrapper
 from ..audio_logging import debug_exc_log
 from ..sql_statements import (
     HANDLE_DISCORD_DATA_DELETION_QUERY,
+    PLAYLIST_ADD_DURATION_COLUMN,
+    PLAYLIST_ADD_LAST_REFRESHED_COLUMN,
+    PLAYLIST_ADD_TRACK_COUNT_COLUMN,
+    PLAYLIST_COPY_SUMMARY,
     PLAYLIST_CREATE_INDEX,
     PLAYLIST_CREATE_TABLE,
     PLAYLIST_DELETE,
+    PLAYLIST_DELETE_DAILY,
     PLAYLIST_DELETE_SCHEDULED,
     PLAYLIST_DELETE_SCOPE,
     PLAYLIST_FETCH,
     PLAYLIST_FETCH_ALL,
     PLAYLIST_FETCH_ALL_CONVERTER,
+    PLAYLIST_FETCH_ALL_CONVERTER_INDEXED,
     PLAYLIST_FETCH_ALL_WITH_FILTER,
+    PLAYLIST_FETCH_COLUMNS,
+    PLAYLIST_FETCH_EMBEDDED_TRACKS,
+    PLAYLIST_FETCH_LEGACY_TRACKS,
+    PLAYLIST_FETCH_STALE,
+    PLAYLIST_NAME_INDEX_CREATE_DELETE_TRIGGER,
+    PLAYLIST_NAME_INDEX_CREATE_INSERT_TRIGGER,
+    PLAYLIST_NAME_INDEX_CREATE_TABLE,
+    PLAYLIST_NAME_INDEX_CREATE_UPDATE_TRIGGER,
+    PLAYLIST_NAME_INDEX_DROP_DELETE_TRIGGER,
+    PLAYLIST_NAME_INDEX_DROP_INSERT_TRIGGER,
+    PLAYLIST_NAME_INDEX_DROP_UPDATE_TRIGGER,
+    PLAYLIST_NAME_INDEX_EXISTS,
+    PLAYLIST_NAME_INDEX_REBUILD,
+    PLAYLIST_SET_REFRESHED,
+    PLAYLIST_SET_SUMMARY,
+    PLAYLIST_TRACKS_COPY,
+    PLAYLIST_TRACKS_CREATE_INDEX,
+    PLAYLIST_TRACKS_CREATE_TABLE,
+    PLAYLIST_TRACKS_CREATE_TRIGGER,
+    PLAYLIST_TRACKS_DELETE_ALL,
+    PLAYLIST_TRACKS_DELETE_URI,
+    PLAYLIST_TRACKS_FETCH,
+    PLAYLIST_TRACKS_FETCH_ALL,
+    PLAYLIST_TRACKS_FETCH_URI,
+    PLAYLIST_TRACKS_INSERT,
+    PLAYLIST_TRACKS_NEXT_ORDINAL,
+    PLAYLIST_UPDATE_SUMMARY,
+    PLAYLIST_UPDATE_TRACKS,
     PLAYLIST_UPSERT,
     PRAGMA_FETCH_user_version,
     PRAGMA_SET_journal_mode,
@@ -31,7 +65,15 @@ from ..sql_statements import (
     PRAGMA_SET_user_version,
 )
 from ..utils import PlaylistScope
-from .api_utils import PlaylistFetchResult
+from .api_utils import (
+    PlaylistFetchResult,
+    decode_track,
+    decode_track_identifier,
+    decode_tracks,
+    encode_track,
+    encode_tracks,
+    track_duration,
+)
 
 try:
     from redbot import json
@@ -59,13 +101,54 @@ class PlaylistWrapper:
         self.statement.delete = PLAYLIST_DELETE
         self.statement.delete_scope = PLAYLIST_DELETE_SCOPE
         self.statement.delete_scheduled = PLAYLIST_DELETE_SCHEDULED
+        self.statement.delete_daily = PLAYLIST_DELETE_DAILY
 
         self.statement.get_one = PLAYLIST_FETCH
         self.statement.get_all = PLAYLIST_FETCH_ALL
         self.statement.get_all_with_filter = PLAYLIST_FETCH_ALL_WITH_FILTER
         self.statement.get_all_converter = PLAYLIST_FETCH_ALL_CONVERTER
+        self.statement.get_all_converter_indexed = PLAYLIST_FETCH_ALL_CONVERTER_INDEXED
+        self.statement.get_legacy_tracks = PLAYLIST_FETCH_LEGACY_TRACKS
+        self.statement.get_embedded_tracks = PLAYLIST_FETCH_EMBEDDED_TRACKS
+        self.statement.update_tracks = PLAYLIST_UPDATE_TRACKS
+        self.statement.get_columns = PLAYLIST_FETCH_COLUMNS
+        self.statement.add_track_count_column = PLAYLIST_ADD_TRACK_COUNT_COLUMN
+        self.statement.add_duration_column = PLAYLIST_ADD_DURATION_COLUMN
+        self.statement.update_summary = PLAYLIST_UPDATE_SUMMARY
+        self.statement.set_summary = PLAYLIST_SET_SUMMARY
+        self.statement.copy_summary = PLAYLIST_COPY_SUMMARY
+        self.statement.add_last_refreshed_column = PLAYLIST_ADD_LAST_REFRESHED_COLUMN
+        self.statement.set_refreshed = PLAYLIST_SET_REFRESHED
+        self.statement.get_stale = PLAYLIST_FETCH_STALE
+
+        self.statement.name_index_exists = PLAYLIST_NAME_INDEX_EXISTS
+        self.statement.name_index_create_table = PLAYLIST_NAME_INDEX_CREATE_TABLE
+        self.statement.name_index_create_triggers = (
+            PLAYLIST_NAME_INDEX_CREATE_INSERT_TRIGGER,
+            PLAYLIST_NAME_INDEX_CREATE_DELETE_TRIGGER,
+            PLAYLIST_NAME_INDEX_CREATE_UPDATE_TRIGGER,
+        )
+        self.statement.name_index_drop_triggers = (
+            PLAYLIST_NAME_INDEX_DROP_INSERT_TRIGGER,
+            PLAYLIST_NAME_INDEX_DROP_DELETE_TRIGGER,
+            PLAYLIST_NAME_INDEX_DROP_UPDATE_TRIGGER,
+        )
+        self.statement.name_index_rebuild = PLAYLIST_NAME_INDEX_REBUILD
+
+        self.statement.tracks_create_table = PLAYLIST_TRACKS_CREATE_TABLE
+        self.statement.tracks_create_index = PLAYLIST_TRACKS_CREATE_INDEX
+        self.statement.tracks_create_trigger = PLAYLIST_TRACKS_CREATE_TRIGGER
+        self.statement.tracks_get = PLAYLIST_TRACKS_FETCH
+        self.statement.tracks_get_all = PLAYLIST_TRACKS_FETCH_ALL
+        self.statement.tracks_get_uri = PLAYLIST_TRACKS_FETCH_URI
+        self.statement.tracks_next_ordinal = PLAYLIST_TRACKS_NEXT_ORDINAL
+        self.statement.tracks_insert = PLAYLIST_TRACKS_INSERT
+        self.statement.tracks_delete_uri = PLAYLIST_TRACKS_DELETE_URI
+        self.statement.tracks_delete_all = PLAYLIST_TRACKS_DELETE_ALL
+        self.statement.tracks_copy = PLAYLIST_TRACKS_COPY
 
         self.statement.drop_user_playlists = HANDLE_DISCORD_DATA_DELETION_QUERY
+        self._name_index = False
 
     async def init(self) -> None:
         """Initialize the Playlist table."""
@@ -81,6 +164,77 @@ class PlaylistWrapper:
             )
             executor.submit(self.database.cursor().execute, self.statement.create_table)
             executor.submit(self.database.cursor().execute, self.statement.create_index)
+            executor.submit(
+                self.database.cursor().execute, self.statement.tracks_create_table
+            )
+            executor.submit(
+                self.database.cursor().execute, self.statement.tracks_create_index
+            )
+            executor.submit(
+                self.database.cursor().execute, self.statement.tracks_create_trigger
+            )
+            columns_future = executor.submit(
+                self.database.cursor().execute, self.statement.get_columns
+            )
+        columns = {row[1] for row in columns_future.result()}
+        # Databases created before track summaries were stored need the columns added
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            if "track_count" not in columns:
+                executor.submit(
+                    self.database.cursor().execute,
+                    self.statement.add_track_count_column,
+                )
+            if "duration" not in columns:
+                executor.submit(
+                    self.database.cursor().execute, self.statement.add_duration_column
+                )
+            if "last_refreshed" not in columns:
+                executor.submit(
+                    self.database.cursor().execute,
+                    self.statement.add_last_refreshed_column,
+                )
+        await self.create_name_index()
+
+    def _create_name_index(self) -> None:
+        with self.database.transaction() as transaction:
+            existed = (
+                transaction.execute(self.statement.name_index_exists).fetchone()
+                is not None
+            )
+            # The triggers are only created once their index table was
+            transaction.execute(self.statement.name_index_create_table)
+            for statement in self.statement.name_index_create_triggers:
+                transaction.execute(statement)
+            if not existed:
+                transaction.execute(self.statement.name_index_rebuild)
+
+    def _drop_name_index_triggers(self) -> None:
+        for statement in self.statement.name_index_drop_triggers:
+            self.database.cursor().execute(statement)
+
+    async def create_name_index(self) -> None:
+        """Create the full text index used to match playlist names.
+
+        SQLite builds without FTS5 or the trigram tokenizer (older than 3.34)
+        keep matching names with a table scan.
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self._create_name_index)
+        try:
+            future.result()
+        except Exception as exc:
+            debug_exc_log(log, exc, "Playlist name index isn't supported by SQLite")
+            self._name_index = False
+        else:
+            self._name_index = True
+            return
+        # Triggers left without their index table would make every playlist write fail
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self._drop_name_index_triggers)
+        try:
+            future.result()
+        except Exception as exc:
+            debug_exc_log(log, exc, "Failed to drop the playlist name index triggers")
 
     @staticmethod
     def get_scope_type(scope: str) -> int:
@@ -194,7 +348,9 @@ class PlaylistWrapper:
                 [
                     executor.submit(
                         self.database.cursor().execute,
-                        self.statement.get_all_converter,
+                        self.statement.get_all_converter_indexed
+                        if self._name_index
+                        else self.statement.get_all_converter,
                         (
                             {
                                 "scope_type": scope_type,
@@ -214,6 +370,52 @@ class PlaylistWrapper:
                 output.append(PlaylistFetchResult(*row))
         return output
 
+    async def fetch_stale(
+        self, scope: str, refreshed_before: int, limit: int, offset: int = 0
+    ) -> List[PlaylistFetchResult]:
+        """Fetch the URL playlists last refreshed before the provided timestamp.
+
+        Spotify playlists are left out, they can't be refreshed in the background.
+        """
+        scope_type = self.get_scope_type(scope)
+        output = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(
+                self.database.cursor().execute,
+                self.statement.get_stale,
+                {
+                    "scope_type": scope_type,
+                    "last_refreshed": refreshed_before,
+                    "limit": limit,
+                    "offset": offset,
+                },
+            )
+        try:
+            row_result = future.result()
+        except Exception as exc:
+            debug_exc_log(log, exc, "Failed to fetch stale playlists from database")
+            return output
+        async for row in AsyncIter(row_result):
+            output.append(PlaylistFetchResult(*row))
+        return output
+
+    async def set_refreshed(
+        self, scope: str, playlist_id: int, scope_id: int, timestamp: int
+    ) -> None:
+        """Record when a playlist was last refreshed from its URL."""
+        scope_type = self.get_scope_type(scope)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(
+                self.database.cursor().execute,
+                self.statement.set_refreshed,
+                {
+                    "scope_type": scope_type,
+                    "playlist_id": int(playlist_id),
+                    "scope_id": int(scope_id),
+                    "last_refreshed": timestamp,
+                },
+            )
+
     async def delete(self, scope: str, playlist_id: int, scope_id: int):
         """Deletes a single playlists."""
         scope_type = self.get_scope_type(scope)
@@ -230,6 +432,26 @@ class PlaylistWrapper:
                 ),
             )
 
+    async def delete_daily(
+        self, scope: str, author_id: int, playlist_id: int, name_prefix: str
+    ):
+        """Deletes the daily playlists up to the provided day's ID.
+
+        Only the playlists named like daily playlists are deleted.
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(
+                self.database.cursor().execute,
+                self.statement.delete_daily,
+                {
+                    "scope_type": self.get_scope_type(scope),
+                    "author_id": author_id,
+                    "playlist_id": playlist_id,
+                    "name_prefix": name_prefix,
+                },
+            )
+        future.result()
+
     async def delete_scheduled(self):
         """Clean up database from all deleted playlists."""
         with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
@@ -251,6 +473,9 @@ class PlaylistWrapper:
         """Create the playlist table."""
         with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
             executor.submit(self.database.cursor().execute, PLAYLIST_CREATE_TABLE)
+            executor.submit(
+                self.database.cursor().execute, PLAYLIST_TRACKS_CREATE_TABLE
+            )
 
     async def upsert(
         self,
@@ -260,9 +485,12 @@ class PlaylistWrapper:
         scope_id: int,
         author_id: int,
         playlist_url: Optional[str],
-        tracks: List[MutableMapping],
+        tracks: Optional[List[MutableMapping]] = None,
     ):
-        """Insert or update a playlist into the database."""
+        """Insert or update a playlist into the database.
+
+        The playlist's tracks are only replaced if ``tracks`` is provided.
+        """
         scope_type = self.get_scope_type(scope)
         with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
             executor.submit(
@@ -275,9 +503,330 @@ class PlaylistWrapper:
                     "scope_id": int(scope_id),
                     "author_id": int(author_id),
                     "playlist_url": playlist_url,
-                    "tracks": json.dumps(tracks),
                 },
             )
+        if tracks is not None:
+            await self.replace_tracks(scope, playlist_id, scope_id, tracks)
+
+    def _track_values(
+        self,
+        scope_type: int,
+        playlist_id: int,
+        scope_id: int,
+        tracks: List[MutableMapping],
+        start: int = 0,
+    ) -> List[MutableMapping]:
+        return [
+            {
+                "scope_type": scope_type,
+                "playlist_id": int(playlist_id),
+                "scope_id": int(scope_id),
+                "ordinal": ordinal,
+                "uri": (track.get("info") or {}).get("uri"),
+                "track": encode_track(track),
+            }
+            for ordinal, track in enumerate(tracks, start=start)
+        ]
+
+    def read_tracks(
+        self,
+        scope: str,
+        playlist_id: int,
+        scope_id: int,
+        offset: int = 0,
+        limit: int = -1,
+    ) -> List[MutableMapping]:
+        """Read the tracks of a playlist, to be called from a worker thread.
+
+        Unlike :meth:`fetch_tracks` this blocks the calling thread.
+        """
+        return [
+            decode_track(row[0])
+            for row in self.database.cursor().execute(
+                self.statement.tracks_get,
+                {
+                    "scope_type": self.get_scope_type(scope),
+                    "playlist_id": int(playlist_id),
+                    "scope_id": int(scope_id),
+                    "offset": offset,
+                    "limit": limit,
+                },
+            )
+        ]
+
+    async def fetch_tracks(
+        self,
+        scope: str,
+        playlist_id: int,
+        scope_id: int,
+        offset: int = 0,
+        limit: int = -1,
+    ) -> List[MutableMapping]:
+        """Fetch the tracks of a playlist in order, optionally only a range of them.
+
+        Raises the database error rather than returning no tracks, the result may
+        be compared with newer tracks and saved back.
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(
+                self.read_tracks, scope, playlist_id, scope_id, offset, limit
+            )
+        return future.result()
+
+    async def fetch_track_identifiers(
+        self, scope: str, playlist_id: int, scope_id: int
+    ) -> Set[str]:
+        """Fetch the Lavalink track of all tracks in a playlist."""
+        scope_type = self.get_scope_type(scope)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(
+                self.database.cursor().execute,
+                self.statement.tracks_get,
+                {
+                    "scope_type": scope_type,
+                    "playlist_id": int(playlist_id),
+                    "scope_id": int(scope_id),
+                    "offset": 0,
+                    "limit": -1,
+                },
+            )
+        try:
+            row_result = future.result()
+        except Exception as exc:
+            debug_exc_log(log, exc, "Failed to fetch playlist tracks from database")
+            return set()
+        return {
+            track_id
+            async for row in AsyncIter(row_result)
+            if (track_id := decode_track_identifier(row[0]))
+        }
+
+    def _append_tracks(
+        self,
+        scope: str,
+        playlist_id: int,
+        scope_id: int,
+        tracks: List[MutableMapping],
+    ) -> int:
+        scope_type = self.get_scope_type(scope)
+        params = {
+            "scope_type": scope_type,
+            "playlist_id": int(playlist_id),
+            "scope_id": int(scope_id),
+        }
+        with self.database.transaction() as transaction:
+            (start,) = transaction.execute(
+                self.statement.tracks_next_ordinal, params
+            ).fetchone()
+            values = self._track_values(
+                scope_type, playlist_id, scope_id, tracks, start
+            )
+            transaction.executemany(self.statement.tracks_insert, values)
+            transaction.execute(
+                self.statement.update_summary,
+                dict(
+                    params,
+                    track_count=len(values),
+                    duration=sum(track_duration(t) for t in tracks),
+                ),
+            )
+        return len(values)
+
+    async def append_tracks(
+        self,
+        scope: str,
+        playlist_id: int,
+        scope_id: int,
+        tracks: List[MutableMapping],
+    ) -> int:
+        """Add tracks at the end of a playlist without touching the existing ones.
+
+        Returns how many tracks were added, raises the database error if the tracks
+        couldn't be saved.
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(
+                self._append_tracks, scope, playlist_id, scope_id, tracks
+            )
+        return future.result()
+
+    def _remove_tracks_by_uri(
+        self, scope: str, playlist_id: int, scope_id: int, uri: str
+    ) -> Tuple[int, int]:
+        params = {
+            "scope_type": self.get_scope_type(scope),
+            "playlist_id": int(playlist_id),
+            "scope_id": int(scope_id),
+        }
+        with self.database.transaction() as transaction:
+            removed = [
+                decode_track(row[0])
+                for row in transaction.execute(
+                    self.statement.tracks_get_uri, dict(params, uri=uri)
+                )
+            ]
+            if not removed:
+                return 0, 0
+            duration = sum(track_duration(t) for t in removed)
+            transaction.execute(self.statement.tracks_delete_uri, dict(params, uri=uri))
+            transaction.execute(
+                self.statement.update_summary,
+                dict(params, track_count=-len(removed), duration=-duration),
+            )
+        return len(removed), duration
+
+    async def remove_tracks_by_uri(
+        self, scope: str, playlist_id: int, scope_id: int, uri: str
+    ) -> Tuple[int, int]:
+        """Remove all tracks with the provided uri.
+
+        Returns how many tracks were removed and their total length, raises the
+        database error if the tracks couldn't be removed.
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(
+                self._remove_tracks_by_uri, scope, playlist_id, scope_id, uri
+            )
+        return future.result()
+
+    def _replace_tracks(
+        self,
+        scope: str,
+        playlist_id: int,
+        scope_id: int,
+        tracks: List[MutableMapping],
+    ) -> None:
+        scope_type = self.get_scope_type(scope)
+        params = {
+            "scope_type": scope_type,
+            "playlist_id": int(playlist_id),
+            "scope_id": int(scope_id),
+        }
+        with self.database.transaction() as transaction:
+            transaction.execute(self.statement.tracks_delete_all, params)
+            transaction.executemany(
+                self.statement.tracks_insert,
+                self._track_values(scope_type, playlist_id, scope_id, tracks),
+            )
+            transaction.execute(
+                self.statement.set_summary,
+                dict(
+                    params,
+                    track_count=len(tracks),
+                    duration=sum(track_duration(t) for t in tracks),
+                ),
+            )
+
+    async def replace_tracks(
+        self,
+        scope: str,
+        playlist_id: int,
+        scope_id: int,
+        tracks: List[MutableMapping],
+    ) -> None:
+        """Replace all the tracks of a playlist.
+
+        Raises the database error if the tracks couldn't be saved, the playlist
+        keeps its previous tracks then.
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(
+                self._replace_tracks, scope, playlist_id, scope_id, tracks
+            )
+        future.result()
+
+    def _copy_tracks(self, params: MutableMapping) -> None:
+        with self.database.transaction() as transaction:
+            transaction.execute(
+                self.statement.tracks_delete_all,
+                {
+                    "scope_type": params["to_scope_type"],
+                    "playlist_id": params["to_playlist_id"],
+                    "scope_id": params["to_scope_id"],
+                },
+            )
+            transaction.execute(self.statement.tracks_copy, params)
+            transaction.execute(self.statement.copy_summary, params)
+
+    async def copy_tracks(
+        self,
+        scope: str,
+        playlist_id: int,
+        scope_id: int,
+        to_scope: str,
+        to_playlist_id: int,
+        to_scope_id: int,
+    ) -> None:
+        """Replace the tracks of a playlist with the tracks of another one.
+
+        The stored tracks are copied as is, without decoding them. Raises the
+        database error if the tracks couldn't be copied.
+        """
+        params = {
+            "scope_type": self.get_scope_type(scope),
+            "playlist_id": int(playlist_id),
+            "scope_id": int(scope_id),
+            "to_scope_type": self.get_scope_type(to_scope),
+            "to_playlist_id": int(to_playlist_id),
+            "to_scope_id": int(to_scope_id),
+        }
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self._copy_tracks, params)
+        future.result()
+
+    def _migrate_track_encoding(self) -> None:
+        values = [
+            {
+                "scope_type": scope_type,
+                "playlist_id": playlist_id,
+                "scope_id": scope_id,
+                "tracks": encode_tracks(json.loads(tracks)),
+            }
+            for scope_type, playlist_id, scope_id, tracks in self.database.cursor().execute(
+                self.statement.get_legacy_tracks
+            )
+        ]
+        if values:
+            with self.database.transaction() as transaction:
+                transaction.executemany(self.statement.update_tracks, values)
+
+    async def migrate_track_encoding(self) -> None:
+        """Re-encode all playlists still storing their tracks as JSON.
+
+        Raises the database error if the playlists couldn't be migrated.
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self._migrate_track_encoding)
+        future.result()
+
+    def _migrate_to_playlist_tracks(self) -> None:
+        rows = self.database.cursor().execute(self.statement.get_embedded_tracks)
+        for scope_type, playlist_id, scope_id, tracks in rows.fetchall():
+            params = {
+                "scope_type": scope_type,
+                "playlist_id": playlist_id,
+                "scope_id": scope_id,
+            }
+            with self.database.transaction() as transaction:
+                transaction.execute(self.statement.tracks_delete_all, params)
+                transaction.executemany(
+                    self.statement.tracks_insert,
+                    self._track_values(
+                        scope_type, playlist_id, scope_id, decode_tracks(tracks)
+                    ),
+                )
+                transaction.execute(
+                    self.statement.update_tracks, dict(params, tracks=None)
+                )
+
+    async def migrate_to_playlist_tracks(self) -> None:
+        """Move tracks stored in the playlists table to the playlist_tracks table.
+
+        Raises the database error if the playlists couldn't be migrated.
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self._migrate_to_playlist_tracks)
+        future.result()
 
     async def handle_playlist_user_id_deletion(self, user_id: int):
         with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
@@ -286,3 +835,42 @@ class PlaylistWrapper:
                 self.statement.drop_user_playlists,
                 {"user_id": user_id},
             )
+
+    def _rebuild_summaries(self) -> None:
+        summaries = {}
+        for scope_type, playlist_id, scope_id, track in self.database.cursor().execute(
+            self.statement.tracks_get_all
+        ):
+            count, duration = summaries.get((scope_type, playlist_id, scope_id), (0, 0))
+            summaries[(scope_type, playlist_id, scope_id)] = (
+                count + 1,
+                duration + track_duration(decode_track(track)),
+            )
+        if not summaries:
+            return
+        with self.database.transaction() as transaction:
+            transaction.executemany(
+                self.statement.set_summary,
+                [
+                    {
+                        "scope_type": scope_type,
+                        "playlist_id": playlist_id,
+                        "scope_id": scope_id,
+                        "track_count": count,
+                        "duration": duration,
+                    }
+                    for (scope_type, playlist_id, scope_id), (
+                        count,
+                        duration,
+                    ) in summaries.items()
+                ],
+            )
+
+    async def rebuild_summaries(self) -> None:
+        """Recompute the stored track count and duration of every playlist.
+
+        Raises the database error if the summaries couldn't be saved.
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self._rebuild_summaries)
+        future.result()
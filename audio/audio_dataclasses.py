@@ -7,11 +7,13 @@ import posixpath
 import re
 
 from pathlib import Path, PosixPath, WindowsPath
+from types import MappingProxyType
 from typing import (
     AsyncIterator,
     Callable,
     Final,
     Iterator,
+    Mapping,
     MutableMapping,
     Optional,
     Pattern,
@@ -471,7 +473,7 @@ class Query:
             for key, val in kwargs.items():
                 setattr(query, key, val)
             return query
-        elif isinstance(query, lavalink.Track):
+        elif isinstance(query, (lavalink.Track, QueueEntry)):
             possible_values["stream"] = query.is_stream
             query = query.uri
 
@@ -739,3 +741,138 @@ class Query:
         if not isinstance(other, Query):
             return NotImplemented
         return self.to_string_user() >= other.to_string_user()
+
+
+_TRACK_INFO_KEYS: Final[Tuple[str, ...]] = (
+    "identifier",
+    "isSeekable",
+    "author",
+    "length",
+    "isStream",
+    "position",
+    "title",
+    "uri",
+)
+_MISSING: Final[object] = object()
+
+
+class QueueEntry:
+    """Memory compact stand-in for a queued :class:`lavalink.Track`.
+
+    Unlike a Track it keeps a single tuple of the info values instead of an info dict plus
+    a copy of each value as an attribute.
+    It exposes the same attributes as a Track so it can sit in ``player.queue``,
+    use :meth:`QueueEntry.to_track` to get a full Track back.
+    """
+
+    __slots__ = (
+        "track_identifier",
+        "requester",
+        "extras",
+        "start_timestamp",
+        "_values",
+        "_other",
+    )
+
+    def __init__(
+        self,
+        track_identifier: str,
+        info: MutableMapping,
+        extras: MutableMapping = None,
+        requester=None,
+        start_timestamp: int = 0,
+    ):
+        self.track_identifier = track_identifier
+        self.requester = requester
+        self.extras = extras if extras is not None else {}
+        self.start_timestamp = start_timestamp
+        self._values = tuple(info.get(k, _MISSING) for k in _TRACK_INFO_KEYS)
+        self._other = {
+            k: v for k, v in info.items() if k not in _TRACK_INFO_KEYS
+        } or None
+
+    def __repr__(self):
+        return f"<QueueEntry title={self.title!r} uri={self.uri!r}>"
+
+    def __eq__(self, other):
+        # lavalink.Track only compares to other Tracks, it defers to this for entries.
+        if not isinstance(other, (QueueEntry, lavalink.Track)):
+            return NotImplemented
+        return self.track_identifier == other.track_identifier
+
+    def __hash__(self):
+        return hash(self.track_identifier)
+
+    @classmethod
+    def from_track(cls, track: Union[lavalink.Track, "QueueEntry"]) -> "QueueEntry":
+        if isinstance(track, QueueEntry):
+            return track
+        return cls(
+            track.track_identifier,
+            track._info,
+            track.extras,
+            track.requester,
+            getattr(track, "start_timestamp", 0),
+        )
+
+    def to_track(self) -> lavalink.Track:
+        """Materialize a full Track object from this entry."""
+        track = lavalink.Track(
+            data={
+                "track": self.track_identifier,
+                "info": dict(self._info),
+                "extras": self.extras,
+            }
+        )
+        track.requester = self.requester
+        track.start_timestamp = self.start_timestamp
+        return track
+
+    def _get(self, index: int, default=None):
+        value = self._values[index]
+        return default if value is _MISSING else value
+
+    @property
+    def _info(self) -> Mapping:
+        """A read-only view of the track info, rebuilt on every access.
+
+        Entries are immutable, use :meth:`QueueEntry.to_track` for a Track to edit.
+        """
+        info = {
+            k: v for k, v in zip(_TRACK_INFO_KEYS, self._values) if v is not _MISSING
+        }
+        if self._other:
+            info.update(self._other)
+        return MappingProxyType(info)
+
+    @property
+    def seekable(self) -> bool:
+        return self._get(1, False)
+
+    @property
+    def author(self) -> Optional[str]:
+        return self._get(2)
+
+    @property
+    def length(self) -> int:
+        return self._get(3, 0)
+
+    @property
+    def is_stream(self) -> bool:
+        return self._get(4, False)
+
+    @property
+    def position(self) -> Optional[int]:
+        return self._get(5)
+
+    @property
+    def title(self) -> Optional[str]:
+        return self._get(6)
+
+    @property
+    def uri(self) -> Optional[str]:
+        return self._get(7)
+
+    @property
+    def thumbnail(self) -> Optional[str]:
+        return lavalink.Track.thumbnail.fget(self)
@@ -14,6 +14,9 @@ from redbot.core.commands import Cog
 from redbot.core.data_manager import cog_data_path
 from redbot.core.i18n import Translator, cog_i18n
 
+from ..guild_settings import GuildSettingsCache
+from ..jvm_sizing import JvmSizer
+from ..node_pool import NodePool
 from ..utils import PlaylistScope
 from . import abc, cog_utils, commands, events, tasks, utilities
 from .cog_utils import CompositeMetaClass
@@ -52,18 +55,32 @@ class Audio(
         self.api_interface = None
         self.player_manager = None
         self.playlist_api = None
+        self.daily_playlist_recorder = None
+        self.playlist_refresher = None
+        self.node_pool = NodePool(self.bot, self.config, self)
+        self.jvm_sizer = JvmSizer(self.config, self.node_pool)
         self.local_folder_current_path = None
         self.db_conn = None
 
         self._error_counter = Counter()
         self._error_timer = {}
         self._disconnected_players = {}
-        self._daily_playlist_cache = {}
+        self._idle_since = {}
+        self._idle_timers = []
+        self._idle_timers_armed = {}
+        self._idle_timers_updated = asyncio.Event()
+        self._event_side_effects = {}
+        self._event_side_effect_tasks = {}
+        self._presence_update_task = None
+        self._presence_update_players = None
+        self._queue_lookahead_tasks = {}
         self._daily_global_playlist_cache = {}
-        self._persist_queue_cache = {}
-        self._nsfw_cache = {}
-        self._dj_status_cache = {}
-        self._dj_role_cache = {}
+        self._global_keyword_filter = None
+        self._icy_cache = {}
+        self._icy_tasks = {}
+        self._stream_players = {}
+        self._player_streams = {}
+        self._player_snapshot = (0, [])
         self.skip_votes = {}
         self.play_lock = {}
 
@@ -97,6 +114,7 @@ class Audio(
             cache_level=0,
             cache_age=365,
             daily_playlists=False,
+            playlist_refresh=False,
             global_db_enabled=True,
             global_db_get_timeout=5,
             status=False,
@@ -106,6 +124,10 @@ class Audio(
             url_keyword_blacklist=[],
             url_keyword_whitelist=[],
             java_exc_path="java",
+            lavalink_nodes={},
+            jvm_heap_override=0,
+            jvm_profile={},
+            jvm_player_peaks={},
             **self._default_lavalink_settings,
         )
 
@@ -153,5 +175,6 @@ class Audio(
         self.config.init_custom(PlaylistScope.USER.value, 2)
         self.config.register_custom(PlaylistScope.USER.value, **_playlist)
         self.config.register_guild(**default_guild)
+        self.guild_settings = GuildSettingsCache(self.config, default_guild)
         self.config.register_global(**default_global)
         self.config.register_user(country_code=None)
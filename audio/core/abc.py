@@ -10,6 +10,9 @@ from typing import (
     Set,
     TYPE_CHECKING,
     Any,
+    Awaitable,
+    Callable,
+    Deque,
     List,
     Mapping,
     MutableMapping,
@@ -28,12 +31,18 @@ from redbot.core.commands import Context
 from redbot.core.utils.dbtools import APSWConnectionWrapper
 
 if TYPE_CHECKING:
+    from ..apis.daily_playlists import DailyPlaylistRecorder
     from ..apis.interface import AudioAPIInterface
     from ..apis.playlist_interface import Playlist
+    from ..apis.playlist_refresher import PlaylistRefresher
     from ..apis.playlist_wrapper import PlaylistWrapper
     from ..audio_dataclasses import LocalPath, Query
     from ..equalizer import Equalizer
+    from ..guild_settings import GuildSettingsCache
+    from ..jvm_sizing import JvmSizer
     from ..manager import ServerManager
+    from ..node_pool import NodePool
+    from ..utils import KeywordFilter, QueueStats
 
 
 class MixinMeta(ABC):
@@ -46,21 +55,38 @@ class MixinMeta(ABC):
     config: Config
     api_interface: Optional["AudioAPIInterface"]
     player_manager: Optional["ServerManager"]
+    node_pool: "NodePool"
+    jvm_sizer: "JvmSizer"
     playlist_api: Optional["PlaylistWrapper"]
+    daily_playlist_recorder: Optional["DailyPlaylistRecorder"]
+    playlist_refresher: Optional["PlaylistRefresher"]
+    guild_settings: "GuildSettingsCache"
     local_folder_current_path: Optional[Path]
     db_conn: Optional[APSWConnectionWrapper]
     session: aiohttp.ClientSession
 
     skip_votes: MutableMapping[discord.Guild, List[discord.Member]]
     play_lock: MutableMapping[int, bool]
-    _daily_playlist_cache: MutableMapping[int, bool]
     _daily_global_playlist_cache: MutableMapping[int, bool]
-    _persist_queue_cache: MutableMapping[int, bool]
-    _dj_status_cache: MutableMapping[int, Optional[bool]]
-    _dj_role_cache: MutableMapping[int, Optional[int]]
-    _nsfw_cache: MutableMapping[int, bool]
+    _global_keyword_filter: Optional["KeywordFilter"]
+    _icy_cache: MutableMapping[str, Tuple[float, Optional[str]]]
+    _icy_tasks: MutableMapping[str, asyncio.Task]
+    _stream_players: MutableMapping[str, Set[int]]
+    _player_streams: MutableMapping[int, str]
+    _player_snapshot: Tuple[
+        float, List[Tuple[str, datetime.datetime, Optional[lavalink.Track], bool]]
+    ]
     _error_timer: MutableMapping[int, float]
     _disconnected_players: MutableMapping[int, bool]
+    _idle_since: MutableMapping[int, float]
+    _idle_timers: List[Tuple[float, float, int, str]]
+    _idle_timers_armed: MutableMapping[int, Tuple[float, float, int, str]]
+    _idle_timers_updated: asyncio.Event
+    _event_side_effects: MutableMapping[int, Deque[Callable[[], Awaitable[Any]]]]
+    _event_side_effect_tasks: MutableMapping[int, asyncio.Task]
+    _presence_update_task: Optional[asyncio.Task]
+    _presence_update_players: Optional[List[lavalink.Player]]
+    _queue_lookahead_tasks: MutableMapping[int, asyncio.Task]
     global_api_user: MutableMapping[str, Any]
 
     cog_cleaned_up: bool
@@ -129,16 +155,36 @@ class MixinMeta(ABC):
     async def lavalink_attempt_connect(self, timeout: int = 50) -> None:
         raise NotImplementedError()
 
+    @abstractmethod
+    async def update_idle_timers(self, guild: discord.Guild) -> None:
+        raise NotImplementedError()
+
     @abstractmethod
     async def player_automated_timer(self) -> None:
         raise NotImplementedError()
 
+    @abstractmethod
+    async def _run_idle_timer(self, guild_id: int, since: float, action: str) -> None:
+        raise NotImplementedError()
+
     @abstractmethod
     async def lavalink_event_handler(
         self, player: lavalink.Player, event_type: lavalink.LavalinkEvents, extra
     ) -> None:
         raise NotImplementedError()
 
+    @abstractmethod
+    def queue_event_side_effect(
+        self, guild_id: int, func: Callable[..., Awaitable[Any]], *args, **kwargs
+    ) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def queue_presence_update(
+        self, delay: float = 0, player: Optional[lavalink.Player] = None
+    ) -> None:
+        raise NotImplementedError()
+
     @abstractmethod
     async def lavalink_update_handler(
         self, player: lavalink.Player, event_type: lavalink.enums.PlayerState, extra
@@ -198,6 +244,12 @@ class MixinMeta(ABC):
     ) -> bool:
         raise NotImplementedError()
 
+    @abstractmethod
+    async def _get_keyword_filter(
+        self, config: Config, guild: Optional[discord.Guild]
+    ) -> "KeywordFilter":
+        raise NotImplementedError()
+
     @abstractmethod
     def is_track_length_allowed(
         self, track: Union[lavalink.Track, int], maxlength: int
@@ -277,6 +329,22 @@ class MixinMeta(ABC):
     async def queue_duration(self, ctx: commands.Context) -> int:
         raise NotImplementedError()
 
+    @abstractmethod
+    def materialize_queue_head(self, player: lavalink.Player) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def prepare_queue_ahead(self, player: lavalink.Player) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def cancel_queue_ahead(self, guild_id: int) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def get_queue_stats(self, player: lavalink.Player) -> QueueStats:
+        raise NotImplementedError()
+
     @abstractmethod
     async def track_remaining_duration(self, ctx: commands.Context) -> int:
         raise NotImplementedError()
@@ -343,7 +411,7 @@ class MixinMeta(ABC):
         ctx: commands.Context,
         player: lavalink.player_manager.Player,
         playlist: "Playlist",
-    ) -> Tuple[List[lavalink.Track], List[lavalink.Track], "Playlist"]:
+    ) -> Tuple[List[MutableMapping], List[MutableMapping], "Playlist"]:
         raise NotImplementedError()
 
     @abstractmethod
@@ -465,6 +533,21 @@ class MixinMeta(ABC):
     async def command_stop(self, ctx: commands.Context):
         raise NotImplementedError()
 
+    @abstractmethod
+    def get_player_snapshot(
+        self,
+    ) -> List[Tuple[str, datetime.datetime, Optional[lavalink.Track], bool]]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def _build_audiostats_page(
+        self,
+        ctx: commands.Context,
+        snapshot: List[Tuple[str, datetime.datetime, Optional[lavalink.Track], bool]],
+        page_num: int,
+    ) -> discord.Embed:
+        raise NotImplementedError()
+
     @abstractmethod
     async def _build_queue_page(
         self,
@@ -528,6 +611,33 @@ class MixinMeta(ABC):
     ) -> None:
         raise NotImplementedError()
 
+    @abstractmethod
+    async def _resolve_playlist_entries(
+        self,
+        ctx: commands.Context,
+        player: lavalink.player_manager.Player,
+        entries: List[Union[str, MutableMapping]],
+    ) -> List[MutableMapping]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def _load_lines_playlist(
+        self,
+        ctx: commands.Context,
+        player: lavalink.player_manager.Player,
+        file_url: str,
+        scope: str,
+        author: Union[discord.User, discord.Member],
+        guild: Union[discord.Guild],
+    ) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def _download_playlist_lines(
+        self, ctx: commands.Context, playlist: "Playlist"
+    ) -> None:
+        raise NotImplementedError()
+
     @abstractmethod
     async def _load_v2_playlist(
         self,
@@ -554,6 +664,10 @@ class MixinMeta(ABC):
     async def restore_players(self) -> bool:
         raise NotImplementedError()
 
+    @abstractmethod
+    async def _restore_player(self, guild: discord.Guild, track_data: List) -> bool:
+        raise NotImplementedError()
+
     @abstractmethod
     async def command_skip(self, ctx: commands.Context, skip_to_track: int = None):
         raise NotImplementedError()
@@ -566,5 +680,19 @@ class MixinMeta(ABC):
     async def icyparser(self, url: str) -> Optional[str]:
         raise NotImplementedError()
 
+    @abstractmethod
+    def update_playing_stream(
+        self, guild_id: int, track: Optional[lavalink.Track]
+    ) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def get_icy_title(self, url: str) -> Optional[str]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def _icy_refresher(self, url: str) -> None:
+        raise NotImplementedError()
+
     async def self_deafen(self, player: lavalink.Player) -> None:
         raise NotImplementedError()
@@ -44,11 +44,8 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
     @commands.admin_or_permissions(manage_guild=True)
     async def command_audioset_nsfw(self, ctx: commands.Context):
         """Toggle whether NSFW are allowed in the server."""
-        nsfw = self._nsfw_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).nsfw_queries()
-        )
-        await self.config.guild(ctx.guild).nsfw_queries.set(not nsfw)
-        self._nsfw_cache[ctx.guild.id] = not nsfw
+        nsfw = self.guild_settings.get(ctx.guild).nsfw_queries
+        await self.guild_settings.set(ctx.guild, "nsfw_queries", not nsfw)
         await self.send_embed_msg(
             ctx,
             title=_("Setting Changed"),
@@ -83,6 +80,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
                 exists = True
             else:
                 whitelist.append(keyword)
+        self._global_keyword_filter = None
         if exists:
             return await self.send_embed_msg(
                 ctx, title=_("Keyword already in the whitelist.")
@@ -134,6 +132,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
         if not whitelist:
             return await self.send_embed_msg(ctx, title=_("Nothing in the whitelist."))
         await self.config.url_keyword_whitelist.clear()
+        self._global_keyword_filter = None
         return await self.send_embed_msg(
             ctx,
             title=_("Whitelist Modified"),
@@ -156,6 +155,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
                 exists = False
             else:
                 whitelist.remove(keyword)
+        self._global_keyword_filter = None
         if not exists:
             return await self.send_embed_msg(
                 ctx, title=_("Keyword already in the whitelist.")
@@ -187,6 +187,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
                 exists = True
             else:
                 blacklist.append(keyword)
+        self._global_keyword_filter = None
         if exists:
             return await self.send_embed_msg(
                 ctx, title=_("Keyword already in the blacklist.")
@@ -238,6 +239,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
         if not blacklist:
             return await self.send_embed_msg(ctx, title=_("Nothing in the blacklist."))
         await self.config.url_keyword_blacklist.clear()
+        self._global_keyword_filter = None
         return await self.send_embed_msg(
             ctx,
             title=_("Blacklist Modified"),
@@ -260,6 +262,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
                 exists = False
             else:
                 blacklist.remove(keyword)
+        self._global_keyword_filter = None
         if not exists:
             return await self.send_embed_msg(
                 ctx, title=_("Keyword is not in the blacklist.")
@@ -295,6 +298,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
                 exists = True
             else:
                 whitelist.append(keyword)
+        await self.guild_settings.refresh(ctx.guild)
         if exists:
             return await self.send_embed_msg(
                 ctx, title=_("Keyword already in the whitelist.")
@@ -341,7 +345,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
         whitelist = await self.config.guild(ctx.guild).url_keyword_whitelist()
         if not whitelist:
             return await self.send_embed_msg(ctx, title=_("Nothing in the whitelist."))
-        await self.config.guild(ctx.guild).url_keyword_whitelist.clear()
+        await self.guild_settings.clear(ctx.guild, "url_keyword_whitelist")
         return await self.send_embed_msg(
             ctx,
             title=_("Whitelist Modified"),
@@ -362,6 +366,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
                 exists = False
             else:
                 whitelist.remove(keyword)
+        await self.guild_settings.refresh(ctx.guild)
         if not exists:
             return await self.send_embed_msg(
                 ctx, title=_("Keyword already in the whitelist.")
@@ -394,6 +399,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
                 exists = True
             else:
                 blacklist.append(keyword)
+        await self.guild_settings.refresh(ctx.guild)
         if exists:
             return await self.send_embed_msg(
                 ctx, title=_("Keyword already in the blacklist.")
@@ -440,7 +446,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
         blacklist = await self.config.guild(ctx.guild).url_keyword_blacklist()
         if not blacklist:
             return await self.send_embed_msg(ctx, title=_("Nothing in the blacklist."))
-        await self.config.guild(ctx.guild).url_keyword_blacklist.clear()
+        await self.guild_settings.clear(ctx.guild, "url_keyword_blacklist")
         return await self.send_embed_msg(
             ctx,
             title=_("Blacklist Modified"),
@@ -461,6 +467,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
                 exists = False
             else:
                 blacklist.remove(keyword)
+        await self.guild_settings.refresh(ctx.guild)
         if not exists:
             return await self.send_embed_msg(
                 ctx, title=_("Keyword is not in the blacklist.")
@@ -489,13 +496,13 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
         msg = _("Auto-play when queue ends: {true_or_false}.").format(
             true_or_false=_("Enabled") if not autoplay else _("Disabled")
         )
-        await self.config.guild(ctx.guild).auto_play.set(not autoplay)
+        await self.guild_settings.set(ctx.guild, "auto_play", not autoplay)
         if autoplay is not True and repeat is True:
             msg += _("\nRepeat has been disabled.")
-            await self.config.guild(ctx.guild).repeat.set(False)
+            await self.guild_settings.set(ctx.guild, "repeat", False)
         if autoplay is not True and disconnect is True:
             msg += _("\nAuto-disconnecting at queue end has been disabled.")
-            await self.config.guild(ctx.guild).disconnect.set(False)
+            await self.guild_settings.set(ctx.guild, "disconnect", False)
 
         await self.send_embed_msg(ctx, title=_("Setting Changed"), description=msg)
         if self._player_check(ctx):
@@ -570,7 +577,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
                 ),
             )
         try:
-            tracks = playlist.tracks
+            tracks = await playlist.load_tracks()
             if not tracks:
                 return await self.send_embed_msg(
                     ctx,
@@ -582,7 +589,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
             playlist_data = dict(
                 enabled=True, id=playlist.id, name=playlist.name, scope=scope
             )
-            await self.config.guild(ctx.guild).autoplaylist.set(playlist_data)
+            await self.guild_settings.set(ctx.guild, "autoplaylist", playlist_data)
         except RuntimeError:
             return await self.send_embed_msg(
                 ctx,
@@ -619,7 +626,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
     async def command_audioset_autoplay_reset(self, ctx: commands.Context):
         """Resets auto-play to the default playlist."""
         playlist_data = dict(enabled=False, id=None, name=None, scope=None)
-        await self.config.guild(ctx.guild).autoplaylist.set(playlist_data)
+        await self.guild_settings.set(ctx.guild, "autoplaylist", playlist_data)
         return await self.send_embed_msg(
             ctx,
             title=_("Setting Changed"),
@@ -654,11 +661,8 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
 
         Daily queues creates a playlist for all tracks played today.
         """
-        daily_playlists = self._daily_playlist_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).daily_playlists()
-        )
-        await self.config.guild(ctx.guild).daily_playlists.set(not daily_playlists)
-        self._daily_playlist_cache[ctx.guild.id] = not daily_playlists
+        daily_playlists = self.guild_settings.get(ctx.guild).daily_playlists
+        await self.guild_settings.set(ctx.guild, "daily_playlists", not daily_playlists)
         await self.send_embed_msg(
             ctx,
             title=_("Setting Changed"),
@@ -684,9 +688,9 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
         )
         if disconnect is not True and autoplay is True:
             msg += _("\nAuto-play has been disabled.")
-            await self.config.guild(ctx.guild).auto_play.set(False)
+            await self.guild_settings.set(ctx.guild, "auto_play", False)
 
-        await self.config.guild(ctx.guild).disconnect.set(not disconnect)
+        await self.guild_settings.set(ctx.guild, "disconnect", not disconnect)
 
         await self.send_embed_msg(ctx, title=_("Setting Changed"), description=msg)
 
@@ -698,9 +702,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
 
         DJ mode allows users with the DJ role to use audio commands.
         """
-        dj_role = self._dj_role_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_role()
-        )
+        dj_role = self.guild_settings.get(ctx.guild).dj_role
         dj_role = ctx.guild.get_role(dj_role)
         if dj_role is None:
             await self.send_embed_msg(
@@ -719,11 +721,8 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
                 return await self.send_embed_msg(
                     ctx, title=_("Response timed out, try again later.")
                 )
-        dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
-        )
-        await self.config.guild(ctx.guild).dj_enabled.set(not dj_enabled)
-        self._dj_status_cache[ctx.guild.id] = not dj_enabled
+        dj_enabled = self.guild_settings.get(ctx.guild).dj_enabled
+        await self.guild_settings.set(ctx.guild, "dj_enabled", not dj_enabled)
         await self.send_embed_msg(
             ctx,
             title=_("Setting Changed"),
@@ -767,8 +766,9 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
                 ),
             )
 
-        await self.config.guild(ctx.guild).emptydc_timer.set(seconds)
-        await self.config.guild(ctx.guild).emptydc_enabled.set(enabled)
+        await self.guild_settings.set(ctx.guild, "emptydc_timer", seconds)
+        await self.guild_settings.set(ctx.guild, "emptydc_enabled", enabled)
+        await self.update_idle_timers(ctx.guild)
 
     @command_audioset.command(name="emptypause")
     @commands.guild_only()
@@ -797,8 +797,9 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
                     num_seconds=self.get_time_string(seconds)
                 ),
             )
-        await self.config.guild(ctx.guild).emptypause_timer.set(seconds)
-        await self.config.guild(ctx.guild).emptypause_enabled.set(enabled)
+        await self.guild_settings.set(ctx.guild, "emptypause_timer", seconds)
+        await self.guild_settings.set(ctx.guild, "emptypause_enabled", enabled)
+        await self.update_idle_timers(ctx.guild)
 
     @command_audioset.command(name="lyrics")
     @commands.guild_only()
@@ -806,7 +807,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
     async def command_audioset_lyrics(self, ctx: commands.Context):
         """Prioritise tracks with lyrics."""
         prefer_lyrics = await self.config.guild(ctx.guild).prefer_lyrics()
-        await self.config.guild(ctx.guild).prefer_lyrics.set(not prefer_lyrics)
+        await self.guild_settings.set(ctx.guild, "prefer_lyrics", not prefer_lyrics)
         await self.send_embed_msg(
             ctx,
             title=_("Setting Changed"),
@@ -844,8 +845,8 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
                 ),
             )
 
-        await self.config.guild(ctx.guild).jukebox_price.set(price)
-        await self.config.guild(ctx.guild).jukebox.set(jukebox)
+        await self.guild_settings.set(ctx.guild, "jukebox_price", price)
+        await self.guild_settings.set(ctx.guild, "jukebox", jukebox)
 
     @command_audioset.command(name="localpath")
     @commands.is_owner()
@@ -964,7 +965,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
                     seconds=self.get_time_string(seconds)
                 ),
             )
-        await self.config.guild(ctx.guild).maxlength.set(seconds)
+        await self.guild_settings.set(ctx.guild, "maxlength", seconds)
 
     @command_audioset.command(name="notify")
     @commands.guild_only()
@@ -972,7 +973,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
     async def command_audioset_notify(self, ctx: commands.Context):
         """Toggle track announcement and other bot messages."""
         notify = await self.config.guild(ctx.guild).notify()
-        await self.config.guild(ctx.guild).notify.set(not notify)
+        await self.guild_settings.set(ctx.guild, "notify", not notify)
         await self.send_embed_msg(
             ctx,
             title=_("Setting Changed"),
@@ -987,7 +988,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
     async def command_audioset_auto_deafen(self, ctx: commands.Context):
         """Toggle whether the bot will be auto deafened upon joining the voice channel."""
         auto_deafen = await self.config.guild(ctx.guild).auto_deafen()
-        await self.config.guild(ctx.guild).auto_deafen.set(not auto_deafen)
+        await self.guild_settings.set(ctx.guild, "auto_deafen", not auto_deafen)
         await self.send_embed_msg(
             ctx,
             title=_("Setting Changed"),
@@ -1023,11 +1024,8 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
         self, ctx: commands.Context, *, role_name: discord.Role
     ):
         """Set the role to use for DJ mode."""
-        await self.config.guild(ctx.guild).dj_role.set(role_name.id)
-        self._dj_role_cache[ctx.guild.id] = role_name.id
-        dj_role = self._dj_role_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_role()
-        )
+        await self.guild_settings.set(ctx.guild, "dj_role", role_name.id)
+        dj_role = self.guild_settings.get(ctx.guild).dj_role
         dj_role_obj = ctx.guild.get_role(dj_role)
         await self.send_embed_msg(
             ctx,
@@ -1294,7 +1292,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
     async def command_audioset_thumbnail(self, ctx: commands.Context):
         """Toggle displaying a thumbnail on audio messages."""
         thumbnail = await self.config.guild(ctx.guild).thumbnail()
-        await self.config.guild(ctx.guild).thumbnail.set(not thumbnail)
+        await self.guild_settings.set(ctx.guild, "thumbnail", not thumbnail)
         await self.send_embed_msg(
             ctx,
             title=_("Setting Changed"),
@@ -1335,8 +1333,8 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
                 ),
             )
 
-        await self.config.guild(ctx.guild).vote_percent.set(percent)
-        await self.config.guild(ctx.guild).vote_enabled.set(enabled)
+        await self.guild_settings.set(ctx.guild, "vote_percent", percent)
+        await self.guild_settings.set(ctx.guild, "vote_enabled", enabled)
 
     @command_audioset.command(name="youtubeapi")
     @commands.is_owner()
@@ -1395,7 +1393,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
             description=_("Country Code set to {country}.").format(country=country),
         )
 
-        await self.config.guild(ctx.guild).country_code.set(country)
+        await self.guild_settings.set(ctx.guild, "country_code", country)
 
     @command_audioset.command(name="mycountrycode")
     @commands.guild_only()
@@ -1571,11 +1569,8 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
 
         Persistent queues allows the current queue to be restored when the queue closes.
         """
-        persist_cache = self._persist_queue_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).persist_queue()
-        )
-        await self.config.guild(ctx.guild).persist_queue.set(not persist_cache)
-        self._persist_queue_cache[ctx.guild.id] = not persist_cache
+        persist_cache = self.guild_settings.get(ctx.guild).persist_queue
+        await self.guild_settings.set(ctx.guild, "persist_queue", not persist_cache)
         await self.send_embed_msg(
             ctx,
             title=_("Setting Changed"),
@@ -1584,6 +1579,24 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
             ),
         )
 
+    @command_audioset.command(name="playlistrefresh")
+    @commands.is_owner()
+    async def command_audioset_playlist_refresh(self, ctx: commands.Context):
+        """Toggle refreshing playlists saved from a URL in the background.
+
+        Playlists which haven't been updated for a week are refreshed from their URL \
+        during the night, Spotify playlists still need `[p]playlist update`.
+        """
+        playlist_refresh = await self.config.playlist_refresh()
+        await self.config.playlist_refresh.set(not playlist_refresh)
+        await self.send_embed_msg(
+            ctx,
+            title=_("Setting Changed"),
+            description=_("Background playlist refresh: {true_or_false}.").format(
+                true_or_false=_("Enabled") if not playlist_refresh else _("Disabled")
+            ),
+        )
+
     @command_audioset.command(name="restart")
     @commands.is_owner()
     async def command_audioset_restart(self, ctx: commands.Context):
@@ -33,9 +33,7 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
         if not self._player_check(ctx):
             return await self.send_embed_msg(ctx, title=_("Nothing playing."))
         else:
-            dj_enabled = self._dj_status_cache.setdefault(
-                ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
-            )
+            dj_enabled = self.guild_settings.get(ctx.guild).dj_enabled
             vote_enabled = await self.config.guild(ctx.guild).vote_enabled()
             player = lavalink.get_player(ctx.guild.id)
             can_skip = await self._can_instaskip(ctx, ctx.author)
@@ -78,6 +76,7 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
             await player.disconnect()
             self._ll_guild_updates.discard(ctx.guild.id)
             await self.api_interface.persistent_queue_api.drop(ctx.guild.id)
+            self.api_interface.clear_autoplay(ctx.guild.id)
 
     @commands.command(name="now")
     @commands.guild_only()
@@ -149,9 +148,7 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
 
         player.store("np_message", message)
 
-        dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
-        )
+        dj_enabled = self.guild_settings.get(ctx.guild).dj_enabled
         vote_enabled = await self.config.guild(ctx.guild).vote_enabled()
         if (
             (dj_enabled or vote_enabled)
@@ -201,9 +198,7 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
     @commands.bot_has_permissions(embed_links=True)
     async def command_pause(self, ctx: commands.Context):
         """Pause or resume a playing track."""
-        dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
-        )
+        dj_enabled = self.guild_settings.get(ctx.guild).dj_enabled
         if not self._player_check(ctx):
             return await self.send_embed_msg(ctx, title=_("Nothing playing."))
         player = lavalink.get_player(ctx.guild.id)
@@ -249,9 +244,7 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
         """Skip to the start of the previously played track."""
         if not self._player_check(ctx):
             return await self.send_embed_msg(ctx, title=_("Nothing playing."))
-        dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
-        )
+        dj_enabled = self.guild_settings.get(ctx.guild).dj_enabled
         vote_enabled = await self.config.guild(ctx.guild).vote_enabled()
         is_alone = await self.is_requester_alone(ctx)
         is_requester = await self.is_requester(ctx, ctx.author)
@@ -330,9 +323,7 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
 
         Accepts seconds or a value formatted like 00:00:00 (`hh:mm:ss`) or 00:00 (`mm:ss`).
         """
-        dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
-        )
+        dj_enabled = self.guild_settings.get(ctx.guild).dj_enabled
         vote_enabled = await self.config.guild(ctx.guild).vote_enabled()
         is_alone = await self.is_requester_alone(ctx)
         is_requester = await self.is_requester(ctx, ctx.author)
@@ -423,9 +414,7 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
     async def command_shuffle(self, ctx: commands.Context):
         """Toggle shuffle."""
         if ctx.invoked_subcommand is None:
-            dj_enabled = self._dj_status_cache.setdefault(
-                ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
-            )
+            dj_enabled = self.guild_settings.get(ctx.guild).dj_enabled
             can_skip = await self._can_instaskip(ctx, ctx.author)
             if dj_enabled and not can_skip:
                 return await self.send_embed_msg(
@@ -448,7 +437,7 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
                     )
 
             shuffle = await self.config.guild(ctx.guild).shuffle()
-            await self.config.guild(ctx.guild).shuffle.set(not shuffle)
+            await self.guild_settings.set(ctx.guild, "shuffle", not shuffle)
             await self.send_embed_msg(
                 ctx,
                 title=_("Setting Changed"),
@@ -468,9 +457,7 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
         Set this to disabled if you wish to avoid bumped songs being shuffled. This takes priority
         over `[p]shuffle`.
         """
-        dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
-        )
+        dj_enabled = self.guild_settings.get(ctx.guild).dj_enabled
         can_skip = await self._can_instaskip(ctx, ctx.author)
         if dj_enabled and not can_skip:
             return await self.send_embed_msg(
@@ -493,7 +480,7 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
                 )
 
         bumped = await self.config.guild(ctx.guild).shuffle_bumped()
-        await self.config.guild(ctx.guild).shuffle_bumped.set(not bumped)
+        await self.guild_settings.set(ctx.guild, "shuffle_bumped", not bumped)
         await self.send_embed_msg(
             ctx,
             title=_("Setting Changed"),
@@ -523,9 +510,7 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
             )
         if not player.current:
             return await self.send_embed_msg(ctx, title=_("Nothing playing."))
-        dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
-        )
+        dj_enabled = self.guild_settings.get(ctx.guild).dj_enabled
         vote_enabled = await self.config.guild(ctx.guild).vote_enabled()
         is_alone = await self.is_requester_alone(ctx)
         is_requester = await self.is_requester(ctx, ctx.author)
@@ -601,9 +586,7 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
     @commands.bot_has_permissions(embed_links=True)
     async def command_stop(self, ctx: commands.Context):
         """Stop playback and clear the queue."""
-        dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
-        )
+        dj_enabled = self.guild_settings.get(ctx.guild).dj_enabled
         vote_enabled = await self.config.guild(ctx.guild).vote_enabled()
         if not self._player_check(ctx):
             return await self.send_embed_msg(ctx, title=_("Nothing playing."))
@@ -655,6 +638,7 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
             await player.stop()
             await self.send_embed_msg(ctx, title=_("Stopping..."))
             await self.api_interface.persistent_queue_api.drop(ctx.guild.id)
+            self.api_interface.clear_autoplay(ctx.guild.id)
 
     @commands.command(name="summon")
     @commands.guild_only()
@@ -662,9 +646,7 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
     @commands.bot_has_permissions(embed_links=True)
     async def command_summon(self, ctx: commands.Context):
         """Summon the bot to a voice channel."""
-        dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
-        )
+        dj_enabled = self.guild_settings.get(ctx.guild).dj_enabled
         vote_enabled = await self.config.guild(ctx.guild).vote_enabled()
         is_alone = await self.is_requester_alone(ctx)
         is_requester = await self.is_requester(ctx, ctx.author)
@@ -708,7 +690,7 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
                     ),
                 )
             if not self._player_check(ctx):
-                await lavalink.connect(ctx.author.voice.channel)
+                await self.node_pool.connect(ctx.author.voice.channel)
                 player = lavalink.get_player(ctx.guild.id)
                 player.store("connect", datetime.datetime.utcnow())
                 await self.self_deafen(player)
@@ -739,9 +721,7 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
     @commands.bot_has_permissions(embed_links=True)
     async def command_volume(self, ctx: commands.Context, vol: int = None):
         """Set the volume, 1% - 150%."""
-        dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
-        )
+        dj_enabled = self.guild_settings.get(ctx.guild).dj_enabled
         can_skip = await self._can_instaskip(ctx, ctx.author)
         if not vol:
             vol = await self.config.guild(ctx.guild).volume()
@@ -773,11 +753,11 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
             vol = 0
         if vol > 150:
             vol = 150
-            await self.config.guild(ctx.guild).volume.set(vol)
+            await self.guild_settings.set(ctx.guild, "volume", vol)
             if self._player_check(ctx):
                 await lavalink.get_player(ctx.guild.id).set_volume(vol)
         else:
-            await self.config.guild(ctx.guild).volume.set(vol)
+            await self.guild_settings.set(ctx.guild, "volume", vol)
             if self._player_check(ctx):
                 await lavalink.get_player(ctx.guild.id).set_volume(vol)
         embed = discord.Embed(title=_("Volume:"), description=str(vol) + "%")
@@ -790,9 +770,7 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
     @commands.bot_has_permissions(embed_links=True)
     async def command_repeat(self, ctx: commands.Context):
         """Toggle repeat."""
-        dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
-        )
+        dj_enabled = self.guild_settings.get(ctx.guild).dj_enabled
         can_skip = await self._can_instaskip(ctx, ctx.author)
         if dj_enabled and not can_skip and not await self._has_dj_role(ctx, ctx.author):
             return await self.send_embed_msg(
@@ -818,10 +796,10 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
         msg += _("Repeat tracks: {true_or_false}.").format(
             true_or_false=_("Enabled") if not repeat else _("Disabled")
         )
-        await self.config.guild(ctx.guild).repeat.set(not repeat)
+        await self.guild_settings.set(ctx.guild, "repeat", not repeat)
         if repeat is not True and autoplay is True:
             msg += _("\nAuto-play has been disabled.")
-            await self.config.guild(ctx.guild).auto_play.set(False)
+            await self.guild_settings.set(ctx.guild, "auto_play", False)
 
         embed = discord.Embed(title=_("Setting Changed"), description=msg)
         await self.send_embed_msg(ctx, embed=embed)
@@ -835,9 +813,7 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
         self, ctx: commands.Context, index_or_url: Union[int, str]
     ):
         """Remove a specific track number from the queue."""
-        dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
-        )
+        dj_enabled = self.guild_settings.get(ctx.guild).dj_enabled
         if not self._player_check(ctx):
             return await self.send_embed_msg(ctx, title=_("Nothing playing."))
         player = lavalink.get_player(ctx.guild.id)
@@ -917,9 +893,7 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
     @commands.bot_has_permissions(embed_links=True)
     async def command_bump(self, ctx: commands.Context, index: int):
         """Bump a track number to the top of the queue."""
-        dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
-        )
+        dj_enabled = self.guild_settings.get(ctx.guild).dj_enabled
         if not self._player_check(ctx):
             return await self.send_embed_msg(ctx, title=_("Nothing playing."))
         player = lavalink.get_player(ctx.guild.id)
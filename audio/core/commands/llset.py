@@ -7,6 +7,8 @@ from redbot.core import commands
 from redbot.core.i18n import Translator
 from redbot.core.utils.chat_formatting import box
 
+from ...jvm_sizing import host_memory_mb, parse_heap_size
+from ...node_pool import is_node_ready, node_penalty
 from ..abc import MixinMeta
 from ..cog_utils import CompositeMetaClass
 
@@ -92,6 +94,93 @@ class LavalinkSetupCommands(MixinMeta, metaclass=CompositeMetaClass):
                     ).format(prefix=ctx.prefix),
                 )
 
+    @command_llsetup.command(name="heap")
+    async def command_llsetup_heap(self, ctx: commands.Context, heap_size: str = None):
+        """Set the heap size of the internal Lavalink server.
+
+        Use `auto` to size it from the host's memory and the recent player counts.
+        Enter nothing to see the current heap size.
+
+        Examples:
+        `[p]llset heap 1G`
+        `[p]llset heap 512M`
+        `[p]llset heap auto`
+        """
+        external = await self.config.use_external_lavalink()
+        if external:
+            return await self.send_embed_msg(
+                ctx,
+                title=_("Invalid Environment"),
+                description=_(
+                    "You cannot change the heap size of "
+                    "external Lavalink instances from the Audio Cog."
+                ),
+            )
+        if heap_size is None:
+            profile = await self.jvm_sizer.saved_profile()
+            override = await self.config.jvm_heap_override()
+            peaks = (await self.config.jvm_player_peaks()).values()
+            msg = _("Heap size:         [{heap}]\n").format(
+                heap=f"{profile.heap_mb}M" if profile else _("Not started")
+            )
+            msg += _("Garbage collector: [{gc}]\n").format(
+                gc=profile.gc if profile else _("Not started")
+            )
+            msg += _("Sizing:            [{sizing}]\n").format(
+                sizing=_("Manual") if override else _("Automatic")
+            )
+            msg += _("Host memory:       [{memory}]\n").format(
+                memory=f"{host_memory_mb()}M" if host_memory_mb() else _("Unknown")
+            )
+            msg += _("Weekly peak:       [{players} players]\n").format(
+                players=max(peaks, default=0)
+            )
+            if self.jvm_sizer.suggested_heap_mb:
+                msg += _("Suggested heap:    [{heap}M]\n").format(
+                    heap=self.jvm_sizer.suggested_heap_mb
+                )
+            return await self.send_embed_msg(ctx, description=box(msg, lang="ini"))
+        if heap_size.lower() == "auto":
+            await self.config.jvm_heap_override.clear()
+            description = _(
+                "The heap size of the internal Lavalink server will be picked "
+                "automatically."
+            )
+        else:
+            try:
+                heap_mb = parse_heap_size(heap_size)
+            except ValueError:
+                heap_mb = 0
+            memory = host_memory_mb()
+            if heap_mb < 256 or (memory is not None and heap_mb >= memory):
+                return await self.send_embed_msg(
+                    ctx,
+                    title=_("Invalid Heap Size"),
+                    description=_(
+                        "The heap size must be at least 256M and less than "
+                        "the host's memory."
+                    ),
+                )
+            await self.config.jvm_heap_override.set(heap_mb)
+            description = _(
+                "The internal Lavalink server will use a {heap}M heap."
+            ).format(heap=heap_mb)
+        await self.send_embed_msg(
+            ctx, title=_("Setting Changed"), description=description
+        )
+        try:
+            if self.player_manager is not None:
+                await self.player_manager.shutdown()
+            self.lavalink_restart_connect()
+        except ProcessLookupError:
+            await self.send_embed_msg(
+                ctx,
+                title=_("Failed To Shutdown Lavalink"),
+                description=_("Please reload Audio (`{prefix}reload audio`).").format(
+                    prefix=ctx.prefix
+                ),
+            )
+
     @command_llsetup.command(name="external")
     async def command_llsetup_external(self, ctx: commands.Context):
         """Toggle using external Lavalink servers."""
@@ -260,3 +349,97 @@ class LavalinkSetupCommands(MixinMeta, metaclass=CompositeMetaClass):
             await self.send_embed_msg(ctx.author, description=box(msg, lang="ini"))
         except discord.HTTPException:
             await ctx.send(_("I need to be able to DM you to send you this info."))
+
+    @command_llsetup.group(name="node")
+    async def command_llsetup_node(self, ctx: commands.Context):
+        """Manage the extra Lavalink nodes new players are spread across."""
+
+    @command_llsetup_node.command(name="add")
+    async def command_llsetup_node_add(
+        self,
+        ctx: commands.Context,
+        name: str.lower,
+        host: str,
+        password: str,
+        rest_port: int = 2333,
+        ws_port: int = 2333,
+    ):
+        """Add an external Lavalink node to the pool."""
+        if name == "main" or name in await self.config.lavalink_nodes():
+            return await self.send_embed_msg(
+                ctx,
+                title=_("Invalid Node Name"),
+                description=_("A node named `{name}` already exists.").format(
+                    name=name
+                ),
+            )
+        async with ctx.typing():
+            connected = await self.node_pool.add_node(
+                name,
+                {
+                    "host": host,
+                    "password": password,
+                    "rest_port": rest_port,
+                    "ws_port": ws_port,
+                },
+            )
+        if connected:
+            description = _("Node `{name}` connected to {host}.")
+        else:
+            description = _(
+                "Node `{name}` couldn't connect to {host} yet, "
+                "no players will be placed on it until it is available."
+            )
+        await self.send_embed_msg(
+            ctx,
+            title=_("Node Added"),
+            description=description.format(name=name, host=host),
+        )
+
+    @command_llsetup_node.command(name="remove", aliases=["delete", "del"])
+    async def command_llsetup_node_remove(self, ctx: commands.Context, name: str.lower):
+        """Remove a Lavalink node from the pool, moving its players to other nodes."""
+        if name not in await self.config.lavalink_nodes():
+            return await self.send_embed_msg(
+                ctx,
+                title=_("Node Not Found"),
+                description=_("There is no node named `{name}`.").format(name=name),
+            )
+        async with ctx.typing():
+            failed = await self.node_pool.remove_node(name)
+        footer = None
+        if failed:
+            footer = _("{num} players couldn't be moved and were stopped.").format(
+                num=failed
+            )
+        await self.send_embed_msg(
+            ctx,
+            title=_("Node Removed"),
+            description=_("Node `{name}` was removed.").format(name=name),
+            footer=footer,
+        )
+
+    @command_llsetup_node.command(name="list")
+    async def command_llsetup_node_list(self, ctx: commands.Context):
+        """List the Lavalink nodes and their load."""
+        names = self.node_pool.node_names()
+        if not names:
+            return await self.send_embed_msg(
+                ctx, title=_("No Lavalink node is connected.")
+            )
+        msg = ""
+        for node, name in names.items():
+            status = _("Ready") if is_node_ready(node) else _("Unavailable")
+            msg += _(
+                "[{name}]\nHost:    {host}\nStatus:  {status}\n"
+                "Players: {players}\nLoad:    {penalty:.2f}\n\n"
+            ).format(
+                name=name,
+                host=node.host,
+                status=status,
+                players=len(node.players),
+                penalty=node_penalty(node),
+            )
+        await self.send_embed_msg(
+            ctx, title=_("Lavalink Nodes"), description=box(msg, lang="ini")
+        )
@@ -1,4 +1,3 @@
-import datetime
 import heapq
 import logging
 import math
@@ -10,9 +9,7 @@ import lavalink
 
 from redbot.core import commands
 from redbot.core.i18n import Translator
-from redbot.core.utils import AsyncIter
-from redbot.core.utils.chat_formatting import humanize_number, pagify
-from redbot.core.utils.menus import DEFAULT_CONTROLS, menu
+from redbot.core.utils.menus import close_menu, menu, next_page, prev_page
 
 from ..abc import MixinMeta
 from ..cog_utils import CompositeMetaClass
@@ -43,51 +40,34 @@ class MiscellaneousCommands(MixinMeta, metaclass=CompositeMetaClass):
     @commands.bot_has_permissions(embed_links=True, add_reactions=True)
     async def command_audiostats(self, ctx: commands.Context):
         """Audio stats."""
-        server_num = len(lavalink.active_players())
-        total_num = len(lavalink.all_players())
+        snapshot = self.get_player_snapshot()
+        if not snapshot:
+            return await self.send_embed_msg(ctx, title=_("Not connected anywhere."))
+        servers_embed = [discord.Embed() for __ in range(math.ceil(len(snapshot) / 10))]
+        rendered = set()
 
-        msg = ""
-        async for p in AsyncIter(lavalink.all_players()):
-            connect_start = p.fetch("connect")
-            connect_dur = self.get_time_string(
-                int((datetime.datetime.utcnow() - connect_start).total_seconds())
-            )
-            try:
-                if not p.current:
-                    raise AttributeError
-                current_title = await self.get_track_description(
-                    p.current, self.local_folder_current_path
-                )
-                msg += "{} [`{}`]: {}\n".format(
-                    p.channel.guild.name, connect_dur, current_title
-                )
-            except AttributeError:
-                msg += "{} [`{}`]: **{}**\n".format(
-                    p.channel.guild.name, connect_dur, _("Nothing playing.")
+        async def _render(page: int) -> None:
+            if page not in rendered:
+                servers_embed[page] = await self._build_audiostats_page(
+                    ctx, snapshot, page + 1
                 )
+                rendered.add(page)
 
-        if total_num == 0:
-            return await self.send_embed_msg(ctx, title=_("Not connected anywhere."))
-        servers_embed = []
-        pages = 1
-        for page in pagify(msg, delims=["\n"], page_length=1500):
-            em = discord.Embed(
-                colour=await ctx.embed_colour(),
-                title=_("Playing in {num}/{total} servers:").format(
-                    num=humanize_number(server_num), total=humanize_number(total_num)
-                ),
-                description=page,
-            )
-            em.set_footer(
-                text=_("Page {}/{}").format(
-                    humanize_number(pages),
-                    humanize_number((math.ceil(len(msg) / 1500))),
-                )
-            )
-            pages += 1
-            servers_embed.append(em)
+        async def _prev_page(ctx, pages, controls, message, page, timeout, emoji):
+            await _render((page - 1) % len(pages))
+            return await prev_page(ctx, pages, controls, message, page, timeout, emoji)
+
+        async def _next_page(ctx, pages, controls, message, page, timeout, emoji):
+            await _render((page + 1) % len(pages))
+            return await next_page(ctx, pages, controls, message, page, timeout, emoji)
 
-        await menu(ctx, servers_embed, DEFAULT_CONTROLS)
+        audiostats_controls = {
+            "\N{LEFTWARDS BLACK ARROW}\N{VARIATION SELECTOR-16}": _prev_page,
+            "\N{CROSS MARK}": close_menu,
+            "\N{BLACK RIGHTWARDS ARROW}\N{VARIATION SELECTOR-16}": _next_page,
+        }
+        await _render(0)
+        await menu(ctx, servers_embed, audiostats_controls)
 
     @commands.command(name="percent")
     @commands.guild_only()
@@ -97,50 +77,26 @@ class MiscellaneousCommands(MixinMeta, metaclass=CompositeMetaClass):
         if not self._player_check(ctx):
             return await self.send_embed_msg(ctx, title=_("Nothing playing."))
         player = lavalink.get_player(ctx.guild.id)
-        queue_tracks = player.queue
-        requesters = {"total": 0, "users": {}}
-
-        async def _usercount(req_username):
-            if req_username in requesters["users"]:
-                requesters["users"][req_username]["songcount"] += 1
-                requesters["total"] += 1
-            else:
-                requesters["users"][req_username] = {}
-                requesters["users"][req_username]["songcount"] = 1
-                requesters["total"] += 1
-
-        async for track in AsyncIter(queue_tracks):
-            req_username = "{}#{}".format(
-                track.requester.name, track.requester.discriminator
-            )
-            await _usercount(req_username)
-
-        try:
-            req_username = "{}#{}".format(
-                player.current.requester.name, player.current.requester.discriminator
-            )
-            await _usercount(req_username)
-        except AttributeError:
+        if not player.current:
             return await self.send_embed_msg(
                 ctx, title=_("There's  nothing in the queue.")
             )
-
-        async for req_username in AsyncIter(requesters["users"]):
-            percentage = float(requesters["users"][req_username]["songcount"]) / float(
-                requesters["total"]
+        requester_count = self.get_queue_stats(player).requester_count.copy()
+        current_requester = player.current.requester
+        requester_count[getattr(current_requester, "id", current_requester)] += 1
+        total = sum(requester_count.values())
+
+        top_queue_users = []
+        for requester_id, count in heapq.nlargest(
+            20, requester_count.items(), key=lambda x: x[1]
+        ):
+            user = self.bot.get_user(requester_id)
+            req_username = (
+                "{}#{}".format(user.name, user.discriminator)
+                if user is not None
+                else str(requester_id)
             )
-            requesters["users"][req_username]["percent"] = round(percentage * 100, 1)
-
-        top_queue_users = heapq.nlargest(
-            20,
-            [
-                (x, requesters["users"][x][y])
-                for x in requesters["users"]
-                for y in requesters["users"][x]
-                if y == "percent"
-            ],
-            key=lambda x: x[1],
-        )
+            top_queue_users.append((req_username, round(count / total * 100, 1)))
         queue_user = ["{}: {:g}%".format(x[0], x[1]) for x in top_queue_users]
         queue_user_list = "\n".join(queue_user)
         await self.send_embed_msg(
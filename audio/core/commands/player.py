@@ -23,7 +23,7 @@ from redbot.core.utils.menus import (
     prev_page,
 )
 
-from ...audio_dataclasses import _PARTIALLY_SUPPORTED_MUSIC_EXT, Query
+from ...audio_dataclasses import _PARTIALLY_SUPPORTED_MUSIC_EXT, Query, QueueEntry
 from ...audio_logging import IS_DEBUG
 from ...errors import (
     DatabaseError,
@@ -93,7 +93,7 @@ class PlayerCommands(MixinMeta, metaclass=CompositeMetaClass):
                             "I don't have permission to connect to your channel."
                         ),
                     )
-                await lavalink.connect(ctx.author.voice.channel)
+                await self.node_pool.connect(ctx.author.voice.channel)
                 player = lavalink.get_player(ctx.guild.id)
                 player.store("connect", datetime.datetime.utcnow())
                 await self.self_deafen(player)
@@ -220,7 +220,7 @@ class PlayerCommands(MixinMeta, metaclass=CompositeMetaClass):
                             "I don't have permission to connect to your channel."
                         ),
                     )
-                await lavalink.connect(ctx.author.voice.channel)
+                await self.node_pool.connect(ctx.author.voice.channel)
                 player = lavalink.get_player(ctx.guild.id)
                 player.store("connect", datetime.datetime.utcnow())
                 await self.self_deafen(player)
@@ -508,7 +508,7 @@ class PlayerCommands(MixinMeta, metaclass=CompositeMetaClass):
                             "I don't have permission to connect to your channel."
                         ),
                     )
-                await lavalink.connect(ctx.author.voice.channel)
+                await self.node_pool.connect(ctx.author.voice.channel)
                 player = lavalink.get_player(ctx.guild.id)
                 player.store("connect", datetime.datetime.utcnow())
                 await self.self_deafen(player)
@@ -642,7 +642,7 @@ class PlayerCommands(MixinMeta, metaclass=CompositeMetaClass):
                             "I don't have permission to connect to your channel."
                         ),
                     )
-                await lavalink.connect(ctx.author.voice.channel)
+                await self.node_pool.connect(ctx.author.voice.channel)
                 player = lavalink.get_player(ctx.guild.id)
                 player.store("connect", datetime.datetime.utcnow())
                 await self.self_deafen(player)
@@ -786,7 +786,7 @@ class PlayerCommands(MixinMeta, metaclass=CompositeMetaClass):
                             "I don't have permission to connect to your channel."
                         ),
                     )
-                await lavalink.connect(ctx.author.voice.channel)
+                await self.node_pool.connect(ctx.author.voice.channel)
                 player = lavalink.get_player(ctx.guild.id)
                 player.store("connect", datetime.datetime.utcnow())
                 await self.self_deafen(player)
@@ -938,7 +938,8 @@ class PlayerCommands(MixinMeta, metaclass=CompositeMetaClass):
                                     "requester": ctx.author.id,
                                 }
                             )
-                            player.add(ctx.author, track)
+                            queue_entry = QueueEntry.from_track(track)
+                            player.add(ctx.author, queue_entry)
                             self.bot.dispatch(
                                 "red_audio_track_enqueue",
                                 player.channel.guild,
@@ -954,7 +955,8 @@ class PlayerCommands(MixinMeta, metaclass=CompositeMetaClass):
                                 "requester": ctx.author.id,
                             }
                         )
-                        player.add(ctx.author, track)
+                        queue_entry = QueueEntry.from_track(track)
+                        player.add(ctx.author, queue_entry)
                         self.bot.dispatch(
                             "red_audio_track_enqueue",
                             player.channel.guild,
@@ -1036,9 +1038,7 @@ class PlayerCommands(MixinMeta, metaclass=CompositeMetaClass):
         else:
             tracks = query
 
-        dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
-        )
+        dj_enabled = self.guild_settings.get(ctx.guild).dj_enabled
 
         len_search_pages = math.ceil(len(tracks) / 5)
         search_page_list = []
@@ -21,6 +21,7 @@ from redbot.core.utils.chat_formatting import bold, pagify
 from redbot.core.utils.menus import DEFAULT_CONTROLS, menu
 from redbot.core.utils.predicates import MessagePredicate
 
+from ...apis import playlist_operations
 from ...apis.api_utils import FakePlaylist
 from ...apis.playlist_interface import (
     Playlist,
@@ -28,7 +29,7 @@ from ...apis.playlist_interface import (
     delete_playlist,
     get_all_playlist,
 )
-from ...audio_dataclasses import LocalPath, Query
+from ...audio_dataclasses import LocalPath, Query, QueueEntry
 from ...audio_logging import IS_DEBUG, debug_exc_log
 from ...converters import ComplexScopeParser, ScopeParser
 from ...errors import MissingGuild, TooManyMatches, TrackEnqueueError
@@ -36,10 +37,6 @@ from ...utils import PlaylistScope
 from ..abc import MixinMeta
 from ..cog_utils import CompositeMetaClass, LazyGreedyConverter, PlaylistConverter
 
-try:
-    from redbot import json
-except ImportError:
-    import json
 log = logging.getLogger("red.cogs.Audio.cog.Commands.playlist")
 _ = Translator("Audio", Path(__file__))
 
@@ -149,10 +146,12 @@ class PlaylistCommands(MixinMeta, metaclass=CompositeMetaClass):
                 return await self.send_embed_msg(
                     ctx, title=_("Could not find a track matching your query.")
                 )
-            track_list = playlist.tracks
-            current_count = len(track_list)
+            current_count = playlist.track_count
             to_append_count = len(to_append)
-            tracks_obj_list = playlist.tracks_obj
+            playlist_scope, playlist_scope_id = playlist.config_scope
+            track_identifiers = await self.playlist_api.fetch_track_identifiers(
+                playlist_scope, playlist.id, playlist_scope_id
+            )
             not_added = 0
             if current_count + to_append_count > 10000:
                 to_append = to_append[: 10000 - current_count]
@@ -165,7 +164,7 @@ class PlaylistCommands(MixinMeta, metaclass=CompositeMetaClass):
 
             if to_append and to_append_count == 1:
                 to = lavalink.Track(to_append[0])
-                if to in tracks_obj_list:
+                if to.track_identifier in track_identifiers:
                     return await self.send_embed_msg(
                         ctx,
                         title=_("Skipping track"),
@@ -186,17 +185,12 @@ class PlaylistCommands(MixinMeta, metaclass=CompositeMetaClass):
                 else:
                     appended += 1
             if to_append and to_append_count > 1:
-                to_append_temp = []
-                async for t in AsyncIter(to_append):
-                    to = lavalink.Track(t)
-                    if to not in tracks_obj_list:
-                        appended += 1
-                        to_append_temp.append(t)
-                to_append = to_append_temp
+                to_append = playlist_operations.exclude(to_append, track_identifiers)
+                appended += len(to_append)
             if appended > 0:
-                track_list.extend(to_append)
-                update = {"tracks": track_list, "url": None}
-                await playlist.edit(update)
+                await playlist.append_tracks(to_append)
+                if playlist.url is not None:
+                    await playlist.edit({"url": None})
 
             if to_append_count == 1 and appended == 1:
                 track_title = to_append[0]["info"]["title"]
@@ -352,10 +346,20 @@ class PlaylistCommands(MixinMeta, metaclass=CompositeMetaClass):
                 to_scope,
                 from_playlist.name,
                 from_playlist.url,
-                from_playlist.tracks,
+                None,
                 to_author,
                 to_guild,
             )
+            from_config_scope, from_scope_id = from_playlist.config_scope
+            to_config_scope, to_scope_id = to_playlist.config_scope
+            await self.playlist_api.copy_tracks(
+                from_config_scope,
+                from_playlist.id,
+                from_scope_id,
+                to_config_scope,
+                to_playlist.id,
+                to_scope_id,
+            )
             if to_scope == PlaylistScope.GLOBAL.value:
                 to_scope_name = _("the Global")
             elif to_scope == PlaylistScope.USER.value:
@@ -632,30 +636,30 @@ class PlaylistCommands(MixinMeta, metaclass=CompositeMetaClass):
                 ctx.command.reset_cooldown(ctx)
                 return
 
-            track_objects = playlist.tracks_obj
-            original_count = len(track_objects)
-            unique_tracks = set()
-            unique_tracks_add = unique_tracks.add
-            track_objects = [
-                x
-                for x in track_objects
-                if not (x in unique_tracks or unique_tracks_add(x))
-            ]
-
-            tracklist = []
-            async for track in AsyncIter(track_objects):
-                track_keys = track._info.keys()
-                track_values = track._info.values()
-                track_id = track.track_identifier
-                track_info = {}
-                for k, v in zip(track_keys, track_values):
-                    track_info[k] = v
-                keys = ["track", "info"]
-                values = [track_id, track_info]
-                track_obj = {}
-                for key, value in zip(keys, values):
-                    track_obj[key] = value
-                tracklist.append(track_obj)
+            original_count = playlist.track_count
+            playlist_scope, playlist_scope_id = playlist.config_scope
+            try:
+                fetched_count, tracklist = await playlist_operations.run(
+                    playlist_operations.fetch_and_dedupe,
+                    self.playlist_api.read_tracks,
+                    playlist_scope,
+                    playlist.id,
+                    playlist_scope_id,
+                )
+            except Exception as exc:
+                debug_exc_log(log, exc, "Failed to read playlist tracks to dedupe")
+                fetched_count = None
+            # Never save a partial read, it would drop the tracks that weren't read
+            if fetched_count != original_count:
+                ctx.command.reset_cooldown(ctx)
+                return await self.send_embed_msg(
+                    ctx,
+                    title=_("Playlist Has Not Been Modified"),
+                    description=_(
+                        "The tracks of {name} (`{id}`) [**{scope}**] playlist "
+                        "could not be read, try again later."
+                    ).format(name=playlist.name, id=playlist.id, scope=scope_name),
+                )
 
         final_count = len(tracklist)
         if original_count - final_count != 0:
@@ -765,38 +769,32 @@ class PlaylistCommands(MixinMeta, metaclass=CompositeMetaClass):
             schema = 2
             version = "v3" if v2 is False else "v2"
 
-            if not playlist.tracks:
+            if not playlist.track_count:
                 ctx.command.reset_cooldown(ctx)
                 return await self.send_embed_msg(
                     ctx, title=_("That playlist has no tracks.")
                 )
-            if version == "v2":
-                v2_valid_urls = [
-                    "https://www.youtube.com/watch?v=",
-                    "https://soundcloud.com/",
-                ]
-                song_list = []
-                async for track in AsyncIter(playlist.tracks):
-                    if track["info"]["uri"].startswith(tuple(v2_valid_urls)):
-                        song_list.append(track["info"]["uri"])
-                playlist_data = {
-                    "author": playlist.author,
-                    "link": playlist.url,
-                    "playlist": song_list,
-                    "name": playlist.name,
-                }
-                file_name = playlist.name
-            else:
-                # TODO: Keep new playlists backwards compatible, Remove me in a few releases
-                playlist_data = playlist.to_json()
-                playlist_songs_backwards_compatible = [
-                    track["info"]["uri"] for track in playlist.tracks
-                ]
-                playlist_data["playlist"] = playlist_songs_backwards_compatible
-                playlist_data["link"] = playlist.url
-                file_name = playlist.id
+            if version == "v3":
+                return await self._download_playlist_lines(ctx, playlist)
+            v2_valid_urls = [
+                "https://www.youtube.com/watch?v=",
+                "https://soundcloud.com/",
+            ]
+            song_list = []
+            async for track in AsyncIter(await playlist.load_tracks()):
+                if track["info"]["uri"].startswith(tuple(v2_valid_urls)):
+                    song_list.append(track["info"]["uri"])
+            playlist_data = {
+                "author": playlist.author,
+                "link": playlist.url,
+                "playlist": song_list,
+                "name": playlist.name,
+            }
+            file_name = playlist.name
             playlist_data.update({"schema": schema, "version": version})
-            playlist_data = json.dumps(playlist_data).encode("utf-8")
+            playlist_data = await playlist_operations.run(
+                playlist_operations.dumps, playlist_data
+            )
             to_write = BytesIO()
             to_write.write(playlist_data)
             to_write.seek(0)
@@ -910,7 +908,7 @@ class PlaylistCommands(MixinMeta, metaclass=CompositeMetaClass):
                         arg=playlist_arg
                     ),
                 )
-            track_len = len(playlist.tracks)
+            track_len = len(await playlist.load_tracks())
 
             msg = "​"
             if track_len > 0:
@@ -1120,7 +1118,10 @@ class PlaylistCommands(MixinMeta, metaclass=CompositeMetaClass):
                         (
                             bold(playlist.name),
                             _("ID: {id}").format(id=playlist.id),
-                            _("Tracks: {num}").format(num=len(playlist.tracks)),
+                            _("Tracks: {num}").format(num=playlist.track_count),
+                            _("Duration: {length}").format(
+                                length=self.format_time(playlist.duration)
+                            ),
                             _("Author: {name}").format(
                                 name=self.bot.get_user(playlist.author)
                                 or playlist.author
@@ -1343,12 +1344,10 @@ class PlaylistCommands(MixinMeta, metaclass=CompositeMetaClass):
             if not await self.can_manage_playlist(scope, playlist, ctx, author, guild):
                 return
 
-            track_list = playlist.tracks
-            clean_list = [track for track in track_list if url != track["info"]["uri"]]
-            if len(track_list) == len(clean_list):
+            del_count = await playlist.remove_track_uri(url)
+            if not del_count:
                 return await self.send_embed_msg(ctx, title=_("URL not in playlist."))
-            del_count = len(track_list) - len(clean_list)
-            if not clean_list:
+            if not playlist.track_count:
                 await delete_playlist(
                     playlist_api=self.playlist_api,
                     bot=self.bot,
@@ -1360,8 +1359,8 @@ class PlaylistCommands(MixinMeta, metaclass=CompositeMetaClass):
                 return await self.send_embed_msg(
                     ctx, title=_("No tracks left, removing playlist.")
                 )
-            update = {"tracks": clean_list, "url": None}
-            await playlist.edit(update)
+            if playlist.url is not None:
+                await playlist.edit({"url": None})
             if del_count > 1:
                 await self.send_embed_msg(
                     ctx,
@@ -1572,9 +1571,7 @@ class PlaylistCommands(MixinMeta, metaclass=CompositeMetaClass):
         if scope_data is None:
             scope_data = [None, ctx.author, ctx.guild, False]
         scope, author, guild, specified_user = scope_data
-        dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
-        )
+        dj_enabled = self.guild_settings.get(ctx.guild).dj_enabled
         if dj_enabled and not await self._can_instaskip(ctx, ctx.author):
             ctx.command.reset_cooldown(ctx)
             await self.send_embed_msg(
@@ -1613,6 +1610,7 @@ class PlaylistCommands(MixinMeta, metaclass=CompositeMetaClass):
             track_len = 0
             try:
                 player = lavalink.get_player(ctx.guild.id)
+                await playlist.load_tracks()
                 tracks = playlist.tracks_obj
                 empty_queue = not player.queue
                 async for track in AsyncIter(tracks):
@@ -1652,7 +1650,8 @@ class PlaylistCommands(MixinMeta, metaclass=CompositeMetaClass):
                             "requester": ctx.author.id,
                         }
                     )
-                    player.add(author_obj, track)
+                    queue_entry = QueueEntry.from_track(track)
+                    player.add(author_obj, queue_entry)
                     self.bot.dispatch(
                         "red_audio_track_enqueue",
                         player.channel.guild,
@@ -1844,14 +1843,14 @@ class PlaylistCommands(MixinMeta, metaclass=CompositeMetaClass):
                     if removed:
                         removed_text = ""
                         async for i, track in AsyncIter(removed).enumerate(start=1):
-                            if len(track.title) > 40:
-                                track_title = str(track.title).replace("[", "")
+                            track_title = track["info"].get("title", "")
+                            if len(track_title) > 40:
+                                track_title = str(track_title).replace("[", "")
                                 track_title = "{}...".format(
                                     (track_title[:40]).rstrip(" ")
                                 )
-                            else:
-                                track_title = track.title
-                            removed_text += f"`{i}.` **[{track_title}]({track.uri})**\n"
+                            track_uri = track["info"].get("uri")
+                            removed_text += f"`{i}.` **[{track_title}]({track_uri})**\n"
                             if i % 10 == 0 or i == total_removed:
                                 page_count += 1
                                 embed = discord.Embed(
@@ -1868,14 +1867,14 @@ class PlaylistCommands(MixinMeta, metaclass=CompositeMetaClass):
                     if added:
                         added_text = ""
                         async for i, track in AsyncIter(added).enumerate(start=1):
-                            if len(track.title) > 40:
-                                track_title = str(track.title).replace("[", "")
+                            track_title = track["info"].get("title", "")
+                            if len(track_title) > 40:
+                                track_title = str(track_title).replace("[", "")
                                 track_title = "{}...".format(
                                     (track_title[:40]).rstrip(" ")
                                 )
-                            else:
-                                track_title = track.title
-                            added_text += f"`{i}.` **[{track_title}]({track.uri})**\n"
+                            track_uri = track["info"].get("uri")
+                            added_text += f"`{i}.` **[{track_title}]({track_uri})**\n"
                             if i % 10 == 0 or i == total_added:
                                 page_count += 1
                                 embed = discord.Embed(
@@ -1986,6 +1985,10 @@ class PlaylistCommands(MixinMeta, metaclass=CompositeMetaClass):
                 file_url = file_message.attachments[0].url
             except IndexError:
                 return await self.send_embed_msg(ctx, title=_("Upload cancelled."))
+            if file_url.endswith(playlist_operations.PLAYLIST_FILE_SUFFIX):
+                return await self._load_lines_playlist(
+                    ctx, player, file_url, scope, author, guild
+                )
             file_suffix = file_url.rsplit(".", 1)[1]
             if file_suffix != "txt":
                 return await self.send_embed_msg(
@@ -1993,10 +1996,10 @@ class PlaylistCommands(MixinMeta, metaclass=CompositeMetaClass):
                 )
             try:
                 async with self.session.request("GET", file_url) as r:
-                    uploaded_playlist = await r.json(
-                        content_type="text/plain", encoding="utf-8", loads=json.loads
+                    uploaded_playlist = await playlist_operations.run(
+                        playlist_operations.loads, await r.read()
                     )
-            except UnicodeDecodeError:
+            except (UnicodeDecodeError, ValueError):
                 return await self.send_embed_msg(
                     ctx, title=_("Not a valid playlist file.")
                 )
@@ -110,9 +110,7 @@ class QueueCommands(MixinMeta, metaclass=CompositeMetaClass):
             )
             embed.set_footer(text=text)
             message = await self.send_embed_msg(ctx, embed=embed)
-            dj_enabled = self._dj_status_cache.setdefault(
-                ctx.guild.id, guild_data["dj_enabled"]
-            )
+            dj_enabled = guild_data["dj_enabled"]
             vote_enabled = guild_data["vote_enabled"]
             if (
                 (dj_enabled or vote_enabled)
@@ -195,9 +193,7 @@ class QueueCommands(MixinMeta, metaclass=CompositeMetaClass):
             return await self.send_embed_msg(
                 ctx, title=_("There's nothing in the queue.")
             )
-        dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
-        )
+        dj_enabled = self.guild_settings.get(ctx.guild).dj_enabled
         if not self._player_check(ctx) or not player.queue:
             return await self.send_embed_msg(
                 ctx, title=_("There's nothing in the queue.")
@@ -230,9 +226,7 @@ class QueueCommands(MixinMeta, metaclass=CompositeMetaClass):
             return await self.send_embed_msg(
                 ctx, title=_("There's nothing in the queue.")
             )
-        dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
-        )
+        dj_enabled = self.guild_settings.get(ctx.guild).dj_enabled
         if not self._player_check(ctx) or not player.queue:
             return await self.send_embed_msg(
                 ctx, title=_("There's nothing in the queue.")
@@ -337,9 +331,7 @@ class QueueCommands(MixinMeta, metaclass=CompositeMetaClass):
     @commands.cooldown(1, 30, commands.BucketType.guild)
     async def command_queue_shuffle(self, ctx: commands.Context):
         """Shuffles the queue."""
-        dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
-        )
+        dj_enabled = self.guild_settings.get(ctx.guild).dj_enabled
         if (
             dj_enabled
             and not await self._can_instaskip(ctx, ctx.author)
@@ -372,7 +364,7 @@ class QueueCommands(MixinMeta, metaclass=CompositeMetaClass):
                         "I don't have permission to connect to your channel."
                     ),
                 )
-            await lavalink.connect(ctx.author.voice.channel)
+            await self.node_pool.connect(ctx.author.voice.channel)
             player = lavalink.get_player(ctx.guild.id)
             player.store("connect", datetime.datetime.utcnow())
             await self.self_deafen(player)
@@ -104,28 +104,13 @@ class DpyEvents(MixinMeta, metaclass=CompositeMetaClass):
         if not ctx.guild:
             return
 
-        dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
-        )
-        self._daily_playlist_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).daily_playlists()
-        )
-        self._nsfw_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).nsfw_queries()
-        )
-        self._persist_queue_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).persist_queue()
-        )
+        dj_enabled = self.guild_settings.get(ctx.guild).dj_enabled
         if dj_enabled:
-            dj_role = self._dj_role_cache.setdefault(
-                ctx.guild.id, await self.config.guild(ctx.guild).dj_role()
-            )
+            dj_role = self.guild_settings.get(ctx.guild).dj_role
             dj_role_obj = ctx.guild.get_role(dj_role)
             if not dj_role_obj:
-                await self.config.guild(ctx.guild).dj_enabled.set(None)
-                self._dj_status_cache[ctx.guild.id] = None
-                await self.config.guild(ctx.guild).dj_role.set(None)
-                self._dj_role_cache[ctx.guild.id] = None
+                await self.guild_settings.set(ctx.guild, "dj_enabled", None)
+                await self.guild_settings.set(ctx.guild, "dj_role", None)
                 await self.send_embed_msg(
                     ctx, title=_("No DJ role found. Disabling DJ mode.")
                 )
@@ -261,8 +246,18 @@ class DpyEvents(MixinMeta, metaclass=CompositeMetaClass):
             if self.cog_init_task:
                 self.cog_init_task.cancel()
 
+            for task in self._icy_tasks.values():
+                task.cancel()
+            for task in self._event_side_effect_tasks.values():
+                task.cancel()
+            for task in self._queue_lookahead_tasks.values():
+                task.cancel()
+            if self._presence_update_task:
+                self._presence_update_task.cancel()
+
             lavalink.unregister_event_listener(self.lavalink_event_handler)
             lavalink.unregister_update_listener(self.lavalink_update_handler)
+            self.bot.loop.create_task(self.node_pool.close())
             self.bot.loop.create_task(lavalink.close())
             if self.player_manager is not None:
                 self.bot.loop.create_task(self.player_manager.shutdown())
@@ -284,6 +279,7 @@ class DpyEvents(MixinMeta, metaclass=CompositeMetaClass):
                 self.skip_votes[before.channel.guild].remove(member.id)
             except (ValueError, KeyError, AttributeError):
                 pass
+            await self.update_idle_timers(member.guild)
         channel = self.rgetattr(member, "voice.channel", None)
         bot_voice_state = self.rgetattr(member, "guild.me.voice.self_deaf", None)
         if channel and bot_voice_state is False:
@@ -1,14 +1,19 @@
 import asyncio
+import collections
 import contextlib
-import datetime
+import functools
 import logging
 from pathlib import Path
 
+from typing import Any, Awaitable, Callable, Optional
+
 import discord
 import lavalink
 
 from redbot.core.i18n import Translator
+from ...audio_logging import debug_exc_log
 from ...errors import DatabaseError, TrackEnqueueError
+from ...utils import task_callback
 from ..abc import MixinMeta
 from ..cog_utils import CompositeMetaClass
 
@@ -23,37 +28,32 @@ class LavalinkEvents(MixinMeta, metaclass=CompositeMetaClass):
     async def lavalink_event_handler(
         self, player: lavalink.Player, event_type: lavalink.LavalinkEvents, extra
     ) -> None:
+        # Only the player state is updated here, anything talking to Discord or
+        # reading a track's description is queued with queue_event_side_effect.
+        if event_type == lavalink.LavalinkEvents.TRACK_START:
+            self.materialize_queue_head(player)
         current_track = player.current
         current_channel = player.channel
         if not current_channel:
             return
         guild = self.rgetattr(current_channel, "guild", None)
-        if await self.bot.cog_disabled_in_guild(self, guild):
-            await player.stop()
-            await player.disconnect()
-            return
-        guild_id = self.rgetattr(guild, "id", None)
         if not guild:
             return
+        guild_id = guild.id
+        if event_type == lavalink.LavalinkEvents.TRACK_START:
+            if await self.bot.cog_disabled_in_guild(self, guild):
+                await player.stop()
+                await player.disconnect()
+                return
         current_requester = self.rgetattr(current_track, "requester", None)
-        current_stream = self.rgetattr(current_track, "is_stream", None)
-        current_length = self.rgetattr(current_track, "length", None)
-        current_thumbnail = self.rgetattr(current_track, "thumbnail", None)
-        current_extras = self.rgetattr(current_track, "extras", {})
         current_id = self.rgetattr(current_track, "_info", {}).get("identifier")
-        guild_data = await self.config.guild(guild).all()
-        repeat = guild_data["repeat"]
-        notify = guild_data["notify"]
-        disconnect = guild_data["disconnect"]
-        autoplay = guild_data["auto_play"]
-        description = await self.get_track_description(
-            current_track, self.local_folder_current_path
-        )
-        status = await self.config.status()
+        settings = self.guild_settings.get(guild)
+        autoplay = settings.auto_play
         log.debug(
             f"Received a new lavalink event for {guild_id}: {event_type}: {extra}"
         )
         prev_song: lavalink.Track = player.fetch("prev_song")
+        notify_channel = player.fetch("channel")
         await self.maybe_reset_error_counter(player)
 
         if event_type == lavalink.LavalinkEvents.TRACK_START:
@@ -64,21 +64,46 @@ class LavalinkEvents(MixinMeta, metaclass=CompositeMetaClass):
             player.store("prev_requester", requester)
             player.store("playing_song", current_track)
             player.store("requester", current_requester)
+            self.update_playing_stream(guild_id, current_track)
+            self.prepare_queue_ahead(player)
+            # The daily playlists and the persistent queue are updated by the
+            # red_audio_track_start listener.
             self.bot.dispatch(
                 "red_audio_track_start", guild, current_track, current_requester
             )
-            if guild_id and current_track:
-                await self.api_interface.persistent_queue_api.played(
-                    guild_id=guild_id, track_id=current_track.track_identifier
+            if (
+                autoplay
+                and not player.queue
+                and self.playlist_api is not None
+                and self.api_interface is not None
+            ):
+                # Pick the next autoplay tracks while the last queued one is playing.
+                self.api_interface.prefetch_autoplay(player, self.playlist_api)
+            if settings.notify and notify_channel:
+                self.queue_event_side_effect(
+                    guild_id,
+                    self._notify_track_start,
+                    player,
+                    notify_channel,
+                    current_track,
+                    prev_song,
+                    autoplay,
+                    settings.thumbnail,
                 )
+            self.queue_presence_update()
+
         if event_type == lavalink.LavalinkEvents.TRACK_END:
+            self.update_playing_stream(guild_id, None)
             prev_requester = player.fetch("prev_requester")
             self.bot.dispatch("red_audio_track_end", guild, prev_song, prev_requester)
+            self.queue_presence_update(delay=1, player=player)
+
         if event_type == lavalink.LavalinkEvents.QUEUE_END:
             prev_requester = player.fetch("prev_requester")
             self.bot.dispatch("red_audio_queue_end", guild, prev_song, prev_requester)
-            if guild_id:
-                await self.api_interface.persistent_queue_api.drop(guild_id)
+            self.update_playing_stream(guild_id, None)
+            self.cancel_queue_ahead(guild_id)
+            await self.api_interface.persistent_queue_api.drop(guild_id)
             if (
                 autoplay
                 and not player.queue
@@ -89,112 +114,52 @@ class LavalinkEvents(MixinMeta, metaclass=CompositeMetaClass):
                 try:
                     await self.api_interface.autoplay(player, self.playlist_api)
                 except DatabaseError:
-                    notify_channel = player.fetch("channel")
-                    notify_channel = self.bot.get_channel(notify_channel)
-                    if notify_channel:
-                        await self.send_embed_msg(
-                            notify_channel, title=_("Couldn't get a valid track.")
-                        )
+                    self.queue_event_side_effect(
+                        guild_id,
+                        self._notify,
+                        notify_channel,
+                        title=_("Couldn't get a valid track."),
+                    )
                     return
                 except TrackEnqueueError:
-                    notify_channel = player.fetch("channel")
-                    notify_channel = self.bot.get_channel(notify_channel)
-                    if notify_channel:
-                        await self.send_embed_msg(
-                            notify_channel,
-                            title=_("Unable to Get Track"),
-                            description=_(
-                                "I'm unable to get a track from Lavalink at the moment, try again in a few "
-                                "minutes."
-                            ),
-                        )
-                    return
-        if event_type == lavalink.LavalinkEvents.TRACK_START and notify:
-            notify_channel = player.fetch("channel")
-            if notify_channel:
-                notify_channel = self.bot.get_channel(notify_channel)
-                if player.fetch("notify_message") is not None:
-                    with contextlib.suppress(discord.HTTPException):
-                        await player.fetch("notify_message").delete()
-
-                if (
-                    autoplay
-                    and current_extras.get("autoplay")
-                    and (
-                        prev_song is None
-                        or (
-                            hasattr(prev_song, "extras")
-                            and not prev_song.extras.get("autoplay")
-                        )
-                    )
-                ):
-                    await self.send_embed_msg(
-                        notify_channel, title=_("Auto Play started.")
+                    self.queue_event_side_effect(
+                        guild_id,
+                        self._notify,
+                        notify_channel,
+                        title=_("Unable to Get Track"),
+                        description=_(
+                            "I'm unable to get a track from Lavalink at the moment, "
+                            "try again in a few minutes."
+                        ),
                     )
-
-                if not description:
                     return
-                if current_stream:
-                    dur = "LIVE"
-                else:
-                    dur = self.format_time(current_length)
-
-                thumb = None
-                if await self.config.guild(guild).thumbnail() and current_thumbnail:
-                    thumb = current_thumbnail
-
-                notify_message = await self.send_embed_msg(
-                    notify_channel,
-                    title=_("Now Playing"),
-                    description=description,
-                    footer=_("Track length: {length} | Requested by: {user}").format(
-                        length=dur, user=current_requester
-                    ),
-                    thumbnail=thumb,
-                )
-                player.store("notify_message", notify_message)
-        if event_type == lavalink.LavalinkEvents.TRACK_START and status:
-            player_check = await self.get_active_player_count()
-            await self.update_bot_presence(*player_check)
-
-        if event_type == lavalink.LavalinkEvents.TRACK_END and status:
-            await asyncio.sleep(1)
-            if not player.is_playing:
-                player_check = await self.get_active_player_count()
-                await self.update_bot_presence(*player_check)
-
-        if event_type == lavalink.LavalinkEvents.QUEUE_END:
             if not autoplay:
-                notify_channel = player.fetch("channel")
-                if notify_channel and notify:
-                    notify_channel = self.bot.get_channel(notify_channel)
-                    await self.send_embed_msg(notify_channel, title=_("Queue ended."))
-                if disconnect:
+                self.api_interface.clear_autoplay(guild_id)
+                if settings.notify:
+                    self.queue_event_side_effect(
+                        guild_id,
+                        self._notify,
+                        notify_channel,
+                        title=_("Queue ended."),
+                    )
+                if settings.disconnect:
                     self.bot.dispatch("red_audio_audio_disconnect", guild)
                     await player.disconnect()
-                    self._ll_guild_updates.discard(guild.id)
-            if status:
-                player_check = await self.get_active_player_count()
-                await self.update_bot_presence(*player_check)
+                    self._ll_guild_updates.discard(guild_id)
+            self.queue_presence_update()
 
         if event_type in [
             lavalink.LavalinkEvents.TRACK_EXCEPTION,
             lavalink.LavalinkEvents.TRACK_STUCK,
         ]:
-            message_channel = player.fetch("channel")
             while True:
                 if current_track in player.queue:
                     player.queue.remove(current_track)
                 else:
                     break
-            if repeat:
+            if settings.repeat:
                 player.current = None
-            if not guild_id:
-                return
-            guild_id = int(guild_id)
             self._error_counter.setdefault(guild_id, 0)
-            if guild_id not in self._error_counter:
-                self._error_counter[guild_id] = 0
             early_exit = await self.increase_error_counter(player)
             if early_exit:
                 self._disconnected_players[guild_id] = True
@@ -209,45 +174,188 @@ class LavalinkEvents(MixinMeta, metaclass=CompositeMetaClass):
                 await player.stop()
                 await player.disconnect()
                 self._ll_guild_updates.discard(guild_id)
+                if self.api_interface is not None:
+                    self.api_interface.clear_autoplay(guild_id)
                 self.bot.dispatch("red_audio_audio_disconnect", guild)
-            if message_channel:
-                message_channel = self.bot.get_channel(message_channel)
-                if early_exit:
-                    embed = discord.Embed(
-                        colour=await self.bot.get_embed_color(message_channel),
-                        title=_("Multiple Errors Detected"),
-                        description=_(
-                            "Closing the audio player "
-                            "due to multiple errors being detected. "
-                            "If this persists, please inform the bot owner "
-                            "as the Audio cog may be temporally unavailable."
-                        ),
+            if notify_channel:
+                if (
+                    event_type == lavalink.LavalinkEvents.TRACK_EXCEPTION
+                    and current_id
+                    and not early_exit
+                ):
+                    asyncio.create_task(
+                        self.api_interface.global_cache_api.report_invalid(current_id)
                     )
-                    await message_channel.send(embed=embed)
+                self.queue_event_side_effect(
+                    guild_id,
+                    self._notify_track_error,
+                    notify_channel,
+                    event_type,
+                    current_track,
+                    extra,
+                    early_exit,
+                )
+                if early_exit:
                     return
-                else:
-                    description = description or ""
-                    if event_type == lavalink.LavalinkEvents.TRACK_STUCK:
-                        embed = discord.Embed(
-                            colour=await self.bot.get_embed_color(message_channel),
-                            title=_("Track Stuck"),
-                            description=_(
-                                "Playback of the song has stopped due to an unexcepted error.\n{error}"
-                            ).format(error=description),
-                        )
-                    else:
-                        embed = discord.Embed(
-                            title=_("Track Error"),
-                            colour=await self.bot.get_embed_color(message_channel),
-                            description="{}\n{}".format(
-                                extra.replace("\n", ""), description
-                            ),
-                        )
-                        if current_id:
-                            asyncio.create_task(
-                                self.api_interface.global_cache_api.report_invalid(
-                                    current_id
-                                )
-                            )
-                    await message_channel.send(embed=embed)
             await player.skip()
+
+    def queue_event_side_effect(
+        self, guild_id: int, func: Callable[..., Awaitable[Any]], *args, **kwargs
+    ) -> None:
+        """Run ``func`` once the side effects already queued for the guild are done."""
+        self._event_side_effects.setdefault(guild_id, collections.deque()).append(
+            functools.partial(func, *args, **kwargs)
+        )
+        if guild_id not in self._event_side_effect_tasks:
+            task = asyncio.create_task(self._run_event_side_effects(guild_id))
+            task.add_done_callback(task_callback)
+            self._event_side_effect_tasks[guild_id] = task
+
+    async def _run_event_side_effects(self, guild_id: int) -> None:
+        try:
+            pending = self._event_side_effects[guild_id]
+            while pending:
+                func = pending.popleft()
+                try:
+                    await func()
+                except Exception as exc:
+                    debug_exc_log(
+                        log, exc, f"Failed to handle a Lavalink event for {guild_id}"
+                    )
+        finally:
+            self._event_side_effects.pop(guild_id, None)
+            self._event_side_effect_tasks.pop(guild_id, None)
+
+    def queue_presence_update(
+        self, delay: float = 0, player: Optional[lavalink.Player] = None
+    ) -> None:
+        """Update the bot's presence, pending updates are shared between events.
+
+        With ``player`` the update is skipped if it is playing again by then,
+        unless another event needs the update too.
+        """
+        pending = (
+            self._presence_update_task is not None
+            and not self._presence_update_task.done()
+        )
+        if player is None:
+            self._presence_update_players = None
+        elif not pending:
+            self._presence_update_players = [player]
+        elif self._presence_update_players is not None:
+            self._presence_update_players.append(player)
+        if not pending:
+            self._presence_update_task = asyncio.create_task(
+                self._update_presence(delay)
+            )
+            self._presence_update_task.add_done_callback(task_callback)
+
+    async def _update_presence(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        players = self._presence_update_players
+        if players and all(player.is_playing for player in players):
+            return
+        if not await self.config.status():
+            return
+        player_check = await self.get_active_player_count()
+        await self.update_bot_presence(*player_check)
+
+    async def _notify(self, channel_id: int, **kwargs) -> Optional[discord.Message]:
+        notify_channel = self.bot.get_channel(channel_id)
+        if notify_channel is None:
+            return None
+        return await self.send_embed_msg(notify_channel, **kwargs)
+
+    async def _notify_track_start(
+        self,
+        player: lavalink.Player,
+        channel_id: int,
+        track: lavalink.Track,
+        prev_song: Optional[lavalink.Track],
+        autoplay: bool,
+        thumbnail: bool,
+    ) -> None:
+        if player.fetch("notify_message") is not None:
+            with contextlib.suppress(discord.HTTPException):
+                await player.fetch("notify_message").delete()
+        if (
+            autoplay
+            and self.rgetattr(track, "extras", {}).get("autoplay")
+            and (
+                prev_song is None
+                or (
+                    hasattr(prev_song, "extras")
+                    and not prev_song.extras.get("autoplay")
+                )
+            )
+        ):
+            await self._notify(channel_id, title=_("Auto Play started."))
+
+        description = await self.get_track_description(
+            track, self.local_folder_current_path
+        )
+        if not description:
+            return
+        if track.is_stream:
+            dur = "LIVE"
+        else:
+            dur = self.format_time(track.length)
+
+        thumb = None
+        if thumbnail and track.thumbnail:
+            thumb = track.thumbnail
+
+        notify_message = await self._notify(
+            channel_id,
+            title=_("Now Playing"),
+            description=description,
+            footer=_("Track length: {length} | Requested by: {user}").format(
+                length=dur, user=track.requester
+            ),
+            thumbnail=thumb,
+        )
+        player.store("notify_message", notify_message)
+
+    async def _notify_track_error(
+        self,
+        channel_id: int,
+        event_type: lavalink.LavalinkEvents,
+        track: Optional[lavalink.Track],
+        extra: str,
+        early_exit: bool,
+    ) -> None:
+        message_channel = self.bot.get_channel(channel_id)
+        if message_channel is None:
+            return
+        colour = await self.bot.get_embed_color(message_channel)
+        if early_exit:
+            embed = discord.Embed(
+                colour=colour,
+                title=_("Multiple Errors Detected"),
+                description=_(
+                    "Closing the audio player "
+                    "due to multiple errors being detected. "
+                    "If this persists, please inform the bot owner "
+                    "as the Audio cog may be temporally unavailable."
+                ),
+            )
+        else:
+            description = (
+                await self.get_track_description(track, self.local_folder_current_path)
+                or ""
+            )
+            if event_type == lavalink.LavalinkEvents.TRACK_STUCK:
+                embed = discord.Embed(
+                    colour=colour,
+                    title=_("Track Stuck"),
+                    description=_(
+                        "Playback of the song has stopped due to an unexcepted error.\n{error}"
+                    ).format(error=description),
+                )
+            else:
+                embed = discord.Embed(
+                    title=_("Track Error"),
+                    colour=colour,
+                    description="{}\n{}".format(extra.replace("\n", ""), description),
+                )
+        await message_channel.send(embed=embed)
@@ -25,6 +25,8 @@ class LavalinkTasks(MixinMeta, metaclass=CompositeMetaClass):
 
     async def lavalink_attempt_connect(self, timeout: int = 50) -> None:
         self.lavalink_connection_aborted = False
+        # Extra nodes are reconnected once the main node is connected again.
+        await self.node_pool.close()
         max_retries = 5
         retry_count = 0
         while retry_count < max_retries:
@@ -41,7 +43,8 @@ class LavalinkTasks(MixinMeta, metaclass=CompositeMetaClass):
                     await self.player_manager.shutdown()
                 self.player_manager = ServerManager()
                 try:
-                    await self.player_manager.start(java_exec)
+                    profile = await self.jvm_sizer.profile()
+                    await self.player_manager.start(java_exec, profile.args())
                 except LavalinkDownloadFailed as exc:
                     await asyncio.sleep(1)
                     if exc.should_retry:
@@ -100,7 +103,7 @@ class LavalinkTasks(MixinMeta, metaclass=CompositeMetaClass):
                 }
                 if lavalink.__version__ != "0.7.0":
                     args.pop("resume_key", None)
-                await lavalink.initialize(**args)
+                main_node = await lavalink.initialize(**args)
             except asyncio.TimeoutError:
                 log.error("Connecting to Lavalink server timed out, retrying...")
                 if external is False and self.player_manager is not None:
@@ -122,3 +125,5 @@ class LavalinkTasks(MixinMeta, metaclass=CompositeMetaClass):
                 "Connecting to the Lavalink server failed after multiple attempts. "
                 "See above tracebacks for details."
             )
+            return
+        await self.node_pool.start(main_node)
@@ -1,10 +1,11 @@
 import asyncio
+import contextlib
+import heapq
 import logging
 import time
 from pathlib import Path
 
-from typing import Dict
-
+import discord
 import lavalink
 
 from redbot.core.i18n import Translator
@@ -19,70 +20,112 @@ _ = Translator("Audio", Path(__file__))
 
 
 class PlayerTasks(MixinMeta, metaclass=CompositeMetaClass):
+    async def update_idle_timers(self, guild: discord.Guild) -> None:
+        """Arm or cancel a guild's empty channel timers.
+
+        Called whenever the members of the bot's voice channel or the timer settings
+        change, the timers are started when the bot is left alone in its channel.
+        """
+        try:
+            player = lavalink.get_player(guild.id)
+        except (KeyError, IndexError):
+            player = None
+        if (
+            player is None
+            or player.channel is None
+            or [self.bot.user] != player.channel.members
+        ):
+            was_idle = self._idle_since.pop(guild.id, None) is not None
+            self._idle_timers_armed.pop(guild.id, None)
+            if was_idle and player is not None and player.paused:
+                try:
+                    await player.pause(False)
+                except Exception as err:
+                    debug_exc_log(
+                        log,
+                        err,
+                        f"Exception raised in Audio's unpausing player for {guild.id}.",
+                    )
+            return
+        since = self._idle_since.setdefault(guild.id, time.time())
+        settings = self.guild_settings.get(guild)
+        if settings.emptydc_enabled:
+            timer = (since + settings.emptydc_timer, since, guild.id, "disconnect")
+        elif settings.emptypause_enabled:
+            timer = (since + settings.emptypause_timer, since, guild.id, "pause")
+        else:
+            self._idle_timers_armed.pop(guild.id, None)
+            return
+        if self._idle_timers_armed.get(guild.id) == timer:
+            # Voice traffic while the bot is alone doesn't change the timer.
+            return
+        self._idle_timers_armed[guild.id] = timer
+        heapq.heappush(self._idle_timers, timer)
+        self._idle_timers_updated.set()
+
     async def player_automated_timer(self) -> None:
-        stop_times: Dict = {}
-        pause_times: Dict = {}
+        async for player in AsyncIter(lavalink.all_players()):
+            await self.update_idle_timers(player.channel.guild)
         while True:
-            async for p in AsyncIter(lavalink.all_players()):
-                server = p.channel.guild
-                if await self.bot.cog_disabled_in_guild(self, server):
-                    continue
+            self._idle_timers_updated.clear()
+            if self._idle_timers:
+                timeout = self._idle_timers[0][0] - time.time()
+            else:
+                timeout = None
+            if timeout is None or timeout > 0:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._idle_timers_updated.wait(), timeout)
+                continue
+            timer = heapq.heappop(self._idle_timers)
+            __, since, guild_id, action = timer
+            # Timers are left in the heap when cancelled or replaced, skip those.
+            # A timer which ran stays armed so it isn't pushed again while idle.
+            if self._idle_timers_armed.get(guild_id) != timer:
+                continue
+            await self._run_idle_timer(guild_id, since, action)
 
-                if [self.bot.user] == p.channel.members:
-                    stop_times.setdefault(server.id, time.time())
-                    pause_times.setdefault(server.id, time.time())
-                else:
-                    stop_times.pop(server.id, None)
-                    if p.paused and server.id in pause_times:
-                        try:
-                            await p.pause(False)
-                        except Exception as err:
-                            debug_exc_log(
-                                log,
-                                err,
-                                f"Exception raised in Audio's unpausing player for {server.id}.",
-                            )
-                    pause_times.pop(server.id, None)
-            servers = stop_times.copy()
-            servers.update(pause_times)
-            async for sid in AsyncIter(servers, steps=5):
-                server_obj = self.bot.get_guild(sid)
-                if (
-                    sid in stop_times
-                    and await self.config.guild(server_obj).emptydc_enabled()
-                ):
-                    emptydc_timer = await self.config.guild(server_obj).emptydc_timer()
-                    if (time.time() - stop_times[sid]) >= emptydc_timer:
-                        stop_times.pop(sid)
-                        try:
-                            player = lavalink.get_player(sid)
-                            await self.api_interface.persistent_queue_api.drop(sid)
-                            await player.stop()
-                            await player.disconnect()
-                        except Exception as err:
-                            if "No such player for that guild" in str(err):
-                                stop_times.pop(sid, None)
-                            debug_exc_log(
-                                log,
-                                err,
-                                f"Exception raised in Audio's emptydc_timer for {sid}.",
-                            )
-                elif (
-                    sid in pause_times
-                    and await self.config.guild(server_obj).emptypause_enabled()
-                ):
-                    emptypause_timer = await self.config.guild(
-                        server_obj
-                    ).emptypause_timer()
-                    if (time.time() - pause_times.get(sid, 0)) >= emptypause_timer:
-                        try:
-                            await lavalink.get_player(sid).pause()
-                        except Exception as err:
-                            if "No such player for that guild" in str(err):
-                                pause_times.pop(sid, None)
-                            debug_exc_log(
-                                log,
-                                err,
-                                f"Exception raised in Audio's pausing for {sid}.",
-                            )
-            await asyncio.sleep(5)
+    async def _run_idle_timer(self, guild_id: int, since: float, action: str) -> None:
+        guild = self.bot.get_guild(guild_id)
+        if guild is None or await self.bot.cog_disabled_in_guild(self, guild):
+            self._idle_since.pop(guild_id, None)
+            self._idle_timers_armed.pop(guild_id, None)
+            return
+        try:
+            player = lavalink.get_player(guild_id)
+        except (KeyError, IndexError):
+            self._idle_since.pop(guild_id, None)
+            self._idle_timers_armed.pop(guild_id, None)
+            return
+        if [self.bot.user] != player.channel.members:
+            await self.update_idle_timers(guild)
+            return
+        settings = self.guild_settings.get(guild)
+        if action == "disconnect" and settings.emptydc_enabled:
+            if time.time() < since + settings.emptydc_timer:
+                return
+            self._idle_since.pop(guild_id, None)
+            self._idle_timers_armed.pop(guild_id, None)
+            try:
+                await self.api_interface.persistent_queue_api.drop(guild_id)
+                self.api_interface.clear_autoplay(guild_id)
+                await player.stop()
+                await player.disconnect()
+            except Exception as err:
+                debug_exc_log(
+                    log,
+                    err,
+                    f"Exception raised in Audio's emptydc_timer for {guild_id}.",
+                )
+        elif (
+            action == "pause"
+            and settings.emptypause_enabled
+            and not settings.emptydc_enabled
+        ):
+            if time.time() < since + settings.emptypause_timer:
+                return
+            try:
+                await player.pause()
+            except Exception as err:
+                debug_exc_log(
+                    log, err, f"Exception raised in Audio's pausing for {guild_id}."
+                )
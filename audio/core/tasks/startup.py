@@ -2,10 +2,12 @@ import asyncio
 import datetime
 import itertools
 import logging
+from collections import Counter
 from pathlib import Path
 
-from typing import Optional
+from typing import Final, List, Optional
 
+import discord
 import lavalink
 
 from redbot.core.data_manager import cog_data_path
@@ -13,8 +15,11 @@ from redbot.core.i18n import Translator
 from redbot.core.utils._internal_utils import send_to_owners_with_prefix_replaced
 from redbot.core.utils.dbtools import APSWConnectionWrapper
 
+from ...apis.daily_playlists import DailyPlaylistRecorder
 from ...apis.interface import AudioAPIInterface
+from ...apis.playlist_refresher import PlaylistRefresher
 from ...apis.playlist_wrapper import PlaylistWrapper
+from ...audio_dataclasses import QueueEntry
 from ...audio_logging import debug_exc_log
 from ...utils import task_callback
 from ..abc import MixinMeta
@@ -22,6 +27,8 @@ from ..cog_utils import _OWNER_NOTIFICATION, _SCHEMA_VERSION, CompositeMetaClass
 
 log = logging.getLogger("red.cogs.Audio.cog.Tasks.startup")
 _ = Translator("Audio", Path(__file__))
+_RESTORE_CONCURRENCY: Final[int] = 10
+_RESTORE_TIMEOUT: Final[int] = 120
 
 
 class StartUpTasks(MixinMeta, metaclass=CompositeMetaClass):
@@ -36,6 +43,7 @@ class StartUpTasks(MixinMeta, metaclass=CompositeMetaClass):
         await self.bot.wait_until_red_ready()
         # Unlike most cases, we want the cache to exit before migration.
         try:
+            await self.guild_settings.load()
             await self.maybe_message_all_owners()
             self.db_conn = APSWConnectionWrapper(
                 str(cog_data_path(self.bot.get_cog("Audio")) / "Audio.db")
@@ -57,6 +65,15 @@ class StartUpTasks(MixinMeta, metaclass=CompositeMetaClass):
             )
             await self.playlist_api.delete_scheduled()
             await self.api_interface.persistent_queue_api.delete_scheduled()
+            self.daily_playlist_recorder = DailyPlaylistRecorder(
+                self.bot, self.playlist_api
+            )
+            self.daily_playlist_recorder.start()
+            self.playlist_refresher = PlaylistRefresher(
+                self.bot, self.config, self.playlist_api, self
+            )
+            self.playlist_refresher.start()
+            self.jvm_sizer.start()
             self.lavalink_restart_connect()
             self.player_automated_timer_task = self.bot.loop.create_task(
                 self.player_automated_timer()
@@ -74,81 +91,109 @@ class StartUpTasks(MixinMeta, metaclass=CompositeMetaClass):
         self.cog_ready_event.set()
 
     async def restore_players(self):
-        tries = 0
         tracks_to_restore = await self.api_interface.persistent_queue_api.fetch_all()
         await asyncio.sleep(10)
+        guilds_to_restore = []
         for guild_id, track_data in itertools.groupby(
             tracks_to_restore, key=lambda x: x.guild_id
         ):
-            await asyncio.sleep(0)
-            try:
-                player: Optional[lavalink.Player]
-                track_data = list(track_data)
-                guild = self.bot.get_guild(guild_id)
-                if not guild:
-                    continue
-                persist_cache = self._persist_queue_cache.setdefault(
-                    guild_id, await self.config.guild(guild).persist_queue()
-                )
-                if not persist_cache:
-                    await self.api_interface.persistent_queue_api.drop(guild_id)
-                    continue
-                if self.lavalink_connection_aborted:
-                    player = None
-                else:
-                    try:
-                        player = lavalink.get_player(guild_id)
-                    except IndexError:
-                        player = None
-                    except KeyError:
-                        player = None
-
-                vc = 0
-                if player is None:
-                    while tries < 25 and vc is not None:
-                        try:
-                            vc = guild.get_channel(track_data[-1].room_id)
-                            await lavalink.connect(vc)
-                            player = lavalink.get_player(guild.id)
-                            player.store("connect", datetime.datetime.utcnow())
-                            player.store("guild", guild_id)
-                            await self.self_deafen(player)
-                            break
-                        except IndexError:
-                            await asyncio.sleep(5)
-                            tries += 1
-                        except Exception as exc:
-                            debug_exc_log(
-                                log, exc, "Failed to restore music voice channel"
-                            )
-                            if vc is None:
-                                break
-
-                if tries >= 25 or guild is None or vc is None:
-                    await self.api_interface.persistent_queue_api.drop(guild_id)
-                    continue
-
-                shuffle = await self.config.guild(guild).shuffle()
-                repeat = await self.config.guild(guild).repeat()
-                volume = await self.config.guild(guild).volume()
-                shuffle_bumped = await self.config.guild(guild).shuffle_bumped()
-                player.repeat = repeat
-                player.shuffle = shuffle
-                player.shuffle_bumped = shuffle_bumped
-                if player.volume != volume:
-                    await player.set_volume(volume)
-                for track in track_data:
-                    track = track.track_object
-                    player.add(
-                        guild.get_member(track.extras.get("requester")) or guild.me,
-                        track,
-                    )
-                player.maybe_shuffle()
-                if guild.id not in self._ll_guild_updates:
-                    await player.play()
-            except Exception as err:
-                debug_exc_log(log, err, f"Error restoring player in {guild_id}")
+            track_data = list(track_data)
+            guild = self.bot.get_guild(guild_id)
+            if not guild:
+                continue
+            persist_cache = self.guild_settings.get(guild).persist_queue
+            if not persist_cache:
                 await self.api_interface.persistent_queue_api.drop(guild_id)
+                continue
+            guilds_to_restore.append((guild, track_data))
+
+        def _listeners(entry) -> int:
+            vc = entry[0].get_channel(entry[1][-1].room_id)
+            return sum(not m.bot for m in vc.members) if vc is not None else 0
+
+        # Restore the players people are waiting on first
+        guilds_to_restore.sort(key=_listeners, reverse=True)
+        progress = Counter(total=len(guilds_to_restore))
+        semaphore = asyncio.Semaphore(_RESTORE_CONCURRENCY)
+
+        async def _restore(guild, track_data) -> None:
+            async with semaphore:
+                try:
+                    restored = await asyncio.wait_for(
+                        self._restore_player(guild, track_data),
+                        timeout=_RESTORE_TIMEOUT,
+                    )
+                except asyncio.TimeoutError:
+                    restored = False
+                    log.debug(f"Timed out restoring player in {guild.id}")
+                except Exception as err:
+                    restored = False
+                    debug_exc_log(log, err, f"Error restoring player in {guild.id}")
+                if restored:
+                    progress["restored"] += 1
+                else:
+                    progress["failed"] += 1
+                    await self.api_interface.persistent_queue_api.drop(guild.id)
+                log.debug(
+                    f"Player restore progress: {progress['restored']}/"
+                    f"{progress['total']} restored, {progress['failed']} failed"
+                )
+
+        await asyncio.gather(
+            *(_restore(guild, track_data) for guild, track_data in guilds_to_restore)
+        )
+        if progress["total"]:
+            log.info(
+                f"Restored {progress['restored']}/{progress['total']} players "
+                f"({progress['failed']} failed)"
+            )
+
+    async def _restore_player(self, guild: discord.Guild, track_data: List) -> bool:
+        player: Optional[lavalink.Player]
+        if self.lavalink_connection_aborted:
+            player = None
+        else:
+            try:
+                player = lavalink.get_player(guild.id)
+            except (IndexError, KeyError):
+                player = None
+
+        if player is None:
+            vc = guild.get_channel(track_data[-1].room_id)
+            if vc is None:
+                return False
+            while True:
+                try:
+                    await self.node_pool.connect(vc)
+                    break
+                except IndexError:
+                    # No Lavalink node ready yet, the caller's timeout bounds the retries
+                    await asyncio.sleep(5)
+            player = lavalink.get_player(guild.id)
+            player.store("connect", datetime.datetime.utcnow())
+            player.store("guild", guild.id)
+            await self.self_deafen(player)
+
+        settings = self.guild_settings.get(guild)
+        player.repeat = settings.repeat
+        player.shuffle = settings.shuffle
+        player.shuffle_bumped = settings.shuffle_bumped
+        if player.volume != settings.volume:
+            await player.set_volume(settings.volume)
+        queue_entries = []
+        for track in track_data:
+            queue_entry = QueueEntry.from_track(track.track_object)
+            queue_entry.requester = (
+                guild.get_member(queue_entry.extras.get("requester")) or guild.me
+            )
+            queue_entries.append(queue_entry)
+        player.queue.extend(queue_entries)
+        player.maybe_shuffle()
+        if guild.id not in self._ll_guild_updates:
+            await player.play()
+        # The channel may have emptied while the bot was offline.
+        await self.update_idle_timers(guild)
+        return True
 
     async def maybe_message_all_owners(self):
         current_notification = await self.config.owner_notification()
@@ -109,7 +109,7 @@ class FormattingUtilities(MixinMeta, metaclass=CompositeMetaClass):
                     ctx, title=msg, description=description
                 )
             try:
-                await lavalink.connect(ctx.author.voice.channel)
+                await self.node_pool.connect(ctx.author.voice.channel)
                 player = lavalink.get_player(ctx.guild.id)
                 player.store("connect", datetime.datetime.utcnow())
                 await self.self_deafen(player)
@@ -352,7 +352,7 @@ class FormattingUtilities(MixinMeta, metaclass=CompositeMetaClass):
                     string = f'**{escape(f"{string}", formatting=True)}**'
             else:
                 if track.is_stream:
-                    icy = await self.icyparser(track.uri)
+                    icy = self.get_icy_title(track.uri)
                     if icy:
                         title = icy
                     else:
@@ -393,7 +393,7 @@ class FormattingUtilities(MixinMeta, metaclass=CompositeMetaClass):
                     return query.to_string_user()
             else:
                 if track.is_stream:
-                    icy = await self.icyparser(track.uri)
+                    icy = self.get_icy_title(track.uri)
                     if icy:
                         title = icy
                     else:
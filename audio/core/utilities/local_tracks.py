@@ -1,8 +1,7 @@
-import contextlib
 import logging
 
 from pathlib import Path
-from typing import List, Union
+from typing import Final, List, Union
 
 import lavalink
 
@@ -12,12 +11,13 @@ from redbot.core.i18n import Translator
 from redbot.core.utils import AsyncIter
 
 from ...audio_dataclasses import LocalPath, Query
-from ...errors import TrackEnqueueError
+from ...utils import Notifier
 from ..abc import MixinMeta
 from ..cog_utils import CompositeMetaClass
 
 log = logging.getLogger("red.cogs.Audio.cog.Utilities.local_tracks")
 _ = Translator("Audio", Path(__file__))
+_NOTIFY_THRESHOLD: Final[int] = 50
 
 
 class LocalTrackUtilities(MixinMeta, metaclass=CompositeMetaClass):
@@ -66,16 +66,18 @@ class LocalTrackUtilities(MixinMeta, metaclass=CompositeMetaClass):
                 return []
         except ValueError:
             return []
-        local_tracks = []
-        async for local_file in AsyncIter(
-            await self.get_all_localtrack_folder_tracks(ctx, query)
-        ):
-            with contextlib.suppress(IndexError, TrackEnqueueError):
-                trackdata, called_api = await self.api_interface.fetch_track(
-                    ctx, player, local_file
-                )
-                local_tracks.append(trackdata.tracks[0])
-        return local_tracks
+        local_files = await self.get_all_localtrack_folder_tracks(ctx, query)
+        notifier = None
+        if len(local_files) > _NOTIFY_THRESHOLD:
+            playlist_msg = await self.send_embed_msg(
+                ctx, title=_("Please wait, loading tracks...")
+            )
+            notifier = Notifier(
+                ctx, playlist_msg, {"lavalink": _("Loading track {num}/{total}...")}
+            )
+        return await self.api_interface.fetch_local_tracks(
+            ctx, player, local_files, notifier=notifier
+        )
 
     async def _local_play_all(
         self, ctx: commands.Context, query: Query, from_search: bool = False
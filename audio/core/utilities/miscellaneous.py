@@ -3,9 +3,22 @@ import contextlib
 import datetime
 import functools
 import logging
+import math
 import re
+import time
 from pathlib import Path
-from typing import Any, Final, Mapping, MutableMapping, Pattern, Union, cast
+from typing import (
+    Any,
+    Final,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+    cast,
+)
 
 import discord
 import lavalink
@@ -32,6 +45,8 @@ _RE_TIME_CONVERTER: Final[Pattern] = re.compile(
     r"(?:(\d+):)?([0-5]?[0-9]):([0-5][0-9])"
 )
 _prefer_lyrics_cache = {}
+_PLAYER_SNAPSHOT_TTL: Final[int] = 15
+_AUDIOSTATS_CONCURRENCY: Final[int] = 5
 
 
 class MiscellaneousUtilities(MixinMeta, metaclass=CompositeMetaClass):
@@ -115,6 +130,11 @@ class MiscellaneousUtilities(MixinMeta, metaclass=CompositeMetaClass):
             await self.api_interface.run_tasks(ctx)
 
     async def _close_database(self) -> None:
+        if self.playlist_refresher is not None:
+            self.playlist_refresher.close()
+        self.jvm_sizer.close()
+        if self.daily_playlist_recorder is not None:
+            await self.daily_playlist_recorder.close()
         if self.api_interface is not None:
             await self.api_interface.run_all_pending_tasks()
             self.api_interface.close()
@@ -218,15 +238,7 @@ class MiscellaneousUtilities(MixinMeta, metaclass=CompositeMetaClass):
 
     async def queue_duration(self, ctx: commands.Context) -> int:
         player = lavalink.get_player(ctx.guild.id)
-        dur = [
-            i.length
-            async for i in AsyncIter(player.queue, steps=50).filter(
-                lambda x: not x.is_stream
-            )
-        ]
-        queue_dur = sum(dur)
-        if not player.queue:
-            queue_dur = 0
+        queue_dur = self.get_queue_stats(player).duration
         try:
             if not player.current.is_stream:
                 remain = player.current.length - player.position
@@ -237,6 +249,62 @@ class MiscellaneousUtilities(MixinMeta, metaclass=CompositeMetaClass):
         queue_total_duration = remain + queue_dur
         return queue_total_duration
 
+    def get_player_snapshot(
+        self,
+    ) -> List[Tuple[str, datetime.datetime, Optional[lavalink.Track], bool]]:
+        """Return the state of all players, refreshed at most every few seconds."""
+        snapshot_time, snapshot = self._player_snapshot
+        if time.time() - snapshot_time > _PLAYER_SNAPSHOT_TTL:
+            snapshot = [
+                (p.channel.guild.name, p.fetch("connect"), p.current, p.is_playing)
+                for p in lavalink.all_players()
+            ]
+            self._player_snapshot = (time.time(), snapshot)
+        return snapshot
+
+    async def _build_audiostats_page(
+        self,
+        ctx: commands.Context,
+        snapshot: List[Tuple[str, datetime.datetime, Optional[lavalink.Track], bool]],
+        page_num: int,
+    ) -> discord.Embed:
+        semaphore = asyncio.Semaphore(_AUDIOSTATS_CONCURRENCY)
+        now = datetime.datetime.utcnow()
+
+        async def _format_line(guild_name, connect_start, current, is_playing) -> str:
+            connect_dur = self.get_time_string(
+                int((now - connect_start).total_seconds()) if connect_start else 0
+            )
+            if not current:
+                return "{} [`{}`]: **{}**".format(
+                    guild_name, connect_dur, _("Nothing playing.")
+                )
+            async with semaphore:
+                current_title = await self.get_track_description(
+                    current, self.local_folder_current_path, shorten=True
+                )
+            return "{} [`{}`]: {}".format(guild_name, connect_dur, current_title)
+
+        idx_start = (page_num - 1) * 10
+        lines = await asyncio.gather(
+            *(_format_line(*entry) for entry in snapshot[idx_start : idx_start + 10])
+        )
+        embed = discord.Embed(
+            colour=await ctx.embed_colour(),
+            title=_("Playing in {num}/{total} servers:").format(
+                num=humanize_number(sum(1 for entry in snapshot if entry[3])),
+                total=humanize_number(len(snapshot)),
+            ),
+            description="\n".join(lines),
+        )
+        embed.set_footer(
+            text=_("Page {}/{}").format(
+                humanize_number(page_num),
+                humanize_number(math.ceil(len(snapshot) / 10)),
+            )
+        )
+        return embed
+
     async def track_remaining_duration(self, ctx: commands.Context) -> int:
         player = lavalink.get_player(ctx.guild.id)
         if not player.current:
@@ -358,6 +426,15 @@ class MiscellaneousUtilities(MixinMeta, metaclass=CompositeMetaClass):
                     await p.save()
                 await self.config.custom(scope).clear()
             await self.config.schema_version.set(3)
+        if from_version < 4 <= to_version:
+            await self.playlist_api.migrate_track_encoding()
+            await self.config.schema_version.set(4)
+        if from_version < 5 <= to_version:
+            await self.playlist_api.migrate_to_playlist_tracks()
+            await self.config.schema_version.set(5)
+        if from_version < 6 <= to_version:
+            await self.playlist_api.rebuild_summaries()
+            await self.config.schema_version.set(6)
 
         if database_entries:
             await self.api_interface.local_cache_api.lavalink.insert(database_entries)
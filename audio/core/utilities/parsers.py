@@ -1,17 +1,24 @@
+import asyncio
 import logging
 import re
 import struct
+import time
 
 from typing import Final, Optional
 
 import aiohttp
+import lavalink
 
+from ...audio_logging import debug_exc_log
+from ...utils import task_callback
 from ..abc import MixinMeta
 from ..cog_utils import CompositeMetaClass
 
 log = logging.getLogger("red.cogs.Audio.cog.Utilities.Parsing")
 
 STREAM_TITLE: Final[re.Pattern] = re.compile(br"StreamTitle='([^']*)';")
+_ICY_REFRESH_INTERVAL: Final[int] = 15
+_ICY_TTL: Final[int] = 60
 
 
 class ParsingUtilities(MixinMeta, metaclass=CompositeMetaClass):
@@ -35,3 +42,63 @@ class ParsingUtilities(MixinMeta, metaclass=CompositeMetaClass):
                         return None
         except (KeyError, aiohttp.ClientConnectionError, aiohttp.ClientResponseError):
             return None
+
+    def update_playing_stream(
+        self, guild_id: int, track: Optional[lavalink.Track]
+    ) -> None:
+        """Record the stream a guild's player started, ``None`` once it stopped."""
+        previous = self._player_streams.pop(guild_id, None)
+        if previous is not None:
+            guild_ids = self._stream_players.get(previous, set())
+            guild_ids.discard(guild_id)
+            if not guild_ids:
+                self._stream_players.pop(previous, None)
+        if track is not None and track.is_stream and track.uri:
+            self._player_streams[guild_id] = track.uri
+            self._stream_players.setdefault(track.uri, set()).add(guild_id)
+
+    def _is_stream_playing(self, url: str) -> bool:
+        # A player can go away without a track end event, forget those.
+        for guild_id in list(self._stream_players.get(url, ())):
+            try:
+                current = lavalink.get_player(guild_id).current
+            except (KeyError, IndexError):
+                current = None
+            if current is None or current.uri != url:
+                self.update_playing_stream(guild_id, None)
+        return url in self._stream_players
+
+    def get_icy_title(self, url: str) -> Optional[str]:
+        """Return the cached stream title for the url.
+
+        This never does any network I/O, a background task is started to keep the title
+        for the url fresh while a player is streaming it.
+        """
+        if url not in self._icy_tasks and url in self._stream_players:
+            task = self.bot.loop.create_task(self._icy_refresher(url))
+            task.add_done_callback(task_callback)
+            self._icy_tasks[url] = task
+        fetched_at, title = self._icy_cache.get(url, (0, None))
+        if time.time() - fetched_at > _ICY_TTL:
+            return None
+        return title
+
+    async def _icy_refresher(self, url: str) -> None:
+        try:
+            while self._is_stream_playing(url):
+                try:
+                    title = await asyncio.wait_for(
+                        self.icyparser(url), timeout=_ICY_REFRESH_INTERVAL
+                    )
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError):
+                    title = None
+                except Exception as exc:
+                    debug_exc_log(
+                        log, exc, f"Failed to fetch the stream title of {url}"
+                    )
+                    title = None
+                self._icy_cache[url] = (time.time(), title)
+                await asyncio.sleep(_ICY_REFRESH_INTERVAL)
+        finally:
+            self._icy_tasks.pop(url, None)
+            self._icy_cache.pop(url, None)
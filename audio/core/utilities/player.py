@@ -14,7 +14,7 @@ from redbot.core.i18n import Translator
 from redbot.core.utils import AsyncIter
 from redbot.core.utils.chat_formatting import bold, escape
 
-from ...audio_dataclasses import _PARTIALLY_SUPPORTED_MUSIC_EXT, Query
+from ...audio_dataclasses import _PARTIALLY_SUPPORTED_MUSIC_EXT, Query, QueueEntry
 from ...audio_logging import IS_DEBUG, debug_exc_log
 from ...errors import QueryUnauthorized, SpotifyFetchError, TrackEnqueueError
 from ...utils import Notifier
@@ -87,9 +87,7 @@ class PlayerUtilities(MixinMeta, metaclass=CompositeMetaClass):
     async def _can_instaskip(
         self, ctx: commands.Context, member: discord.Member
     ) -> bool:
-        dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
-        )
+        dj_enabled = self.guild_settings.get(ctx.guild).dj_enabled
 
         if member.bot:
             return True
@@ -117,9 +115,7 @@ class PlayerUtilities(MixinMeta, metaclass=CompositeMetaClass):
         return not nonbots
 
     async def _has_dj_role(self, ctx: commands.Context, member: discord.Member) -> bool:
-        dj_role = self._dj_role_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_role()
-        )
+        dj_role = self.guild_settings.get(ctx.guild).dj_role
         dj_role_obj = ctx.guild.get_role(dj_role)
         return dj_role_obj in ctx.guild.get_member(member.id).roles
 
@@ -136,7 +132,7 @@ class PlayerUtilities(MixinMeta, metaclass=CompositeMetaClass):
         self, ctx: commands.Context, skip_to_track: int = None
     ) -> None:
         player = lavalink.get_player(ctx.guild.id)
-        autoplay = await self.config.guild(player.channel.guild).auto_play()
+        autoplay = self.guild_settings.get(player.channel.guild).auto_play
         if not player.current or (not player.queue and not autoplay):
             try:
                 pos, dur = player.position, player.current.length
@@ -232,7 +228,7 @@ class PlayerUtilities(MixinMeta, metaclass=CompositeMetaClass):
         guild_id = self.rgetattr(player, "channel.guild.id", None)
         if not guild_id:
             return
-        if not await self.config.guild_from_id(guild_id).auto_deafen():
+        if not self.guild_settings.get_from_id(guild_id).auto_deafen:
             return
         channel_id = player.channel.id
         node = player.manager.node
@@ -397,7 +393,7 @@ class PlayerUtilities(MixinMeta, metaclass=CompositeMetaClass):
                 )
         except KeyError:
             self.update_player_lock(ctx, True)
-        guild_data = await self.config.guild(ctx.guild).all()
+        settings = self.guild_settings.get(ctx.guild)
         first_track_only = False
         single_track = None
         index = None
@@ -497,8 +493,8 @@ class PlayerUtilities(MixinMeta, metaclass=CompositeMetaClass):
                             f"Query is not allowed in {ctx.guild} ({ctx.guild.id})"
                         )
                     continue
-                elif guild_data["maxlength"] > 0:
-                    if self.is_track_length_allowed(track, guild_data["maxlength"]):
+                elif settings.maxlength > 0:
+                    if self.is_track_length_allowed(track, settings.maxlength):
                         track_len += 1
                         track.extras.update(
                             {
@@ -507,7 +503,8 @@ class PlayerUtilities(MixinMeta, metaclass=CompositeMetaClass):
                                 "requester": ctx.author.id,
                             }
                         )
-                        player.add(ctx.author, track)
+                        queue_entry = QueueEntry.from_track(track)
+                        player.add(ctx.author, queue_entry)
                         self.bot.dispatch(
                             "red_audio_track_enqueue",
                             player.channel.guild,
@@ -524,7 +521,8 @@ class PlayerUtilities(MixinMeta, metaclass=CompositeMetaClass):
                             "requester": ctx.author.id,
                         }
                     )
-                    player.add(ctx.author, track)
+                    queue_entry = QueueEntry.from_track(track)
+                    player.add(ctx.author, queue_entry)
                     self.bot.dispatch(
                         "red_audio_track_enqueue",
                         player.channel.guild,
@@ -553,7 +551,7 @@ class PlayerUtilities(MixinMeta, metaclass=CompositeMetaClass):
                     num=track_len, maxlength_msg=maxlength_msg
                 )
             )
-            if not guild_data["shuffle"] and queue_dur > 0:
+            if not settings.shuffle and queue_dur > 0:
                 embed.set_footer(
                     text=_(
                         "{time} until start of playlist playback: starts at #{position} in queue"
@@ -606,10 +604,8 @@ class PlayerUtilities(MixinMeta, metaclass=CompositeMetaClass):
                     return await self.send_embed_msg(
                         ctx, title=_("This track is not allowed in this server.")
                     )
-                elif guild_data["maxlength"] > 0:
-                    if self.is_track_length_allowed(
-                        single_track, guild_data["maxlength"]
-                    ):
+                elif settings.maxlength > 0:
+                    if self.is_track_length_allowed(single_track, settings.maxlength):
                         single_track.extras.update(
                             {
                                 "enqueue_time": int(time.time()),
@@ -661,7 +657,7 @@ class PlayerUtilities(MixinMeta, metaclass=CompositeMetaClass):
                 single_track, self.local_folder_current_path
             )
             embed = discord.Embed(title=_("Track Enqueued"), description=description)
-            if not guild_data["shuffle"] and queue_dur > 0:
+            if not settings.shuffle and queue_dur > 0:
                 embed.set_footer(
                     text=_("{time} until track playback: #{position} in queue").format(
                         time=queue_total_duration, position=before_queue_length + 1
@@ -741,10 +737,11 @@ class PlayerUtilities(MixinMeta, metaclass=CompositeMetaClass):
 
     async def set_player_settings(self, ctx: commands.Context) -> None:
         player = lavalink.get_player(ctx.guild.id)
-        shuffle = await self.config.guild(ctx.guild).shuffle()
-        repeat = await self.config.guild(ctx.guild).repeat()
-        volume = await self.config.guild(ctx.guild).volume()
-        shuffle_bumped = await self.config.guild(ctx.guild).shuffle_bumped()
+        settings = self.guild_settings.get(ctx.guild)
+        shuffle = settings.shuffle
+        repeat = settings.repeat
+        volume = settings.volume
+        shuffle_bumped = settings.shuffle_bumped
         player.repeat = repeat
         player.shuffle = shuffle
         player.shuffle_bumped = shuffle_bumped
@@ -1,24 +1,29 @@
 import asyncio
 import contextlib
 import datetime
+import functools
 import logging
 import math
+import time
+import zlib
 from pathlib import Path
 
-from typing import List, MutableMapping, Optional, Tuple, Union
+from typing import Final, List, MutableMapping, Optional, Tuple, Union
 
 import discord
 import lavalink
 from discord.embeds import EmptyEmbed
 
 from redbot.core import commands
+from redbot.core.data_manager import cog_data_path
 from redbot.core.i18n import Translator
 from redbot.core.utils import AsyncIter
 from redbot.core.utils.chat_formatting import box
 from redbot.core.utils.menus import start_adding_reactions
 from redbot.core.utils.predicates import ReactionPredicate
 
-from ...apis.playlist_interface import Playlist, create_playlist
+from ...apis import playlist_operations
+from ...apis.playlist_interface import Playlist, create_playlist, delete_playlist
 from ...audio_dataclasses import _PARTIALLY_SUPPORTED_MUSIC_EXT, Query
 from ...audio_logging import debug_exc_log
 from ...errors import TooManyMatches, TrackEnqueueError
@@ -32,6 +37,11 @@ except ImportError:
     import json
 log = logging.getLogger("red.cogs.Audio.cog.Utilities.playlists")
 _ = Translator("Audio", Path(__file__))
+_RESOLVE_CONCURRENCY: Final[int] = 5
+_RESOLVE_BATCH_SIZE: Final[int] = 50
+_UPLOAD_BATCH_SIZE: Final[int] = 500
+_UPLOAD_READ_SIZE: Final[int] = 64 * 1024
+_MAX_PLAYLIST_TRACKS: Final[int] = 10000
 
 
 class PlaylistUtilities(MixinMeta, metaclass=CompositeMetaClass):
@@ -60,9 +70,7 @@ class PlaylistUtilities(MixinMeta, metaclass=CompositeMetaClass):
             if not is_different_user:
                 has_perms = True
         elif playlist.scope == PlaylistScope.GUILD.value and not is_different_guild:
-            dj_enabled = self._dj_status_cache.setdefault(
-                ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
-            )
+            dj_enabled = self.guild_settings.get(ctx.guild).dj_enabled
             if (
                 guild.owner_id == ctx.author.id
                 or (dj_enabled and await self._has_dj_role(ctx, ctx.author))
@@ -268,7 +276,7 @@ class PlaylistUtilities(MixinMeta, metaclass=CompositeMetaClass):
                 number=number,
                 playlist=playlist,
                 scope=self.humanize_scope(playlist.scope),
-                tracks=len(playlist.tracks),
+                tracks=playlist.track_count,
                 author=author,
             )
             playlists += line
@@ -432,7 +440,6 @@ class PlaylistUtilities(MixinMeta, metaclass=CompositeMetaClass):
         guild: Union[discord.Guild],
     ):
         track_list = []
-        successful_count = 0
         uploaded_track_count = len(uploaded_track_list)
 
         embed1 = discord.Embed(title=_("Please wait, adding tracks..."))
@@ -440,45 +447,31 @@ class PlaylistUtilities(MixinMeta, metaclass=CompositeMetaClass):
         notifier = Notifier(
             ctx, playlist_msg, {"playlist": _("Loading track {num}/{total}...")}
         )
-        async for track_count, song_url in AsyncIter(uploaded_track_list).enumerate(
-            start=1
-        ):
+        for start in range(0, uploaded_track_count, _RESOLVE_BATCH_SIZE):
             try:
-                try:
-                    result, called_api = await self.api_interface.fetch_track(
+                track_list.extend(
+                    await self._resolve_playlist_entries(
                         ctx,
                         player,
-                        Query.process_input(song_url, self.local_folder_current_path),
-                    )
-                except TrackEnqueueError:
-                    self.update_player_lock(ctx, False)
-                    return await self.send_embed_msg(
-                        ctx,
-                        title=_("Unable to Get Track"),
-                        description=_(
-                            "I'm unable to get a track from Lavalink at the moment, "
-                            "try again in a few minutes."
-                        ),
+                        uploaded_track_list[start : start + _RESOLVE_BATCH_SIZE],
                     )
-                except Exception as e:
-                    self.update_player_lock(ctx, False)
-                    raise e
-
-                track = result.tracks[0]
-            except Exception as err:
-                debug_exc_log(log, err, f"Failed to get track for {song_url}")
-                continue
-            try:
-                track_obj = self.get_track_json(player, other_track=track)
-                track_list.append(track_obj)
-                successful_count += 1
-            except Exception as err:
-                debug_exc_log(log, err, f"Failed to create track for {track}")
-                continue
-            if (track_count % 2 == 0) or (track_count == len(uploaded_track_list)):
-                await notifier.notify_user(
-                    current=track_count, total=len(uploaded_track_list), key="playlist"
                 )
+            except TrackEnqueueError:
+                self.update_player_lock(ctx, False)
+                return await self.send_embed_msg(
+                    ctx,
+                    title=_("Unable to Get Track"),
+                    description=_(
+                        "I'm unable to get a track from Lavalink at the moment, "
+                        "try again in a few minutes."
+                    ),
+                )
+            await notifier.notify_user(
+                current=min(start + _RESOLVE_BATCH_SIZE, uploaded_track_count),
+                total=uploaded_track_count,
+                key="playlist",
+            )
+        successful_count = len(track_list)
         playlist = await create_playlist(
             ctx,
             self.playlist_api,
@@ -513,20 +506,228 @@ class PlaylistUtilities(MixinMeta, metaclass=CompositeMetaClass):
         )
         await playlist_msg.edit(embed=embed3)
 
+    async def _resolve_playlist_entries(
+        self,
+        ctx: commands.Context,
+        player: lavalink.player_manager.Player,
+        entries: List[Union[str, MutableMapping]],
+    ) -> List[MutableMapping]:
+        """Get the tracks of uploaded playlist entries, in order.
+
+        Entries which are already tracks are kept as they are, only the ones
+        with just an url are loaded from Lavalink, a few at a time.
+        Entries which can't be loaded are skipped.
+        """
+        semaphore = asyncio.Semaphore(_RESOLVE_CONCURRENCY)
+
+        async def _resolve(
+            entry: Union[str, MutableMapping]
+        ) -> Optional[MutableMapping]:
+            if not isinstance(entry, str):
+                if entry.get("track"):
+                    return entry
+                entry = (entry.get("info") or {}).get("uri")
+                if not entry:
+                    return None
+            async with semaphore:
+                try:
+                    result, called_api = await self.api_interface.fetch_track(
+                        ctx,
+                        player,
+                        Query.process_input(entry, self.local_folder_current_path),
+                    )
+                    return self.get_track_json(player, other_track=result.tracks[0])
+                except TrackEnqueueError:
+                    raise
+                except Exception as err:
+                    debug_exc_log(log, err, f"Failed to get track for {entry}")
+                    return None
+
+        tracks = await asyncio.gather(*(_resolve(entry) for entry in entries))
+        return [track for track in tracks if track]
+
+    async def _load_lines_playlist(
+        self,
+        ctx: commands.Context,
+        player: lavalink.player_manager.Player,
+        file_url: str,
+        scope: str,
+        author: Union[discord.User, discord.Member],
+        guild: Union[discord.Guild],
+    ) -> None:
+        """Import a playlist file written by ``[p]playlist download``.
+
+        The file is parsed while it is being downloaded and its tracks are saved
+        in batches, so the whole playlist is never held in memory.
+        The playlist is deleted again if the import doesn't complete.
+        """
+        embed1 = discord.Embed(title=_("Please wait, adding tracks..."))
+        playlist_msg = await self.send_embed_msg(ctx, embed=embed1)
+        notifier = Notifier(
+            ctx, playlist_msg, {"playlist": _("Loading track {num}/{total}...")}
+        )
+        reader = playlist_operations.LinesReader()
+        playlist: Optional[Playlist] = None
+        header: Optional[MutableMapping] = None
+        pending: List[MutableMapping] = []
+        uploaded_track_count = 0
+        successful_count = 0
+        imported = False
+
+        async def _save_pending() -> None:
+            nonlocal pending, successful_count
+            tracks = await self._resolve_playlist_entries(ctx, player, pending)
+            pending = []
+            if tracks:
+                try:
+                    successful_count += await playlist.append_tracks(tracks)
+                except Exception as exc:
+                    # The batch is reported with the tracks which couldn't be loaded
+                    debug_exc_log(
+                        log, exc, f"Failed to save tracks to playlist ID: {playlist.id}"
+                    )
+            await notifier.notify_user(
+                current=uploaded_track_count,
+                total=max(header.get("track_count", 0), uploaded_track_count),
+                key="playlist",
+            )
+
+        async def _add_entries(entries: List[MutableMapping]) -> None:
+            nonlocal playlist, header, uploaded_track_count
+            if header is None and entries:
+                header = entries.pop(0)
+                if not isinstance(header, dict) or header.get("schema", 0) < 3:
+                    raise ValueError("Not a playlist file")
+                playlist = await create_playlist(
+                    ctx,
+                    self.playlist_api,
+                    scope,
+                    header.get("name") or file_url.rsplit("/", 1)[-1],
+                    header.get("playlist_url"),
+                    None,
+                    author,
+                    guild,
+                )
+            for entry in entries:
+                if uploaded_track_count >= _MAX_PLAYLIST_TRACKS:
+                    return
+                uploaded_track_count += 1
+                pending.append(entry)
+                if len(pending) >= _UPLOAD_BATCH_SIZE:
+                    await _save_pending()
+
+        try:
+            async with self.session.request("GET", file_url) as r:
+                async for chunk in r.content.iter_chunked(_UPLOAD_READ_SIZE):
+                    entries = await playlist_operations.run(reader.feed, chunk)
+                    await _add_entries(entries)
+                    if uploaded_track_count >= _MAX_PLAYLIST_TRACKS:
+                        break
+                else:
+                    await _add_entries(await playlist_operations.run(reader.close))
+            if playlist is None:
+                raise ValueError("Empty playlist file")
+            if pending:
+                await _save_pending()
+            imported = True
+        except (ValueError, zlib.error):
+            return await self.send_embed_msg(ctx, title=_("Not a valid playlist file."))
+        except TrackEnqueueError:
+            self.update_player_lock(ctx, False)
+            return await self.send_embed_msg(
+                ctx,
+                title=_("Unable to Get Track"),
+                description=_(
+                    "I'm unable to get a track from Lavalink at the moment, "
+                    "try again in a few minutes."
+                ),
+            )
+        finally:
+            if not imported and playlist is not None:
+                await delete_playlist(
+                    self.bot, self.playlist_api, scope, playlist.id, guild, author
+                )
+
+        scope_name = self.humanize_scope(
+            scope, ctx=guild if scope == PlaylistScope.GUILD.value else author
+        )
+        if not successful_count:
+            msg = _("Empty playlist {name} (`{id}`) [**{scope}**] created.").format(
+                name=playlist.name, id=playlist.id, scope=scope_name
+            )
+        elif uploaded_track_count != successful_count:
+            bad_tracks = uploaded_track_count - successful_count
+            msg = _(
+                "Added {num} tracks from the {playlist_name} playlist. {num_bad} track(s) "
+                "could not be loaded."
+            ).format(
+                num=successful_count, playlist_name=playlist.name, num_bad=bad_tracks
+            )
+        else:
+            msg = _("Added {num} tracks from the {playlist_name} playlist.").format(
+                num=successful_count, playlist_name=playlist.name
+            )
+        embed3 = discord.Embed(
+            colour=await ctx.embed_colour(), title=_("Playlist Saved"), description=msg
+        )
+        await playlist_msg.edit(embed=embed3)
+
+    async def _download_playlist_lines(
+        self, ctx: commands.Context, playlist: Playlist
+    ) -> None:
+        """Send a playlist as a file which can be used with ``[p]playlist upload``.
+
+        The file is written one page of tracks at a time in a worker thread.
+        """
+        scope, scope_id = playlist.config_scope
+        header = {
+            "schema": 3,
+            "version": "v3",
+            "id": playlist.id,
+            "author": playlist.author_id,
+            "guild": playlist.guild_id,
+            "name": playlist.name,
+            "playlist_url": playlist.url,
+            "track_count": playlist.track_count,
+        }
+        temp_file = cog_data_path(raw_name="Audio") / (
+            f"{playlist.id}{playlist_operations.PLAYLIST_FILE_SUFFIX}"
+        )
+        try:
+            await playlist_operations.run(
+                playlist_operations.export_lines,
+                temp_file,
+                header,
+                functools.partial(
+                    self.playlist_api.read_tracks, scope, playlist.id, scope_id
+                ),
+            )
+            if temp_file.stat().st_size > ctx.guild.filesize_limit - 10000:
+                await ctx.send(
+                    _("This playlist is too large to be send in this server.")
+                )
+            else:
+                await ctx.send(file=discord.File(str(temp_file)))
+        except Exception as exc:
+            debug_exc_log(log, exc, "Failed to send playlist to channel")
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                temp_file.unlink()
+
     async def _maybe_update_playlist(
         self,
         ctx: commands.Context,
         player: lavalink.player_manager.Player,
         playlist: Playlist,
-    ) -> Tuple[List[lavalink.Track], List[lavalink.Track], Playlist]:
+    ) -> Tuple[List[MutableMapping], List[MutableMapping], Playlist]:
         if playlist.url is None:
             return [], [], playlist
         results = {}
+        query = Query.process_input(playlist.url, self.local_folder_current_path)
+        # A Spotify playlist is always listed fresh from the API, only the tracks
+        # missing from the cache need to be searched again.
         updated_tracks = await self.fetch_playlist_tracks(
-            ctx,
-            player,
-            Query.process_input(playlist.url, self.local_folder_current_path),
-            skip_cache=True,
+            ctx, player, query, skip_cache=not query.is_spotify
         )
         if isinstance(updated_tracks, discord.Message):
             return [], [], playlist
@@ -536,12 +737,28 @@ class PlaylistUtilities(MixinMeta, metaclass=CompositeMetaClass):
         if updated_tracks:  # Tracks have been updated
             results["tracks"] = updated_tracks
 
-        old_tracks = playlist.tracks_obj
-        new_tracks = [lavalink.Track(data=track) for track in updated_tracks]
-        removed = list(set(old_tracks) - set(new_tracks))
-        added = list(set(new_tracks) - set(old_tracks))
-        if removed or added:
+        stored_tracks = await playlist.load_tracks()
+        added, removed = await playlist_operations.run(
+            playlist_operations.diff, stored_tracks, updated_tracks
+        )
+        new_tracks = None
+        if added and not removed:
+            new_tracks = await playlist_operations.run(
+                playlist_operations.appended_tail, stored_tracks, updated_tracks
+            )
+        # A failed write raises here, the playlist is only marked as refreshed once saved
+        if new_tracks:
+            await playlist.append_tracks(new_tracks)
+        elif removed or added:
             await playlist.edit(results)
+        if updated_tracks:
+            scope, scope_id = playlist.config_scope
+            await self.playlist_api.set_refreshed(
+                scope,
+                playlist_id=playlist.id,
+                scope_id=scope_id,
+                timestamp=int(time.time()),
+            )
 
         return added, removed, playlist
 
@@ -568,7 +785,7 @@ class PlaylistUtilities(MixinMeta, metaclass=CompositeMetaClass):
                         ),
                     )
                     return False
-                await lavalink.connect(ctx.author.voice.channel)
+                await self.node_pool.connect(ctx.author.voice.channel)
                 player = lavalink.get_player(ctx.guild.id)
                 player.store("connect", datetime.datetime.utcnow())
                 await self.self_deafen(player)
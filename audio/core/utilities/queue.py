@@ -1,8 +1,9 @@
+import asyncio
 import logging
 import math
 from pathlib import Path
 
-from typing import List, Tuple
+from typing import Final, List, Optional, Tuple, Union
 
 import discord
 import lavalink
@@ -13,15 +14,106 @@ from redbot.core.i18n import Translator
 from redbot.core.utils import AsyncIter
 from redbot.core.utils.chat_formatting import humanize_number
 
-from ...audio_dataclasses import LocalPath, Query
+from ...audio_dataclasses import LocalPath, Query, QueueEntry
+from ...utils import QueueStats, TrackQueue, task_callback
 from ..abc import MixinMeta
 from ..cog_utils import CompositeMetaClass
 
 log = logging.getLogger("red.cogs.Audio.cog.Utilities.queue")
 _ = Translator("Audio", Path(__file__))
+_LOOKAHEAD_SIZE: Final[int] = 3
 
 
 class QueueUtilities(MixinMeta, metaclass=CompositeMetaClass):
+    def get_queue_stats(self, player: lavalink.Player) -> QueueStats:
+        """Return the incrementally maintained stats for the player's queue.
+
+        The queue keeps its stats up to date itself, a queue replaced by a plain
+        list (``Player.stop`` and the shuffles do so) is wrapped again here.
+        """
+        if not isinstance(player.queue, TrackQueue):
+            player.queue = TrackQueue(player.queue)
+        return player.queue.stats
+
+    def materialize_queue_head(self, player: lavalink.Player) -> None:
+        """Replace compact queue entries by full Tracks for the current and next track."""
+        if isinstance(player.current, QueueEntry):
+            player.current = player.current.to_track()
+        if player.queue and isinstance(player.queue[0], QueueEntry):
+            player.queue[0] = player.queue[0].to_track()
+
+    def prepare_queue_ahead(self, player: lavalink.Player) -> None:
+        """Get the next queue entries ready to play while the current track plays.
+
+        A previous look-ahead still running for the player is cancelled.
+        """
+        guild_id = player.channel.guild.id
+        task = self._queue_lookahead_tasks.pop(guild_id, None)
+        if task is not None:
+            task.cancel()
+        if not player.queue:
+            return
+        task = asyncio.create_task(self._prepare_queue_ahead(player, guild_id))
+        task.add_done_callback(task_callback)
+        self._queue_lookahead_tasks[guild_id] = task
+
+    def cancel_queue_ahead(self, guild_id: int) -> None:
+        task = self._queue_lookahead_tasks.pop(guild_id, None)
+        if task is not None:
+            task.cancel()
+
+    async def _prepare_queue_ahead(
+        self, player: lavalink.Player, guild_id: int
+    ) -> None:
+        try:
+            await self._check_queue_ahead(player)
+        finally:
+            if self._queue_lookahead_tasks.get(guild_id) is asyncio.current_task():
+                del self._queue_lookahead_tasks[guild_id]
+
+    async def _check_queue_ahead(self, player: lavalink.Player) -> None:
+        # Entries which can't be played anymore are dropped and the others are
+        # materialized, so the next TRACK_START doesn't have to do it.
+        channel = self.bot.get_channel(player.fetch("channel"))
+        queue = player.queue
+        index = 0
+        while index < min(_LOOKAHEAD_SIZE, len(queue)):
+            entry = queue[index]
+            playable = await self._is_queue_entry_playable(channel, entry)
+            if (
+                player.queue is not queue
+                or index >= len(queue)
+                or queue[index] is not entry
+            ):
+                # The queue changed meanwhile, the next track start looks again.
+                return
+            if not playable:
+                del queue[index]
+                log.debug(f"Dropped {entry!r} from the queue, it can't be played")
+                continue
+            if isinstance(entry, QueueEntry):
+                queue[index] = entry.to_track()
+            index += 1
+
+    async def _is_queue_entry_playable(
+        self,
+        channel: Optional[discord.TextChannel],
+        entry: Union[lavalink.Track, QueueEntry],
+    ) -> bool:
+        query = Query.process_input(entry, self.local_folder_current_path)
+        if not await self.is_query_allowed(
+            self.config,
+            channel,
+            f"{entry.title} {entry.author} {entry.uri} {query}",
+            query_obj=query,
+        ):
+            return False
+        if query.is_local:
+            return await asyncio.get_running_loop().run_in_executor(
+                None, query.local_track_path.exists
+            )
+        return True
+
     async def _build_queue_page(
         self,
         ctx: commands.Context,
@@ -1,7 +1,7 @@
 import logging
 import re
 
-from typing import Final, List, Optional, Pattern, Set, Union
+from typing import Final, Optional, Pattern, Union
 from urllib.parse import urlparse
 
 import discord
@@ -10,6 +10,7 @@ from redbot.core import Config
 from redbot.core.commands import Context
 
 from ...audio_dataclasses import Query
+from ...utils import KeywordFilter
 from ..abc import MixinMeta
 from ..cog_utils import CompositeMetaClass
 
@@ -78,7 +79,7 @@ class ValidationUtilities(MixinMeta, metaclass=CompositeMetaClass):
             query = query.lower().strip()
             if query_obj.is_nsfw and (not channel.is_nsfw()):
                 return False
-            if query_obj.is_nsfw and not self._nsfw_cache[guild.id]:
+            if query_obj.is_nsfw and not self.guild_settings.get(guild).nsfw_queries:
                 return False
         else:
             guild = None
@@ -88,24 +89,28 @@ class ValidationUtilities(MixinMeta, metaclass=CompositeMetaClass):
                 .replace("scsearch:", "soundcloudsearch")
                 .replace("phsearch:", "pornhubsearch")
             )
-        global_whitelist = set(await config.url_keyword_whitelist())
-        global_whitelist = [i.lower() for i in global_whitelist]
-        if global_whitelist:
-            return any(i in query for i in global_whitelist)
-        global_blacklist = set(await config.url_keyword_blacklist())
-        global_blacklist = [i.lower() for i in global_blacklist]
-        if any(i in query for i in global_blacklist):
-            return False
+        global_filter = await self._get_keyword_filter(config, None)
+        allowed = global_filter.allows(query)
+        if allowed is not None:
+            return allowed
         if guild is not None:
-            whitelist_unique: Set[str] = set(
-                await config.guild(guild).url_keyword_whitelist()
-            )
-            whitelist: List[str] = [i.lower() for i in whitelist_unique]
-            if whitelist:
-                return any(i in query for i in whitelist)
-            blacklist_unique: Set[str] = set(
-                await config.guild(guild).url_keyword_blacklist()
-            )
-            blacklist: List[str] = [i.lower() for i in blacklist_unique]
-            return not any(i in query for i in blacklist)
+            guild_filter = await self._get_keyword_filter(config, guild)
+            return guild_filter.allows(query) is not False
         return True
+
+    async def _get_keyword_filter(
+        self, config: Config, guild: Optional[discord.Guild]
+    ) -> KeywordFilter:
+        """Get the compiled keywords of a guild, or the global ones without a guild.
+
+        A guild's keywords come from its settings snapshot, the global keywords are
+        only read from config when they changed since last compiled.
+        """
+        if guild is not None:
+            return self.guild_settings.get(guild).keyword_filter
+        if self._global_keyword_filter is None:
+            self._global_keyword_filter = KeywordFilter(
+                await config.url_keyword_whitelist(),
+                await config.url_keyword_blacklist(),
+            )
+        return self._global_keyword_filter
@@ -0,0 +1,101 @@
+import dataclasses
+import functools
+import logging
+
+from typing import Any, List, Mapping, MutableMapping, Optional
+
+import discord
+
+from redbot.core import Config
+
+from .utils import KeywordFilter
+
+log = logging.getLogger("red.cogs.Audio.GuildSettings")
+
+
+@dataclasses.dataclass(frozen=True)
+class GuildSettings:
+    """A snapshot of a guild's Audio settings."""
+
+    auto_play: bool
+    auto_deafen: bool
+    autoplaylist: Mapping[str, Any]
+    persist_queue: bool
+    disconnect: bool
+    dj_enabled: Optional[bool]
+    dj_role: Optional[int]
+    daily_playlists: bool
+    emptydc_enabled: bool
+    emptydc_timer: int
+    emptypause_enabled: bool
+    emptypause_timer: int
+    jukebox: bool
+    jukebox_price: int
+    maxlength: int
+    notify: bool
+    prefer_lyrics: bool
+    repeat: bool
+    shuffle: bool
+    shuffle_bumped: bool
+    thumbnail: bool
+    volume: int
+    vote_enabled: bool
+    vote_percent: int
+    room_lock: Optional[int]
+    url_keyword_blacklist: List[str]
+    url_keyword_whitelist: List[str]
+    country_code: str
+    nsfw_queries: bool
+
+    @classmethod
+    def from_config(cls, data: Mapping[str, Any]) -> "GuildSettings":
+        return cls(**{f.name: data[f.name] for f in dataclasses.fields(cls)})
+
+    @functools.cached_property
+    def keyword_filter(self) -> KeywordFilter:
+        """The guild's keyword whitelist and blacklist, compiled on first use."""
+        return KeywordFilter(self.url_keyword_whitelist, self.url_keyword_blacklist)
+
+
+class GuildSettingsCache:
+    """Keeps a snapshot of every guild's Audio settings in memory.
+
+    Snapshots are loaded once with :meth:`load`, after which reads are synchronous.
+    Every write to a guild's settings must go through :meth:`set`, :meth:`clear`
+    or be followed by :meth:`refresh` to keep the snapshots up to date.
+    """
+
+    def __init__(self, config: Config, defaults: Mapping[str, Any]):
+        self.config = config
+        self._defaults = GuildSettings.from_config(defaults)
+        self._snapshots: MutableMapping[int, GuildSettings] = {}
+
+    async def load(self) -> None:
+        """Load the settings of all guilds."""
+        self._snapshots = {
+            guild_id: GuildSettings.from_config(data)
+            for guild_id, data in (await self.config.all_guilds()).items()
+        }
+
+    def get(self, guild: discord.Guild) -> GuildSettings:
+        """Get a guild's settings, guilds without saved settings get the defaults."""
+        return self.get_from_id(guild.id)
+
+    def get_from_id(self, guild_id: int) -> GuildSettings:
+        return self._snapshots.get(guild_id, self._defaults)
+
+    async def set(self, guild: discord.Guild, key: str, value: Any) -> None:
+        """Save a guild setting and update its snapshot."""
+        await self.config.guild(guild).get_attr(key).set(value)
+        self._snapshots[guild.id] = dataclasses.replace(self.get(guild), **{key: value})
+
+    async def clear(self, guild: discord.Guild, key: str) -> None:
+        """Reset a guild setting to its default value."""
+        await self.config.guild(guild).get_attr(key).clear()
+        await self.refresh(guild)
+
+    async def refresh(self, guild: discord.Guild) -> None:
+        """Reload a guild's snapshot after its settings were edited in place."""
+        self._snapshots[guild.id] = GuildSettings.from_config(
+            await self.config.guild(guild).all()
+        )
@@ -0,0 +1,194 @@
+import asyncio
+import dataclasses
+import datetime
+import logging
+import math
+import os
+
+from typing import Any, Final, List, Optional, Tuple
+
+import lavalink
+from redbot.core import Config
+
+from .node_pool import NodePool
+from .utils import task_callback
+
+log = logging.getLogger("red.cogs.Audio.JvmSizing")
+_MIN_HEAP_MB: Final[int] = 256
+_BASE_HEAP_MB: Final[int] = 256
+_HEAP_MB_PER_PLAYER: Final[int] = 6
+_HEAP_STEP_MB: Final[int] = 128
+_MAX_HOST_MEMORY_SHARE: Final[float] = 0.5
+_G1_MIN_HEAP_MB: Final[int] = 512
+_G1_MAX_PAUSE_MS: Final[int] = 50
+_PEAK_DAYS_KEPT: Final[int] = 7
+_SAMPLE_INTERVAL: Final[int] = 300
+_SAMPLES_BEFORE_SUGGESTION: Final[int] = 3
+_HIGH_HEAP_USAGE: Final[float] = 0.9
+_BUSY_HEAP_USAGE: Final[float] = 0.5
+_LOW_HEAP_USAGE: Final[float] = 0.25
+_HIGH_FRAME_DEFICIT: Final[int] = 150
+
+
+@dataclasses.dataclass(frozen=True)
+class JvmProfile:
+    """The heap size and garbage collector the internal Lavalink server runs with."""
+
+    heap_mb: int
+    gc: str
+
+    def args(self) -> List[str]:
+        args = [f"-Xms{self.heap_mb // 2}M", f"-Xmx{self.heap_mb}M"]
+        if self.gc == "G1":
+            args += ["-XX:+UseG1GC", f"-XX:MaxGCPauseMillis={_G1_MAX_PAUSE_MS}"]
+        else:
+            args.append("-XX:+UseSerialGC")
+        return args
+
+
+def host_memory_mb() -> Optional[int]:
+    """The physical memory of the host, ``None`` if it can't be found."""
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") // 1024 ** 2
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def profile_for(heap_mb: int) -> JvmProfile:
+    """Pick the garbage collector for a heap size.
+
+    Small heaps are collected fast enough by the serial collector, larger ones
+    use G1 with a pause goal short enough to not starve the audio frames.
+    """
+    heap_mb = max(heap_mb, _MIN_HEAP_MB)
+    gc = "G1" if heap_mb >= _G1_MIN_HEAP_MB else "Serial"
+    return JvmProfile(heap_mb=heap_mb, gc=gc)
+
+
+def pick_profile(host_mb: Optional[int], peak_players: int) -> JvmProfile:
+    """Size the heap for the peak player count, within the host's memory."""
+    heap_mb = _BASE_HEAP_MB + _HEAP_MB_PER_PLAYER * peak_players
+    heap_mb = math.ceil(heap_mb / _HEAP_STEP_MB) * _HEAP_STEP_MB
+    if host_mb is not None:
+        heap_mb = min(heap_mb, int(host_mb * _MAX_HOST_MEMORY_SHARE))
+    return profile_for(heap_mb)
+
+
+def parse_heap_size(size: str) -> int:
+    """Parse a heap size such as ``512M`` or ``2G`` to megabytes."""
+    size = size.strip().upper().rstrip("B")
+    multiplier = 1
+    if size.endswith("G"):
+        multiplier = 1024
+    if size[-1:] in ("G", "M"):
+        size = size[:-1]
+    return int(float(size) * multiplier)
+
+
+def suggest_heap_mb(profile: JvmProfile, stats: Any) -> Optional[int]:
+    """Suggest a heap size from a node's stats, ``None`` if the current one fits.
+
+    Lavalink doesn't report garbage collection pauses, a nearly full heap or
+    missed audio frames with a busy heap are used as their symptoms instead.
+    """
+    if not stats.memory_reservable:
+        return None
+    usage = stats.memory_used / stats.memory_reservable
+    deficit = stats.frames_deficit
+    if usage >= _HIGH_HEAP_USAGE or (
+        deficit >= _HIGH_FRAME_DEFICIT and usage >= _BUSY_HEAP_USAGE
+    ):
+        return profile.heap_mb * 2
+    if usage <= _LOW_HEAP_USAGE and profile.heap_mb > _MIN_HEAP_MB:
+        return max(profile.heap_mb // 2, _MIN_HEAP_MB)
+    return None
+
+
+class JvmSizer:
+    """Sizes the internal Lavalink server's JVM and watches how it copes.
+
+    The daily peak player counts of the last week are saved, the heap is sized
+    from them and the host's memory unless the bot owner set an override.
+    While the internal server runs, its reported heap usage and frame deficit
+    are sampled and a new heap size is suggested when they stay out of bounds.
+    """
+
+    def __init__(self, config: Config, node_pool: NodePool):
+        self.config = config
+        self.node_pool = node_pool
+        self.suggested_heap_mb: Optional[int] = None
+        self._peak: Tuple[Optional[datetime.date], int] = (None, 0)
+        self._strikes = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._sample_loop())
+            self._task.add_done_callback(task_callback)
+
+    def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+        self._task = None
+
+    async def profile(self) -> JvmProfile:
+        """Get the profile to start the internal server with and save it."""
+        override = await self.config.jvm_heap_override()
+        if override:
+            profile = profile_for(override)
+        else:
+            peaks = (await self.config.jvm_player_peaks()).values()
+            profile = pick_profile(host_memory_mb(), max(peaks, default=0))
+        await self.config.jvm_profile.set(dataclasses.asdict(profile))
+        self.suggested_heap_mb = None
+        self._strikes = 0
+        return profile
+
+    async def saved_profile(self) -> Optional[JvmProfile]:
+        """The profile the internal server was last started with."""
+        saved = await self.config.jvm_profile()
+        return JvmProfile(**saved) if saved else None
+
+    async def _sample_loop(self) -> None:
+        while True:
+            await asyncio.sleep(_SAMPLE_INTERVAL)
+            await self.record_players(len(lavalink.active_players()))
+            if await self.config.use_external_lavalink():
+                continue
+            profile = await self.saved_profile()
+            node = self.node_pool.main_node
+            stats = getattr(node, "stats", None)
+            if profile is not None and stats is not None:
+                self.check(profile, stats)
+
+    async def record_players(self, players: int) -> None:
+        """Update today's peak player count."""
+        today = datetime.date.today()
+        day, peak = self._peak
+        if day == today and players <= peak:
+            return
+        self._peak = (today, max(players, peak if day == today else 0))
+        oldest = str(today - datetime.timedelta(days=_PEAK_DAYS_KEPT))
+        async with self.config.jvm_player_peaks() as peaks:
+            for old_day in [d for d in peaks if d <= oldest]:
+                del peaks[old_day]
+            peaks[str(today)] = max(peaks.get(str(today), 0), players)
+
+    def check(self, profile: JvmProfile, stats: Any) -> None:
+        """Suggest a new heap size once the stats were out of bounds a few times."""
+        heap_mb = suggest_heap_mb(profile, stats)
+        if heap_mb is None:
+            self._strikes = 0
+            self.suggested_heap_mb = None
+            return
+        self._strikes += 1
+        if self._strikes < _SAMPLES_BEFORE_SUGGESTION:
+            return
+        if heap_mb != self.suggested_heap_mb:
+            log.warning(
+                "The internal Lavalink server runs with a %sM heap, "
+                "a %sM heap is recommended for its current load.",
+                profile.heap_mb,
+                heap_mb,
+            )
+        self.suggested_heap_mb = heap_mb
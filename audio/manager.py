@@ -1,5 +1,6 @@
 import asyncio
 import asyncio.subprocess  # disables for # https://github.com/PyCQA/pylint/issues/1469
+import hashlib
 import itertools
 import logging
 import pathlib
@@ -7,9 +8,18 @@ import platform
 import re
 import shutil
 import sys
-import tempfile
 import time
-from typing import ClassVar, Final, List, Optional, Pattern, Tuple
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Final,
+    List,
+    MutableMapping,
+    Optional,
+    Pattern,
+    Tuple,
+)
 
 import aiohttp
 from tqdm import tqdm
@@ -42,6 +52,13 @@ BUNDLED_APP_YML: Final[pathlib.Path] = (
     pathlib.Path(__file__).parent / "data" / "application.yml"
 )
 LAVALINK_APP_YML: Final[pathlib.Path] = LAVALINK_DOWNLOAD_DIR / "application.yml"
+LAVALINK_MANIFEST: Final[pathlib.Path] = (
+    LAVALINK_DOWNLOAD_DIR / "lavalink_manifest.json"
+)
+LAVALINK_PARTIAL_JAR_FILE: Final[pathlib.Path] = (
+    LAVALINK_DOWNLOAD_DIR / f"Lavalink-{JAR_VERSION}_{JAR_BUILD}.jar.part"
+)
+_DOWNLOAD_CHUNK_SIZE: Final[int] = 1024 * 1024
 
 _RE_READY_LINE: Final[Pattern] = re.compile(rb"Started Launcher in \S+ seconds")
 _FAILED_TO_START: Final[Pattern] = re.compile(rb"Web server failed to start. (.*)")
@@ -61,6 +78,40 @@ LAVALINK_BUILD_TIME_LINE: Final[Pattern] = re.compile(
 )
 
 
+def _file_sha256(path: pathlib.Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as file:
+        for block in iter(lambda: file.read(_DOWNLOAD_CHUNK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _read_manifest() -> MutableMapping[str, Any]:
+    """Read what is known about the downloaded jar and the Java executable.
+
+    The manifest saves running ``java`` to check the jar and Java versions on
+    every start, its entries are only trusted while the jar's hash and the Java
+    executable are unchanged.
+    """
+    try:
+        return json.loads(LAVALINK_MANIFEST.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _update_manifest(**entries: Any) -> None:
+    manifest = _read_manifest()
+    manifest.update(entries)
+    try:
+        LAVALINK_MANIFEST.write_text(json.dumps(manifest))
+    except OSError as exc:
+        log.debug("Failed to save the Lavalink manifest", exc_info=exc)
+
+
+async def _run_in_thread(func: Callable[..., Any], *args: Any) -> Any:
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
 class ServerManager:
 
     _java_available: ClassVar[Optional[bool]] = None
@@ -83,6 +134,7 @@ class ServerManager:
         ] = None  # pylint:disable=no-member
         self._monitor_task: Optional[asyncio.Task] = None
         self._shutdown: bool = False
+        self._jvm_args: List[str] = []
 
     @property
     def path(self) -> Optional[str]:
@@ -108,9 +160,11 @@ class ServerManager:
     def build_time(self) -> Optional[str]:
         return self._buildtime
 
-    async def start(self, java_path: str) -> None:
+    async def start(self, java_path: str, jvm_args: Optional[List[str]] = None) -> None:
         arch_name = platform.machine()
         self._java_exc = java_path
+        if jvm_args is not None:
+            self._jvm_args = jvm_args
         if arch_name in self._blacklisted_archs:
             raise asyncio.CancelledError(
                 "You are attempting to run Lavalink audio on an unsupported machine architecture."
@@ -161,6 +215,7 @@ class ServerManager:
 
         return [
             self._java_exc,
+            *self._jvm_args,
             "-Djdk.tls.client.protocols=TLSv1.2",
             "-jar",
             str(LAVALINK_JAR_FILE),
@@ -176,11 +231,30 @@ class ServerManager:
             self.java_available = False
             self.java_version = None
         else:
-            self._java_version = version = await self._get_java_version()
+            self._java_version = version = await self._get_cached_java_version(
+                java_exec
+            )
             self._java_available = (11, 0) <= version < (12, 0)
             self._java_exc = java_exec
         return self._java_available, self._java_version
 
+    async def _get_cached_java_version(self, java_exec: str) -> Tuple[int, int]:
+        """Get the Java version from the manifest, unless the executable changed."""
+        java_path = pathlib.Path(java_exec).resolve()
+        try:
+            mtime = java_path.stat().st_mtime
+        except OSError:
+            mtime = None
+        java = _read_manifest().get("java", {})
+        if java.get("path") == str(java_path) and java.get("mtime") == mtime:
+            return tuple(java["version"])
+        version = await self._get_java_version()
+        if mtime is not None:
+            _update_manifest(
+                java={"path": str(java_path), "mtime": mtime, "version": version}
+            )
+        return version
+
     async def _get_java_version(self) -> Tuple[int, int]:
         """This assumes we've already checked that java exists."""
         _proc: asyncio.subprocess.Process = (
@@ -267,8 +341,14 @@ class ServerManager:
 
     async def _download_jar(self) -> None:
         log.info("Downloading Lavalink.jar...")
+        # Downloads resume from where a previous attempt stopped.
+        try:
+            offset = LAVALINK_PARTIAL_JAR_FILE.stat().st_size
+        except OSError:
+            offset = 0
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
         async with aiohttp.ClientSession(json_serialize=json.dumps) as session:
-            async with session.get(LAVALINK_DOWNLOAD_URL) as response:
+            async with session.get(LAVALINK_DOWNLOAD_URL, headers=headers) as response:
                 if response.status == 404:
                     # A 404 means our LAVALINK_DOWNLOAD_URL is invalid, so likely the jar version
                     # hasn't been published yet
@@ -278,15 +358,26 @@ class ServerManager:
                         response=response,
                         should_retry=False,
                     )
+                elif response.status == 416:
+                    # The partial file is larger than the jar, start over.
+                    LAVALINK_PARTIAL_JAR_FILE.unlink()
+                    raise LavalinkDownloadFailed(response=response, should_retry=True)
                 elif 400 <= response.status < 600:
                     # Other bad responses should be raised but we should retry just incase
                     raise LavalinkDownloadFailed(response=response, should_retry=True)
-                fd, path = tempfile.mkstemp()
-                file = open(fd, "wb")
-                nbytes = 0
-                with tqdm(
+                if response.status != 206:
+                    # The server ignored the range, the whole jar is being sent.
+                    offset = 0
+                expected_size = None
+                if response.content_length is not None:
+                    expected_size = offset + response.content_length
+                nbytes = offset
+                with LAVALINK_PARTIAL_JAR_FILE.open(
+                    "ab" if offset else "wb"
+                ) as file, tqdm(
                     desc="Lavalink.jar",
-                    total=response.content_length,
+                    initial=offset,
+                    total=expected_size,
                     file=sys.stdout,
                     unit="B",
                     unit_scale=True,
@@ -294,29 +385,49 @@ class ServerManager:
                     dynamic_ncols=True,
                     leave=False,
                 ) as progress_bar:
-                    try:
-                        chunk = await response.content.read(1024)
-                        while chunk:
-                            chunk_size = file.write(chunk)
-                            nbytes += chunk_size
-                            progress_bar.update(chunk_size)
-                            chunk = await response.content.read(1024)
-                        file.flush()
-                    finally:
-                        file.close()
-
-                shutil.move(path, str(LAVALINK_JAR_FILE), copy_function=shutil.copyfile)
+                    async for chunk in response.content.iter_chunked(
+                        _DOWNLOAD_CHUNK_SIZE
+                    ):
+                        chunk_size = file.write(chunk)
+                        nbytes += chunk_size
+                        progress_bar.update(chunk_size)
+                if expected_size is not None and nbytes != expected_size:
+                    # Keep the partial jar, the next attempt resumes from it.
+                    raise LavalinkDownloadFailed(
+                        f"Lavalink.jar download stopped at {nbytes} of {expected_size} "
+                        f"bytes",
+                        response=response,
+                        should_retry=True,
+                    )
 
+        shutil.move(
+            str(LAVALINK_PARTIAL_JAR_FILE),
+            str(LAVALINK_JAR_FILE),
+            copy_function=shutil.copyfile,
+        )
         log.info(
             "Successfully downloaded Lavalink.jar (%s bytes written)",
             format(nbytes, ","),
         )
-        await self._is_up_to_date()
+        if not await self._is_up_to_date():
+            # The jar doesn't run or is outdated, don't resume from it next time.
+            LAVALINK_JAR_FILE.unlink()
+            raise LavalinkDownloadFailed(
+                "The downloaded Lavalink.jar failed its version check",
+                response=response,
+                should_retry=True,
+            )
 
     async def _is_up_to_date(self):
         if self._up_to_date is True:
             # Return cached value if we've checked this before
             return True
+        jar_hash = await _run_in_thread(_file_sha256, LAVALINK_JAR_FILE)
+        jar = _read_manifest().get("jar", {})
+        if jar.get("sha256") == jar_hash:
+            # This jar was already checked, no need to run it again.
+            self._set_jar_info(**jar["info"])
+            return self._up_to_date
         args = await self._get_jar_args()
         args.append("--version")
         _proc = (
@@ -344,16 +455,27 @@ class ServerManager:
             # Output is unexpected, suspect corrupted jarfile
             return False
 
-        build = int(build["build"])
         date = buildtime["build_time"].decode()
-        date = date.replace(".", "/")
+        info = dict(
+            build=int(build["build"]),
+            branch=branch["branch"].decode(),
+            jvm=java["jvm"].decode(),
+            lavaplayer=lavaplayer["lavaplayer"].decode(),
+            build_time=date.replace(".", "/"),
+        )
+        self._set_jar_info(**info)
+        _update_manifest(jar={"sha256": jar_hash, "info": info})
+        return self._up_to_date
+
+    def _set_jar_info(
+        self, build: int, branch: str, jvm: str, lavaplayer: str, build_time: str
+    ) -> None:
         self._lavalink_build = build
-        self._lavalink_branch = branch["branch"].decode()
-        self._jvm = java["jvm"].decode()
-        self._lavaplayer = lavaplayer["lavaplayer"].decode()
-        self._buildtime = date
+        self._lavalink_branch = branch
+        self._jvm = jvm
+        self._lavaplayer = lavaplayer
+        self._buildtime = build_time
         self._up_to_date = build >= JAR_BUILD
-        return self._up_to_date
 
     async def maybe_download_jar(self):
         if not (LAVALINK_JAR_FILE.exists() and await self._is_up_to_date()):
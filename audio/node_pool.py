@@ -0,0 +1,256 @@
+import asyncio
+import contextlib
+import logging
+from collections import Counter
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Final,
+    Iterable,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Union,
+)
+
+import discord
+import lavalink
+import lavalink.node
+from lavalink.lavalink import dispatch
+from redbot.core import Config
+from redbot.core.bot import Red
+from redbot.core.commands import Cog
+
+from .audio_logging import debug_exc_log
+from .utils import task_callback
+
+if TYPE_CHECKING:
+    from . import Audio
+
+log = logging.getLogger("red.cogs.Audio.NodePool")
+_HEALTH_CHECK_INTERVAL: Final[int] = 30
+_MAX_FAILED_CHECKS: Final[int] = 3
+_CONNECT_TIMEOUT: Final[int] = 30
+
+# Penalties use the same weights as the Lavalink client load balancers,
+# a node's penalty grows exponentially with its CPU load and missing frames.
+
+
+def node_penalty(node: Any) -> float:
+    """Get the load penalty of a node from its last reported stats, lower is better.
+
+    Only the ``stats`` attribute of ``node`` is used, so it can be any object
+    shaped like a Lavalink node.
+    """
+    stats = getattr(node, "stats", None)
+    if stats is None:
+        return 0.0
+    # Lavalink leaves the frame stats out until a player sent audio, they are -1 then.
+    deficit = max(stats.frames_deficit, 0)
+    nulled = max(stats.frames_nulled, 0)
+    penalty = stats.playing_players + 1.05 ** (100 * stats.system_load) * 10 - 10
+    penalty += 1.03 ** (500 * deficit / 3000) * 600 - 600
+    penalty += (1.03 ** (500 * nulled / 3000) * 300 - 300) * 2
+    return penalty
+
+
+def is_node_ready(node: Any) -> bool:
+    ready = getattr(node, "ready", None)
+    if isinstance(ready, asyncio.Event):
+        return ready.is_set()
+    return bool(ready)
+
+
+def least_loaded(nodes: Iterable[Any], exclude: Iterable[Any] = ()) -> Optional[Any]:
+    """Get the ready node with the lowest penalty, ``None`` if no node is ready."""
+    exclude = list(exclude)
+    candidates = [n for n in nodes if n not in exclude and is_node_ready(n)]
+    if not candidates:
+        return None
+    return min(candidates, key=node_penalty)
+
+
+class NodePool:
+    """Spreads the players across the main Lavalink node and the extra nodes.
+
+    The main node is the one connected by ``lavalink.initialize`` (the internal
+    server or the external one set with ``[p]llset``), extra nodes are external
+    Lavalink servers added with ``[p]llset node add``.
+    New players are created on the least loaded node and players are moved off
+    nodes which fail their health checks or are being removed.
+    """
+
+    def __init__(self, bot: Red, config: Config, cog: Union["Audio", Cog]):
+        self.bot = bot
+        self.config = config
+        self.cog = cog
+        self.main_node: Optional[lavalink.node.Node] = None
+        self._nodes: MutableMapping[str, lavalink.node.Node] = {}
+        self._draining: List[lavalink.node.Node] = []
+        self._failed_checks: Counter = Counter()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def nodes(self) -> List[lavalink.node.Node]:
+        """All the nodes of the pool, the main node first."""
+        nodes = list(self._nodes.values())
+        if self.main_node is not None:
+            nodes.insert(0, self.main_node)
+        return nodes
+
+    async def start(self, main_node: Optional[lavalink.node.Node]) -> None:
+        """Connect the extra nodes once the main node is connected."""
+        if main_node is None:
+            with contextlib.suppress(IndexError):
+                main_node = lavalink.node.get_node(None, ignore_ready_status=True)
+        self.main_node = main_node
+        for name, settings in (await self.config.lavalink_nodes()).items():
+            if name not in self._nodes:
+                await self._connect_node(name, settings)
+        if self._task is None:
+            self._task = asyncio.create_task(self._health_check_loop())
+            self._task.add_done_callback(task_callback)
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+        self._task = None
+        nodes, self._nodes = self._nodes, {}
+        for node in nodes.values():
+            with contextlib.suppress(Exception):
+                await node.disconnect()
+        self.main_node = None
+
+    def node_names(self) -> Mapping[lavalink.node.Node, str]:
+        names = {node: name for name, node in self._nodes.items()}
+        if self.main_node is not None:
+            names[self.main_node] = "main"
+        return names
+
+    async def add_node(self, name: str, settings: Mapping[str, Any]) -> bool:
+        """Save and connect an extra node, returns whether it could connect."""
+        async with self.config.lavalink_nodes() as saved:
+            saved[name] = dict(settings)
+        return await self._connect_node(name, settings)
+
+    async def remove_node(self, name: str) -> int:
+        """Move the players off an extra node and forget it.
+
+        Returns the number of players which couldn't be moved.
+        """
+        async with self.config.lavalink_nodes() as saved:
+            saved.pop(name, None)
+        node = self._nodes.pop(name, None)
+        if node is None:
+            return 0
+        self._draining.append(node)
+        try:
+            failed = await self.drain(node)
+        finally:
+            self._draining.remove(node)
+        with contextlib.suppress(Exception):
+            await node.disconnect()
+        return failed
+
+    async def _connect_node(self, name: str, settings: Mapping[str, Any]) -> bool:
+        # Extra nodes are set up the same way lavalink.initialize sets up the
+        # main node, they share its event handler and voice websocket.
+        node = lavalink.node.Node(
+            self.bot.loop,
+            dispatch,
+            self.bot._connection._get_websocket,
+            settings["host"],
+            settings["password"],
+            settings["ws_port"],
+            settings["rest_port"],
+            self.bot.user.id,
+            self.bot.shard_count if self.bot.shard_count is not None else 1,
+        )
+        self._nodes[name] = node
+        try:
+            await node.connect(timeout=_CONNECT_TIMEOUT)
+        except Exception as exc:
+            # The node keeps retrying in the background, the health checks
+            # keep new players away from it until it is ready.
+            debug_exc_log(log, exc, f"Failed to connect to Lavalink node {name}")
+            return False
+        return True
+
+    def pick_node(self) -> Optional[lavalink.node.Node]:
+        """Get the node new players should be created on."""
+        return least_loaded(self.nodes, exclude=self._draining)
+
+    async def connect(self, channel: discord.VoiceChannel) -> lavalink.Player:
+        """Connect to a voice channel with a player on the least loaded node."""
+        node = self.pick_node()
+        if node is None or len(self.nodes) < 2:
+            return await lavalink.connect(channel)
+        return await node.player_manager.create_player(channel)
+
+    async def drain(self, node: lavalink.node.Node) -> int:
+        """Move all the players of a node to the other nodes.
+
+        Returns the number of players which couldn't be moved.
+        """
+        failed = 0
+        for player in list(node.players):
+            target = least_loaded(self.nodes, exclude=[node, *self._draining])
+            if target is None or not await self.migrate(player, target):
+                failed += 1
+        return failed
+
+    async def migrate(self, player: lavalink.Player, node: lavalink.node.Node) -> bool:
+        """Recreate a player on another node, resuming its current track."""
+        channel = player.channel
+        guild_id = channel.guild.id
+        current = player.current
+        position = player.position
+        paused = player.paused
+        volume = player.volume
+        metadata = dict(getattr(player, "_metadata", {}))
+        queue = player.queue
+        try:
+            with contextlib.suppress(Exception):
+                # The node may already be gone, leave the voice channel anyway.
+                await player.disconnect()
+            new_player = await node.player_manager.create_player(channel)
+            for key, value in metadata.items():
+                new_player.store(key, value)
+            new_player.repeat = player.repeat
+            new_player.shuffle = player.shuffle
+            new_player.shuffle_bumped = player.shuffle_bumped
+            new_player.queue = queue
+            if new_player.volume != volume:
+                await new_player.set_volume(volume)
+            if current is not None:
+                new_player.queue.insert(0, current)
+                await new_player.play()
+                if position and not current.is_stream:
+                    await new_player.seek(position)
+                if paused:
+                    await new_player.pause()
+        except Exception as exc:
+            debug_exc_log(log, exc, f"Failed to move the player of {guild_id}")
+            return False
+        log.debug(f"Moved the player of {guild_id} to node {node.host}")
+        return True
+
+    async def _health_check_loop(self) -> None:
+        while True:
+            await asyncio.sleep(_HEALTH_CHECK_INTERVAL)
+            await self.health_check()
+
+    async def health_check(self) -> None:
+        """Move the players off nodes which failed too many health checks in a row."""
+        for node in self.nodes:
+            if is_node_ready(node):
+                self._failed_checks.pop(node, None)
+                continue
+            self._failed_checks[node] += 1
+            if self._failed_checks[node] < _MAX_FAILED_CHECKS or not node.players:
+                continue
+            name = self.node_names().get(node)
+            log.warning(f"Lavalink node {name} is unavailable, moving its players")
+            await self.drain(node)
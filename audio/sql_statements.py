@@ -17,12 +17,48 @@ __all__ = [
     "PLAYLIST_DELETE",
     "PLAYLIST_DELETE_SCOPE",
     "PLAYLIST_DELETE_SCHEDULED",
+    "PLAYLIST_DELETE_DAILY",
     "PLAYLIST_FETCH_ALL",
     "PLAYLIST_FETCH_ALL_WITH_FILTER",
     "PLAYLIST_FETCH_ALL_CONVERTER",
     "PLAYLIST_FETCH",
     "PLAYLIST_UPSERT",
     "PLAYLIST_CREATE_INDEX",
+    "PLAYLIST_FETCH_LEGACY_TRACKS",
+    "PLAYLIST_UPDATE_TRACKS",
+    "PLAYLIST_FETCH_EMBEDDED_TRACKS",
+    "PLAYLIST_FETCH_COLUMNS",
+    "PLAYLIST_ADD_TRACK_COUNT_COLUMN",
+    "PLAYLIST_ADD_DURATION_COLUMN",
+    "PLAYLIST_UPDATE_SUMMARY",
+    "PLAYLIST_FETCH_ALL_CONVERTER_INDEXED",
+    # Playlist name index statements
+    "PLAYLIST_NAME_INDEX_EXISTS",
+    "PLAYLIST_NAME_INDEX_CREATE_TABLE",
+    "PLAYLIST_NAME_INDEX_CREATE_INSERT_TRIGGER",
+    "PLAYLIST_NAME_INDEX_CREATE_DELETE_TRIGGER",
+    "PLAYLIST_NAME_INDEX_CREATE_UPDATE_TRIGGER",
+    "PLAYLIST_NAME_INDEX_DROP_INSERT_TRIGGER",
+    "PLAYLIST_NAME_INDEX_DROP_DELETE_TRIGGER",
+    "PLAYLIST_NAME_INDEX_DROP_UPDATE_TRIGGER",
+    "PLAYLIST_NAME_INDEX_REBUILD",
+    "PLAYLIST_SET_SUMMARY",
+    "PLAYLIST_COPY_SUMMARY",
+    "PLAYLIST_ADD_LAST_REFRESHED_COLUMN",
+    "PLAYLIST_SET_REFRESHED",
+    "PLAYLIST_FETCH_STALE",
+    # Playlist tracks table statements
+    "PLAYLIST_TRACKS_CREATE_TABLE",
+    "PLAYLIST_TRACKS_CREATE_INDEX",
+    "PLAYLIST_TRACKS_CREATE_TRIGGER",
+    "PLAYLIST_TRACKS_FETCH",
+    "PLAYLIST_TRACKS_FETCH_ALL",
+    "PLAYLIST_TRACKS_FETCH_URI",
+    "PLAYLIST_TRACKS_NEXT_ORDINAL",
+    "PLAYLIST_TRACKS_INSERT",
+    "PLAYLIST_TRACKS_DELETE_URI",
+    "PLAYLIST_TRACKS_DELETE_ALL",
+    "PLAYLIST_TRACKS_COPY",
     # YouTube table statements
     "YOUTUBE_DROP_TABLE",
     "YOUTUBE_CREATE_TABLE",
@@ -133,6 +169,9 @@ CREATE TABLE IF NOT EXISTS playlists (
     deleted BOOLEAN DEFAULT false,
     playlist_url TEXT,
     tracks JSON,
+    track_count INTEGER NOT NULL DEFAULT 0,
+    duration INTEGER NOT NULL DEFAULT 0,
+    last_refreshed INTEGER NOT NULL DEFAULT 0,
     PRIMARY KEY (playlist_id, scope_id, scope_type)
 );
 """
@@ -168,6 +207,22 @@ FROM
 WHERE
     deleted = true;
 """
+PLAYLIST_DELETE_DAILY: Final[
+    str
+] = """
+UPDATE playlists
+    SET
+        deleted = true
+WHERE
+    (
+        scope_type = :scope_type
+        AND author_id = :author_id
+        AND playlist_id <= :playlist_id
+        AND playlist_name LIKE :name_prefix || '%'
+        AND deleted = false
+    )
+;
+"""
 PLAYLIST_FETCH_ALL: Final[
     str
 ] = """
@@ -177,7 +232,8 @@ SELECT
     scope_id,
     author_id,
     playlist_url,
-    tracks
+    track_count,
+    duration
 FROM
     playlists
 WHERE
@@ -195,7 +251,8 @@ SELECT
     scope_id,
     author_id,
     playlist_url,
-    tracks
+    track_count,
+    duration
 FROM
     playlists
 WHERE
@@ -216,7 +273,8 @@ SELECT
     scope_id,
     author_id,
     playlist_url,
-    tracks
+    track_count,
+    duration
 FROM
     playlists
 WHERE
@@ -230,6 +288,55 @@ WHERE
         )
         AND deleted = false
     )
+ORDER BY
+    CASE
+        WHEN playlist_id = :playlist_id THEN 0
+        WHEN LOWER(playlist_name) = LOWER(:playlist_name) THEN 1
+        WHEN LOWER(playlist_name) LIKE LOWER(:playlist_name) || "%" THEN 2
+        ELSE 3
+    END,
+    LENGTH(playlist_name)
+;
+"""
+PLAYLIST_FETCH_ALL_CONVERTER_INDEXED: Final[
+    str
+] = """
+SELECT
+    playlist_id,
+    playlist_name,
+    scope_id,
+    author_id,
+    playlist_url,
+    track_count,
+    duration
+FROM
+    playlists
+WHERE
+    (
+        scope_type = :scope_type
+        AND
+        (
+        playlist_id = :playlist_id
+        OR
+        rowid IN (
+            SELECT
+                rowid
+            FROM
+                playlist_names
+            WHERE
+                playlist_name LIKE "%" || COALESCE(:playlist_name, "") || "%"
+            )
+        )
+        AND deleted = false
+    )
+ORDER BY
+    CASE
+        WHEN playlist_id = :playlist_id THEN 0
+        WHEN LOWER(playlist_name) = LOWER(:playlist_name) THEN 1
+        WHEN LOWER(playlist_name) LIKE LOWER(:playlist_name) || "%" THEN 2
+        ELSE 3
+    END,
+    LENGTH(playlist_name)
 ;
 """
 PLAYLIST_FETCH: Final[
@@ -241,7 +348,8 @@ SELECT
     scope_id,
     author_id,
     playlist_url,
-    tracks
+    track_count,
+    duration
 FROM
     playlists
 WHERE
@@ -257,17 +365,16 @@ PLAYLIST_UPSERT: Final[
     str
 ] = """
 INSERT INTO
-    playlists ( scope_type, playlist_id, playlist_name, scope_id, author_id, playlist_url, tracks )
+    playlists ( scope_type, playlist_id, playlist_name, scope_id, author_id, playlist_url )
 VALUES
     (
-        :scope_type, :playlist_id, :playlist_name, :scope_id, :author_id, :playlist_url, :tracks
+        :scope_type, :playlist_id, :playlist_name, :scope_id, :author_id, :playlist_url
     )
     ON CONFLICT (scope_type, playlist_id, scope_id) DO
     UPDATE
     SET
         playlist_name = excluded.playlist_name,
-        playlist_url = excluded.playlist_url,
-        tracks = excluded.tracks;
+        playlist_url = excluded.playlist_url;
 """
 PLAYLIST_CREATE_INDEX: Final[
     str
@@ -276,6 +383,421 @@ CREATE INDEX IF NOT EXISTS name_index ON playlists (
 scope_type, playlist_id, playlist_name, scope_id
 );
 """
+PLAYLIST_FETCH_LEGACY_TRACKS: Final[
+    str
+] = """
+SELECT
+    scope_type,
+    playlist_id,
+    scope_id,
+    tracks
+FROM
+    playlists
+WHERE
+    typeof(tracks) = 'text'
+;
+"""
+PLAYLIST_FETCH_EMBEDDED_TRACKS: Final[
+    str
+] = """
+SELECT
+    scope_type,
+    playlist_id,
+    scope_id,
+    tracks
+FROM
+    playlists
+WHERE
+    tracks IS NOT NULL
+;
+"""
+PLAYLIST_UPDATE_TRACKS: Final[
+    str
+] = """
+UPDATE playlists
+    SET
+        tracks = :tracks
+WHERE
+    (
+        scope_type = :scope_type
+        AND playlist_id = :playlist_id
+        AND scope_id = :scope_id
+    )
+;
+"""
+PLAYLIST_FETCH_COLUMNS: Final[
+    str
+] = """
+PRAGMA table_info(playlists);
+"""
+PLAYLIST_ADD_TRACK_COUNT_COLUMN: Final[
+    str
+] = """
+ALTER TABLE playlists ADD COLUMN track_count INTEGER NOT NULL DEFAULT 0;
+"""
+PLAYLIST_ADD_DURATION_COLUMN: Final[
+    str
+] = """
+ALTER TABLE playlists ADD COLUMN duration INTEGER NOT NULL DEFAULT 0;
+"""
+PLAYLIST_UPDATE_SUMMARY: Final[
+    str
+] = """
+UPDATE playlists
+    SET
+        track_count = track_count + :track_count,
+        duration = duration + :duration
+WHERE
+    (
+        scope_type = :scope_type
+        AND playlist_id = :playlist_id
+        AND scope_id = :scope_id
+    )
+;
+"""
+PLAYLIST_SET_SUMMARY: Final[
+    str
+] = """
+UPDATE playlists
+    SET
+        track_count = :track_count,
+        duration = :duration
+WHERE
+    (
+        scope_type = :scope_type
+        AND playlist_id = :playlist_id
+        AND scope_id = :scope_id
+    )
+;
+"""
+PLAYLIST_COPY_SUMMARY: Final[
+    str
+] = """
+UPDATE playlists
+    SET
+        track_count = (
+            SELECT
+                track_count
+            FROM
+                playlists
+            WHERE
+                (
+                    scope_type = :scope_type
+                    AND playlist_id = :playlist_id
+                    AND scope_id = :scope_id
+                )
+        ),
+        duration = (
+            SELECT
+                duration
+            FROM
+                playlists
+            WHERE
+                (
+                    scope_type = :scope_type
+                    AND playlist_id = :playlist_id
+                    AND scope_id = :scope_id
+                )
+        )
+WHERE
+    (
+        scope_type = :to_scope_type
+        AND playlist_id = :to_playlist_id
+        AND scope_id = :to_scope_id
+    )
+;
+"""
+
+PLAYLIST_ADD_LAST_REFRESHED_COLUMN: Final[
+    str
+] = """
+ALTER TABLE playlists ADD COLUMN last_refreshed INTEGER NOT NULL DEFAULT 0;
+"""
+PLAYLIST_SET_REFRESHED: Final[
+    str
+] = """
+UPDATE playlists
+    SET
+        last_refreshed = :last_refreshed
+WHERE
+    (
+        scope_type = :scope_type
+        AND playlist_id = :playlist_id
+        AND scope_id = :scope_id
+    )
+;
+"""
+PLAYLIST_FETCH_STALE: Final[
+    str
+] = """
+SELECT
+    playlist_id,
+    playlist_name,
+    scope_id,
+    author_id,
+    playlist_url,
+    track_count,
+    duration
+FROM
+    playlists
+WHERE
+    (
+        scope_type = :scope_type
+        AND deleted = false
+        AND playlist_url IS NOT NULL
+        AND playlist_url NOT LIKE 'spotify:%'
+        AND playlist_url NOT LIKE '%open.spotify.com/%'
+        AND last_refreshed < :last_refreshed
+    )
+ORDER BY last_refreshed
+LIMIT :limit OFFSET :offset;
+"""
+# Playlist name index statements
+PLAYLIST_NAME_INDEX_EXISTS: Final[
+    str
+] = """
+SELECT
+    name
+FROM
+    sqlite_master
+WHERE
+    type = 'table'
+    AND name = 'playlist_names'
+;
+"""
+PLAYLIST_NAME_INDEX_CREATE_TABLE: Final[
+    str
+] = """
+CREATE VIRTUAL TABLE IF NOT EXISTS playlist_names USING fts5(
+    playlist_name,
+    content = 'playlists',
+    tokenize = 'trigram'
+);
+"""
+PLAYLIST_NAME_INDEX_CREATE_INSERT_TRIGGER: Final[
+    str
+] = """
+CREATE TRIGGER IF NOT EXISTS playlist_names_insert
+AFTER INSERT ON playlists
+BEGIN
+    INSERT INTO
+        playlist_names ( rowid, playlist_name )
+    VALUES
+        ( new.rowid, new.playlist_name );
+END;
+"""
+PLAYLIST_NAME_INDEX_CREATE_DELETE_TRIGGER: Final[
+    str
+] = """
+CREATE TRIGGER IF NOT EXISTS playlist_names_delete
+AFTER DELETE ON playlists
+BEGIN
+    INSERT INTO
+        playlist_names ( playlist_names, rowid, playlist_name )
+    VALUES
+        ( 'delete', old.rowid, old.playlist_name );
+END;
+"""
+PLAYLIST_NAME_INDEX_CREATE_UPDATE_TRIGGER: Final[
+    str
+] = """
+CREATE TRIGGER IF NOT EXISTS playlist_names_update
+AFTER UPDATE OF playlist_name ON playlists
+BEGIN
+    INSERT INTO
+        playlist_names ( playlist_names, rowid, playlist_name )
+    VALUES
+        ( 'delete', old.rowid, old.playlist_name );
+    INSERT INTO
+        playlist_names ( rowid, playlist_name )
+    VALUES
+        ( new.rowid, new.playlist_name );
+END;
+"""
+PLAYLIST_NAME_INDEX_DROP_INSERT_TRIGGER: Final[
+    str
+] = """
+DROP TRIGGER IF EXISTS playlist_names_insert;
+"""
+PLAYLIST_NAME_INDEX_DROP_DELETE_TRIGGER: Final[
+    str
+] = """
+DROP TRIGGER IF EXISTS playlist_names_delete;
+"""
+PLAYLIST_NAME_INDEX_DROP_UPDATE_TRIGGER: Final[
+    str
+] = """
+DROP TRIGGER IF EXISTS playlist_names_update;
+"""
+PLAYLIST_NAME_INDEX_REBUILD: Final[
+    str
+] = """
+INSERT INTO
+    playlist_names ( playlist_names )
+VALUES
+    ( 'rebuild' );
+"""
+
+# Playlist tracks table statements
+PLAYLIST_TRACKS_CREATE_TABLE: Final[
+    str
+] = """
+CREATE TABLE IF NOT EXISTS playlist_tracks (
+    scope_type INTEGER NOT NULL,
+    playlist_id INTEGER NOT NULL,
+    scope_id INTEGER NOT NULL,
+    ordinal INTEGER NOT NULL,
+    uri TEXT,
+    track BLOB NOT NULL,
+    PRIMARY KEY (scope_type, playlist_id, scope_id, ordinal)
+);
+"""
+PLAYLIST_TRACKS_CREATE_INDEX: Final[
+    str
+] = """
+CREATE INDEX IF NOT EXISTS playlist_tracks_uri_index ON playlist_tracks (
+scope_type, playlist_id, scope_id, uri
+);
+"""
+PLAYLIST_TRACKS_CREATE_TRIGGER: Final[
+    str
+] = """
+CREATE TRIGGER IF NOT EXISTS playlist_tracks_cleanup
+AFTER DELETE ON playlists
+BEGIN
+    DELETE
+    FROM
+        playlist_tracks
+    WHERE
+        (
+            scope_type = old.scope_type
+            AND playlist_id = old.playlist_id
+            AND scope_id = old.scope_id
+        );
+END;
+"""
+PLAYLIST_TRACKS_FETCH: Final[
+    str
+] = """
+SELECT
+    track
+FROM
+    playlist_tracks
+WHERE
+    (
+        scope_type = :scope_type
+        AND playlist_id = :playlist_id
+        AND scope_id = :scope_id
+    )
+ORDER BY ordinal ASC
+LIMIT :limit OFFSET :offset
+;
+"""
+PLAYLIST_TRACKS_FETCH_ALL: Final[
+    str
+] = """
+SELECT
+    scope_type,
+    playlist_id,
+    scope_id,
+    track
+FROM
+    playlist_tracks
+;
+"""
+PLAYLIST_TRACKS_FETCH_URI: Final[
+    str
+] = """
+SELECT
+    track
+FROM
+    playlist_tracks
+WHERE
+    (
+        scope_type = :scope_type
+        AND playlist_id = :playlist_id
+        AND scope_id = :scope_id
+        AND uri = :uri
+    )
+;
+"""
+PLAYLIST_TRACKS_NEXT_ORDINAL: Final[
+    str
+] = """
+SELECT
+    COALESCE(MAX(ordinal), -1) + 1
+FROM
+    playlist_tracks
+WHERE
+    (
+        scope_type = :scope_type
+        AND playlist_id = :playlist_id
+        AND scope_id = :scope_id
+    )
+;
+"""
+PLAYLIST_TRACKS_INSERT: Final[
+    str
+] = """
+INSERT INTO
+    playlist_tracks ( scope_type, playlist_id, scope_id, ordinal, uri, track )
+VALUES
+    (
+        :scope_type, :playlist_id, :scope_id, :ordinal, :uri, :track
+    )
+;
+"""
+PLAYLIST_TRACKS_DELETE_URI: Final[
+    str
+] = """
+DELETE
+FROM
+    playlist_tracks
+WHERE
+    (
+        scope_type = :scope_type
+        AND playlist_id = :playlist_id
+        AND scope_id = :scope_id
+        AND uri = :uri
+    )
+;
+"""
+PLAYLIST_TRACKS_DELETE_ALL: Final[
+    str
+] = """
+DELETE
+FROM
+    playlist_tracks
+WHERE
+    (
+        scope_type = :scope_type
+        AND playlist_id = :playlist_id
+        AND scope_id = :scope_id
+    )
+;
+"""
+PLAYLIST_TRACKS_COPY: Final[
+    str
+] = """
+INSERT INTO
+    playlist_tracks ( scope_type, playlist_id, scope_id, ordinal, uri, track )
+SELECT
+    :to_scope_type,
+    :to_playlist_id,
+    :to_scope_id,
+    ordinal,
+    uri,
+    track
+FROM
+    playlist_tracks
+WHERE
+    (
+        scope_type = :scope_type
+        AND playlist_id = :playlist_id
+        AND scope_id = :scope_id
+    )
+;
+"""
 
 # YouTube table statements
 YOUTUBE_DROP_TABLE: Final[
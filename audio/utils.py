@@ -1,13 +1,16 @@
 import asyncio
 import contextlib
 import logging
+import re
 import time
 
+from collections import Counter
 from enum import Enum, unique
 from pathlib import Path
-from typing import MutableMapping
+from typing import Iterable, MutableMapping, Optional, Pattern
 
 import discord
+import lavalink
 
 from redbot.core import commands
 from redbot.core.i18n import Translator
@@ -210,6 +213,163 @@ class Notifier:
             pass
 
 
+class QueueStats:
+    """Aggregated statistics for a player's queue.
+
+    The aggregates are updated in O(1) as tracks are added to and removed from the queue,
+    :class:`TrackQueue` does so on every change made to it.
+    """
+
+    __slots__ = (
+        "duration",
+        "streams",
+        "requester_count",
+    )
+
+    def __init__(self):
+        self.duration: int = 0
+        self.streams: int = 0
+        self.requester_count: Counter = Counter()
+
+    def __repr__(self):
+        return f"<QueueStats duration={self.duration} streams={self.streams}>"
+
+    @staticmethod
+    def _requester_id(track: lavalink.Track) -> Optional[int]:
+        return getattr(track.requester, "id", track.requester)
+
+    def _update(self, track: lavalink.Track, sign: int) -> None:
+        requester = self._requester_id(track)
+        self.requester_count[requester] += sign
+        if track.is_stream:
+            self.streams += sign
+        else:
+            self.duration += sign * track.length
+        if self.requester_count[requester] <= 0:
+            del self.requester_count[requester]
+
+    def add(self, *tracks: lavalink.Track) -> None:
+        """Account for tracks added to the queue."""
+        for track in tracks:
+            self._update(track, 1)
+
+    def remove(self, *tracks: lavalink.Track) -> None:
+        """Account for tracks removed from the queue."""
+        for track in tracks:
+            self._update(track, -1)
+
+    def clear(self) -> None:
+        """Reset the stats to an empty queue."""
+        self.duration = 0
+        self.streams = 0
+        self.requester_count.clear()
+
+
+class TrackQueue(list):
+    """A player's queue which keeps its :class:`QueueStats` up to date.
+
+    Every method adding or removing tracks updates the stats, whoever calls it,
+    ``Player.add`` and the track popped by ``Player.play`` included.
+    Slices and copies are plain lists.
+    """
+
+    __slots__ = ("stats",)
+
+    def __init__(self, tracks: Iterable[lavalink.Track] = ()):
+        super().__init__(tracks)
+        self.stats = QueueStats()
+        self.stats.add(*self)
+
+    def append(self, track: lavalink.Track) -> None:
+        super().append(track)
+        self.stats.add(track)
+
+    def extend(self, tracks: Iterable[lavalink.Track]) -> None:
+        tracks = list(tracks)
+        super().extend(tracks)
+        self.stats.add(*tracks)
+
+    def __iadd__(self, tracks: Iterable[lavalink.Track]) -> "TrackQueue":
+        self.extend(tracks)
+        return self
+
+    def __imul__(self, times: int) -> "TrackQueue":
+        if times <= 0:
+            self.clear()
+        else:
+            self.extend(list(self) * (times - 1))
+        return self
+
+    def insert(self, index: int, track: lavalink.Track) -> None:
+        super().insert(index, track)
+        self.stats.add(track)
+
+    def pop(self, index: int = -1) -> lavalink.Track:
+        track = super().pop(index)
+        self.stats.remove(track)
+        return track
+
+    def remove(self, track: lavalink.Track) -> None:
+        # The removed track may only compare equal to the given one.
+        self.pop(self.index(track))
+
+    def clear(self) -> None:
+        super().clear()
+        self.stats.clear()
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            value = list(value)
+            removed, added = self[index], value
+        else:
+            removed, added = [self[index]], [value]
+        super().__setitem__(index, value)
+        self.stats.remove(*removed)
+        self.stats.add(*added)
+
+    def __delitem__(self, index) -> None:
+        removed = self[index] if isinstance(index, slice) else [self[index]]
+        super().__delitem__(index)
+        self.stats.remove(*removed)
+
+
+class KeywordFilter:
+    """A scope's whitelist and blacklist keywords, each compiled into one pattern."""
+
+    __slots__ = ("whitelist", "blacklist")
+
+    def __init__(self, whitelist: Iterable[str], blacklist: Iterable[str]):
+        self.whitelist = self._compile(whitelist)
+        self.blacklist = self._compile(blacklist)
+
+    @staticmethod
+    def _compile(keywords: Iterable[str]) -> Optional[Pattern]:
+        keywords = {keyword.lower() for keyword in keywords if keyword}
+        if not keywords:
+            return None
+        return re.compile(
+            "|".join(
+                re.escape(keyword)
+                for keyword in sorted(keywords, key=len, reverse=True)
+            )
+        )
+
+    def allows(self, query: str) -> Optional[bool]:
+        """Check a query against the keywords.
+
+        Returns
+        -------
+        Optional[bool]
+            Whether the query is allowed, or ``None`` if there is no whitelist
+            and the query isn't blacklisted, leaving the decision to other scopes.
+        """
+        if self.whitelist is not None:
+            return self.whitelist.search(query) is not None
+        if self.blacklist is not None and self.blacklist.search(query) is not None:
+            return False
+        return None
+
+
 @unique
 class PlaylistScope(Enum):
     GLOBAL = "GLOBALPLAYLIST"
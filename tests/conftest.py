@@ -0,0 +1,119 @@
+import tempfile
+import types
+
+import pytest
+
+try:
+    from redbot.core import data_manager
+except ImportError:
+    data_manager = None
+else:
+    # The cog package reads its data path at import time, point it at a
+    # temporary directory like an instance's basic config would.
+    if data_manager.basic_config is None:
+        data_manager.basic_config = {
+            **data_manager.basic_config_default,
+            "DATA_PATH": tempfile.mkdtemp(prefix="audio-tests-"),
+        }
+
+
+@pytest.fixture
+def node_stats():
+    """Build a red-lavalink NodeStats from the values of a Lavalink stats event."""
+    lavalink_node = pytest.importorskip("lavalink.node")
+
+    def _node_stats(
+        playing=0, system_load=0.0, used=0, reservable=0, deficit=None, nulled=0
+    ):
+        payload = {
+            "uptime": 1000,
+            "players": playing,
+            "playingPlayers": playing,
+            "memory": {
+                "free": 0,
+                "used": used,
+                "allocated": used,
+                "reservable": reservable,
+            },
+            "cpu": {"cores": 4, "systemLoad": system_load, "lavalinkLoad": 0.0},
+        }
+        if deficit is not None:
+            payload["frameStats"] = {"sent": 3000, "nulled": nulled, "deficit": deficit}
+        return lavalink_node.NodeStats(payload)
+
+    return _node_stats
+
+
+class FakePlayer:
+    """Stands in for a lavalink.Player, recording what is done to it."""
+
+    def __init__(self, node, guild_id, current=None, queue=None):
+        self.node = node
+        self.channel = types.SimpleNamespace(guild=types.SimpleNamespace(id=guild_id))
+        self.current = current
+        self.queue = list(queue or [])
+        self.position = 0
+        self.paused = False
+        self.volume = 100
+        self.repeat = False
+        self.shuffle = False
+        self.shuffle_bumped = True
+        self._metadata = {}
+        self.connected = True
+        self.calls = []
+
+    def store(self, key, value):
+        self._metadata[key] = value
+
+    async def disconnect(self):
+        self.connected = False
+        self.node.players.remove(self)
+
+    async def set_volume(self, volume):
+        self.volume = volume
+
+    async def play(self):
+        self.current = self.queue.pop(0)
+        self.calls.append("play")
+
+    async def seek(self, position):
+        self.position = position
+        self.calls.append("seek")
+
+    async def pause(self):
+        self.paused = True
+        self.calls.append("pause")
+
+
+class FakeNode:
+    """Stands in for a lavalink.node.Node, players are created in memory."""
+
+    def __init__(self, host, stats=None, ready=True, fail_create=False):
+        self.host = host
+        self.stats = stats
+        self.ready = ready
+        self.players = []
+        self.fail_create = fail_create
+        self.player_manager = types.SimpleNamespace(create_player=self._create_player)
+
+    async def _create_player(self, channel):
+        if self.fail_create:
+            raise ConnectionError(f"{self.host} is down")
+        player = FakePlayer(self, channel.guild.id)
+        self.players.append(player)
+        return player
+
+
+@pytest.fixture
+def fake_node():
+    return FakeNode
+
+
+@pytest.fixture
+def fake_player():
+    def _fake_player(node, guild_id, current=None, queue=None):
+        player = FakePlayer(node, guild_id, current=current, queue=queue)
+        node.players.append(player)
+        return player
+
+    return _fake_player
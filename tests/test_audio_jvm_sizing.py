@@ -0,0 +1,26 @@
+import pytest
+
+pytest.importorskip("lavalink")
+pytest.importorskip("redbot")
+
+from audio.jvm_sizing import profile_for, suggest_heap_mb  # noqa: E402
+
+
+def test_full_heap_suggests_a_larger_one(node_stats):
+    stats = node_stats(used=95, reservable=100)
+    assert suggest_heap_mb(profile_for(512), stats) == 1024
+
+
+def test_frame_deficit_with_a_busy_heap_suggests_a_larger_one(node_stats):
+    stats = node_stats(used=60, reservable=100, deficit=300)
+    assert suggest_heap_mb(profile_for(512), stats) == 1024
+
+
+def test_mostly_empty_heap_suggests_a_smaller_one(node_stats):
+    stats = node_stats(used=10, reservable=100)
+    assert suggest_heap_mb(profile_for(1024), stats) == 512
+
+
+def test_fitting_heap_suggests_nothing(node_stats):
+    stats = node_stats(used=60, reservable=100)
+    assert suggest_heap_mb(profile_for(512), stats) is None
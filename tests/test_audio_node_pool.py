@@ -0,0 +1,131 @@
+import asyncio
+import types
+
+import pytest
+
+pytest.importorskip("lavalink")
+pytest.importorskip("redbot")
+
+from audio import node_pool  # noqa: E402
+from audio.node_pool import NodePool, least_loaded, node_penalty  # noqa: E402
+
+
+def _track(is_stream=False):
+    return types.SimpleNamespace(is_stream=is_stream)
+
+
+def _pool(main_node, *extra_nodes):
+    pool = NodePool(bot=None, config=None, cog=None)
+    pool.main_node = main_node
+    for index, node in enumerate(extra_nodes):
+        pool._nodes[f"extra{index}"] = node
+    return pool
+
+
+def test_idle_node_penalty_is_its_player_count(fake_node, node_stats):
+    assert node_penalty(fake_node("a", node_stats(playing=2))) == pytest.approx(2.0)
+
+
+def test_cpu_load_and_frame_deficit_raise_the_penalty(fake_node, node_stats):
+    busy = fake_node("a", node_stats(playing=2, system_load=0.9, deficit=2000))
+    assert node_penalty(busy) > 100
+
+
+def test_least_loaded_skips_busy_unready_and_excluded_nodes(fake_node, node_stats):
+    idle = fake_node("idle", node_stats(playing=5))
+    busy = fake_node("busy", node_stats(playing=1, system_load=0.9, deficit=2000))
+    unready = fake_node("unready", node_stats(), ready=False)
+    excluded = fake_node("excluded", node_stats())
+    nodes = [busy, unready, excluded, idle]
+    assert least_loaded(nodes, exclude=[excluded]) is idle
+    assert least_loaded([unready]) is None
+
+
+def test_connect_creates_the_player_on_the_least_loaded_node(fake_node, node_stats):
+    busy = fake_node("busy", node_stats(playing=1, system_load=0.9, deficit=2000))
+    idle = fake_node("idle", node_stats(playing=3))
+    pool = _pool(busy, idle)
+    channel = types.SimpleNamespace(guild=types.SimpleNamespace(id=1))
+    player = asyncio.run(pool.connect(channel))
+    assert player.node is idle
+    assert not busy.players
+
+
+def test_connect_uses_lavalink_with_a_single_node(monkeypatch, fake_node, node_stats):
+    pool = _pool(fake_node("main", node_stats()))
+    connected = []
+
+    async def connect(channel):
+        connected.append(channel)
+
+    monkeypatch.setattr(node_pool.lavalink, "connect", connect)
+    channel = types.SimpleNamespace(guild=types.SimpleNamespace(id=1))
+    asyncio.run(pool.connect(channel))
+    assert connected == [channel]
+
+
+def test_migrate_resumes_the_current_track(fake_node, fake_player, node_stats):
+    source = fake_node("source", node_stats())
+    target = fake_node("target", node_stats())
+    current, queued = _track(), _track()
+    player = fake_player(source, 1, current=current, queue=[queued])
+    player.position = 30000
+    player.paused = True
+    player.volume = 50
+    player.repeat = True
+    player.store("channel", 123)
+
+    assert asyncio.run(_pool(source, target).migrate(player, target))
+    assert not player.connected
+    (moved,) = target.players
+    assert moved.current is current
+    assert moved.queue == [queued]
+    assert moved.calls == ["play", "seek", "pause"]
+    assert moved.position == 30000
+    assert (moved.volume, moved.repeat) == (50, True)
+    assert moved._metadata == {"channel": 123}
+
+
+def test_migrate_reports_a_failed_move(fake_node, fake_player, node_stats):
+    source = fake_node("source", node_stats())
+    target = fake_node("target", node_stats(), fail_create=True)
+    player = fake_player(source, 1, current=_track())
+    assert not asyncio.run(_pool(source, target).migrate(player, target))
+
+
+def test_drain_moves_every_player_off_the_node(fake_node, fake_player, node_stats):
+    source = fake_node("source", node_stats())
+    target = fake_node("target", node_stats())
+    for guild_id in range(3):
+        fake_player(source, guild_id, current=_track(is_stream=True))
+    assert asyncio.run(_pool(source, target).drain(source)) == 0
+    assert not source.players
+    assert len(target.players) == 3
+
+
+def test_drain_counts_the_players_left_without_a_node(
+    fake_node, fake_player, node_stats
+):
+    source = fake_node("source", node_stats())
+    unready = fake_node("unready", node_stats(), ready=False)
+    fake_player(source, 1, current=_track())
+    assert asyncio.run(_pool(source, unready).drain(source)) == 1
+
+
+def test_health_check_moves_players_after_repeated_failures(
+    fake_node, fake_player, node_stats
+):
+    failing = fake_node("failing", node_stats(), ready=False)
+    healthy = fake_node("healthy", node_stats())
+    fake_player(failing, 1, current=_track())
+    pool = _pool(healthy, failing)
+
+    async def check(times):
+        for __ in range(times):
+            await pool.health_check()
+
+    asyncio.run(check(node_pool._MAX_FAILED_CHECKS - 1))
+    assert len(failing.players) == 1
+    asyncio.run(check(1))
+    assert not failing.players
+    assert len(healthy.players) == 1
@@ -0,0 +1,76 @@
+import tracemalloc
+
+import pytest
+
+lavalink = pytest.importorskip("lavalink")
+pytest.importorskip("redbot")
+
+from audio.audio_dataclasses import QueueEntry  # noqa: E402
+
+_QUEUE_SIZE = 10000
+
+
+def _track_data(index):
+    return {
+        "track": f"QAAAjQIAJVJpY2sgQXN0bGV5IC0gTmV2ZXIgR29ubmEgR2l2ZSBZb3UgVXA{index}",
+        "info": {
+            "identifier": f"dQw4w9WgX{index}",
+            "isSeekable": True,
+            "author": "RickAstleyVEVO",
+            "length": 212000,
+            "isStream": False,
+            "position": 0,
+            "title": f"Rick Astley - Never Gonna Give You Up {index}",
+            "uri": f"https://www.youtube.com/watch?v=dQw4w9WgX{index}",
+        },
+        "extras": {"enqueue_time": 1600000000 + index, "vc": 1, "requester": 2},
+    }
+
+
+def _allocated(build):
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        built = build()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del built
+    return size
+
+
+def test_queue_entries_use_a_fraction_of_the_memory_of_tracks():
+    tracks = [lavalink.Track(_track_data(i)) for i in range(_QUEUE_SIZE)]
+    entries_size = _allocated(lambda: [QueueEntry.from_track(t) for t in tracks])
+    tracks_size = _allocated(
+        lambda: [lavalink.Track(_track_data(i)) for i in range(_QUEUE_SIZE)]
+    )
+    # About 1.9 MB against 13 MB for 10k tracks when measured.
+    assert entries_size * 4 < tracks_size
+
+
+def test_entry_round_trips_to_an_equal_track():
+    track = lavalink.Track(_track_data(1))
+    entry = QueueEntry.from_track(track)
+    assert entry == track and track == entry
+    assert hash(entry) == hash(QueueEntry.from_track(track))
+    assert entry.to_track()._info == track._info
+    assert entry != QueueEntry.from_track(lavalink.Track(_track_data(2)))
+
+
+def test_entry_queued_copies_can_be_removed_by_track():
+    track = lavalink.Track(_track_data(1))
+    queue = [QueueEntry.from_track(track), QueueEntry.from_track(track)]
+    while track in queue:
+        queue.remove(track)
+    assert not queue
+
+
+def test_entry_info_is_read_only():
+    entry = QueueEntry.from_track(lavalink.Track(_track_data(1)))
+    with pytest.raises(TypeError):
+        entry._info["title"] = "edited"
+    track = entry.to_track()
+    track._info["title"] = "edited"
+    assert entry.title != "edited"